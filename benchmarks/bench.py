@@ -0,0 +1,453 @@
+"""Benchmarks for the hot entry points of the rhinoscript package.
+
+Runs under CPython 2.7 against the pure Python RhinoCommon stand-in in
+standin/, so no Rhino session is needed. Every benchmark runs on synthetic
+documents of the requested sizes and the best time of several repeats is
+reported. Results can be stored as a baseline and later runs are compared
+against it; a benchmark is reported as a regression when it is slower than
+the baseline by more than the tolerance.
+
+    python bench.py                             # 1k, 100k and 1M objects
+    python bench.py --sizes 1000,100000         # smaller run
+    python bench.py --only coerce               # benchmarks whose name contains "coerce"
+    python bench.py --save baseline.json        # store results as the baseline
+    python bench.py --baseline baseline.json    # compare against a stored baseline
+    python bench.py --json results.json         # also write the results as json
+
+Timings on the stand-in show the overhead of rhinoscript itself (argument
+coercion, enumeration, list building). They do not include the cost of the
+native RhinoCommon calls made inside Rhino.
+"""
+import gc
+import json
+import optparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+import standin
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    "Registers function(doc, size) as a benchmark. It returns the callable to time"
+    def register(function):
+        BENCHMARKS.append((name, function))
+        return function
+    return register
+
+
+def populate(doc, size, seed=1):
+    """Fills doc with size objects: points, curves, surfaces, polysurfaces,
+    extrusions and meshes spread over a few layers"""
+    import Rhino
+    rg = Rhino.Geometry
+    rnd = random.Random(seed)
+    for name in ("Walls", "Slabs", "Survey", "Annotation"):
+        doc.Layers.Add(name)
+    attributes = Rhino.DocObjects.ObjectAttributes()
+    for i in xrange(size):
+        attributes.LayerIndex = i % doc.Layers.Count
+        attributes.Name = "object%d" % (i % 100)
+        x, y, z = rnd.uniform(0, 1000), rnd.uniform(0, 1000), rnd.uniform(0, 100)
+        kind = i % 20
+        if kind<8:
+            geometry = rg.Point(rg.Point3d(x, y, z))
+        elif kind<14:
+            geometry = rg.LineCurve(rg.Point3d(x, y, z), rg.Point3d(x + rnd.uniform(1, 10), y + rnd.uniform(1, 10), z))
+        elif kind<16:
+            geometry = rg.Brep(1, rg.BoundingBox(x, y, z, x + 5, y + 5, z))
+        elif kind<18:
+            geometry = rg.Brep(6, rg.BoundingBox(x, y, z, x + 5, y + 5, z + 5))
+        elif kind<19:
+            geometry = rg.Extrusion(1, i % 2==0, rg.BoundingBox(x, y, z, x + 5, y + 5, z + 3))
+        else:
+            geometry = rg.Mesh()
+            for j in range(4): geometry.Vertices.Add(x + j, y, z)
+            geometry.Faces.AddFace(0, 1, 2, 3)
+        doc.Objects.Add(geometry, attributes)
+    return doc
+
+
+def _ids(doc, object_type=None):
+    return [rhobj.Id for rhobj in doc.Objects.GetObjectList(doc_settings(object_type))]
+
+
+def doc_settings(object_type=None):
+    import Rhino
+    settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+    settings.HiddenObjects = True
+    if object_type is not None: settings.ObjectTypeFilter = object_type
+    return settings
+
+
+@benchmark("coerce3dpoint (tuples)")
+def bench_coerce3dpoint(doc, size):
+    import rhinoscript.utility as rhutil
+    points = [(i, i + 1.0, i + 2.0) for i in xrange(size)]
+    coerce = rhutil.coerce3dpoint
+    return lambda: [coerce(point, True) for point in points]
+
+
+@benchmark("coerceguid (Guids and strings)")
+def bench_coerceguid(doc, size):
+    import rhinoscript.utility as rhutil
+    ids = _ids(doc)
+    ids = [id if i % 2 else str(id) for i, id in enumerate(ids)]
+    coerce = rhutil.coerceguid
+    return lambda: [coerce(id, True) for id in ids]
+
+
+@benchmark("coercecurve (ids)")
+def bench_coercecurve(doc, size):
+    import Rhino
+    import rhinoscript.utility as rhutil
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)
+    coerce = rhutil.coercecurve
+    return lambda: [coerce(id, -1, True) for id in ids]
+
+
+@benchmark("AllObjects")
+def bench_allobjects(doc, size):
+    import rhinoscript.selection as selection
+    return lambda: selection.AllObjects()
+
+
+@benchmark("IterObjects (chunks of 1000)")
+def bench_iterobjects(doc, size):
+    import rhinoscript.selection as selection
+    def iterate():
+        for chunk in selection.IterObjects(chunk_size=1000): pass
+    return iterate
+
+
+@benchmark("ObjectsByType (curves)")
+def bench_objectsbytype_curve(doc, size):
+    import rhinoscript.selection as selection
+    return lambda: selection.ObjectsByType(4)
+
+
+@benchmark("ObjectsByType (surfaces)")
+def bench_objectsbytype_surface(doc, size):
+    import rhinoscript.selection as selection
+    return lambda: selection.ObjectsByType(8)
+
+
+@benchmark("ObjectsByLayer")
+def bench_objectsbylayer(doc, size):
+    import rhinoscript.selection as selection
+    return lambda: selection.ObjectsByLayer("Survey")
+
+
+@benchmark("ObjectsByName")
+def bench_objectsbyname(doc, size):
+    import rhinoscript.selection as selection
+    return lambda: selection.ObjectsByName("object7")
+
+
+@benchmark("ObjectsByLayer (indexed)")
+def bench_objectsbylayer_indexed(doc, size):
+    import rhinoscript.selection as selection
+    selection.EnableObjectIndex(True)
+    selection.ObjectsByLayer("Survey")
+    return lambda: [selection.ObjectsByLayer("Survey") for i in range(10)]
+
+
+@benchmark("ObjectsByName (indexed)")
+def bench_objectsbyname_indexed(doc, size):
+    import rhinoscript.selection as selection
+    selection.EnableObjectIndex(True)
+    selection.ObjectsByName("object7")
+    return lambda: [selection.ObjectsByName("object7") for i in range(10)]
+
+
+@benchmark("EnableSpatialIndex (build and query)")
+def bench_spatialindex(doc, size):
+    import rhinoscript.selection as selection
+    def build():
+        selection.EnableSpatialIndex(False)
+        selection.EnableSpatialIndex(True)
+        selection.ObjectsIntersectingBox(((100, 100, 0), (120, 120, 100)))
+    return build
+
+
+@benchmark("MeshVertices")
+def bench_meshvertices(doc, size):
+    import Rhino
+    import rhinoscript.mesh as mesh
+    geometry = Rhino.Geometry.Mesh()
+    for i in xrange(size): geometry.Vertices.Add(i, 0, 0)
+    mesh_id = doc.Objects.AddMesh(geometry)
+    return lambda: mesh.MeshVertices(mesh_id)
+
+
+@benchmark("PointClosestObject (indexed)")
+def bench_pointclosestobject_indexed(doc, size):
+    import Rhino
+    import rhinoscript.pointvector as pointvector
+    index = pointvector.ClosestObjectIndex(_ids(doc, Rhino.DocObjects.ObjectType.Curve)[:1000])
+    rnd = random.Random(2)
+    points = [(rnd.uniform(0, 1000), rnd.uniform(0, 1000), rnd.uniform(0, 100)) for i in xrange(size//100)]
+    return lambda: [pointvector.PointClosestObject(point, index) for point in points]
+
+
+@benchmark("PlanarCurveRelationships")
+def bench_planarcurverelationships(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    rnd = random.Random(6)
+    ids = []
+    for i in xrange(size//10):
+        x, y, w = rnd.uniform(0, 1000), rnd.uniform(0, 1000), rnd.uniform(1, 10)
+        points = [rg.Point3d(x, y, 0), rg.Point3d(x+w, y, 0), rg.Point3d(x+w, y+w, 0), rg.Point3d(x, y+w, 0)]
+        ids.append(doc.Objects.AddCurve(rg.PolylineCurve(points + points[:1])))
+    return lambda: curve.PlanarCurveRelationships(ids, rg.Plane.WorldXY)
+
+
+@benchmark("PointsInPlanarClosedCurves")
+def bench_pointsinplanarclosedcurves(doc, size):
+    import math
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    ids = []
+    for i in range(100):
+        cx, cy = 50 + 100*(i % 10), 50 + 100*(i//10)
+        points = [rg.Point3d(cx + 45*math.cos(j*math.pi/10), cy + 45*math.sin(j*math.pi/10), 0) for j in range(20)]
+        ids.append(doc.Objects.AddCurve(rg.PolylineCurve(points + points[:1])))
+    rnd = random.Random(3)
+    points = [(rnd.uniform(0, 1000), rnd.uniform(0, 1000), 0) for i in xrange(size//10)]
+    return lambda: curve.PointsInPlanarClosedCurves(points, ids, rg.Plane.WorldXY)
+
+
+@benchmark("PointArrayTransform")
+def bench_pointarraytransform(doc, size):
+    import Rhino
+    import rhinoscript.pointvector as pointvector
+    points = [Rhino.Geometry.Point3d(i, i, i) for i in xrange(size)]
+    xform = Rhino.Geometry.Transform.Translation(1, 2, 3)
+    return lambda: pointvector.PointArrayTransform(points, xform)
+
+
+@benchmark("DivideCurve")
+def bench_dividecurve(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    curve_id = doc.Objects.AddCurve(rg.ArcCurve(rg.Plane.WorldXY, 10.0))
+    return lambda: curve.DivideCurve(curve_id, size)
+
+
+@benchmark("CurveLength (cached)")
+def bench_curvelength_cached(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    import rhinoscript.utility as rhutil
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)
+    rhutil.EnableMeasurementCache(True)
+    for id in ids: curve.CurveLength(id)
+    return lambda: [curve.CurveLength(id) for id in ids]
+
+
+@benchmark("CurveNetworkIntersections")
+def bench_curvenetworkintersections(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)
+    return lambda: curve.CurveNetworkIntersections(ids)
+
+
+@benchmark("CurveCurvatureSamples")
+def bench_curvecurvaturesamples(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)[:max(1, size//1000)]
+    return lambda: curve.CurveCurvatureSamples(ids, 100)
+
+
+@benchmark("CurveDeviationProfiles")
+def bench_curvedeviationprofiles(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)
+    pairs = zip(ids, ids[1:])[:max(1, size//1000)]
+    return lambda: curve.CurveDeviationProfiles(pairs, 100)
+
+
+@benchmark("CurveFrames (rmf)")
+def bench_curveframes(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    curve_id = doc.Objects.AddCurve(rg.ArcCurve(rg.Plane.WorldXY, 10.0))
+    return lambda: curve.CurveFrames(curve_id, max(2, size//10), "rmf")
+
+
+@benchmark("DivideCurves (all curves)")
+def bench_dividecurves(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    ids = _ids(doc, Rhino.DocObjects.ObjectType.Curve)
+    return lambda: curve.DivideCurves(ids, 10)
+
+
+@benchmark("JoinCurves (chains of 10 segments)")
+def bench_joincurves(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    ids = []
+    for i in xrange(size//10):
+        chain, segment = divmod(i, 10)
+        x, y = chain % 1000, 2000 + chain//1000
+        ids.append(doc.Objects.AddCurve(rg.LineCurve(rg.Point3d(x, y, segment), rg.Point3d(x, y, segment + 1))))
+    random.Random(4).shuffle(ids)
+    return lambda: curve.JoinCurves(ids)
+
+
+@benchmark("EvaluateCurveMany (tangents)")
+def bench_evaluatecurvemany(doc, size):
+    import Rhino
+    import rhinoscript.curve as curve
+    rg = Rhino.Geometry
+    arc = rg.ArcCurve(rg.Plane.WorldXY, 10.0)
+    parameters = [arc.Domain.ParameterAt(i/float(size)) for i in xrange(size)]
+    curve_id = doc.Objects.AddCurve(arc)
+    return lambda: curve.EvaluateCurveMany(curve_id, parameters, 1)
+
+
+@benchmark("TransformObjectsEx")
+def bench_transformobjectsex(doc, size):
+    import Rhino
+    import rhinoscript.object as rhobject
+    ids = _ids(doc)
+    xforms = [Rhino.Geometry.Transform.Translation(i % 7, 0, 0) for i in range(len(ids))]
+    return lambda: rhobject.TransformObjectsEx(ids, xforms)
+
+
+@benchmark("ObjectColor (list)")
+def bench_objectcolor(doc, size):
+    import rhinoscript.object as rhobject
+    ids = _ids(doc)
+    return lambda: rhobject.ObjectColor(ids, (255, 0, 0))
+
+
+@benchmark("attributebatch (color, layer, name)")
+def bench_attributebatch(doc, size):
+    import rhinoscript.object as rhobject
+    ids = _ids(doc)
+    def apply():
+        with rhobject.attributebatch():
+            rhobject.ObjectColor(ids, (0, 255, 0))
+            rhobject.ObjectLayer(ids, "Walls")
+            rhobject.ObjectName(ids, "batched")
+    return apply
+
+
+def reset():
+    "turns off the opt-in caches and indexes a benchmark may have enabled"
+    import rhinoscript.utility as rhutil
+    import rhinoscript.selection as selection
+    rhutil.EnableObjectCache(False)
+    rhutil.EnableMeasurementCache(False)
+    selection.EnableObjectIndex(False)
+    selection.EnableSpatialIndex(False)
+
+
+def _all_ids(doc):
+    import Rhino
+    settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+    settings.HiddenObjects = True
+    settings.LockedObjects = True
+    return [rhobj.Id for rhobj in doc.Objects.GetObjectList(settings)]
+
+
+def run_benchmark(function, doc, size, repeat):
+    "times function on doc and removes the objects it added, so later benchmarks see the same document"
+    before = set(_all_ids(doc))
+    target = function(doc, size)
+    best = None
+    try:
+        for i in range(repeat):
+            gc.collect()
+            start = time.time()
+            target()
+            elapsed = time.time() - start
+            if best is None or elapsed<best: best = elapsed
+    finally:
+        reset()
+        added = [id for id in _all_ids(doc) if id not in before]
+        for id in reversed(added): doc.Objects.Delete(id, True)
+    return best
+
+
+def run_startup(repeat):
+    "cold start of a command script built from rhcommand.template"
+    code = ("import sys, time; sys.path.insert(0, %r); import standin; standin.install(); "
+            "start = time.time(); import rhinoscript.userinterface, rhinoscript.geometry; "
+            "sys.stdout.write(repr(time.time() - start))") % os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for i in range(repeat):
+        output = subprocess.check_output([sys.executable, "-B", "-c", code])
+        times.append(float(output))
+    return min(times)
+
+
+def compare(results, baseline, tolerance):
+    "returns a list of (key, baseline time, new time) for regressions"
+    rc = []
+    for key, seconds in sorted(results.items()):
+        old = baseline.get(key)
+        if old and seconds>old*(1.0 + tolerance): rc.append((key, old, seconds))
+    return rc
+
+
+def main(argv):
+    parser = optparse.OptionParser(usage="%prog [options]")
+    parser.add_option("--sizes", default="1000,100000,1000000", help="comma separated document sizes")
+    parser.add_option("--repeat", type="int", default=3, help="timing repeats per benchmark")
+    parser.add_option("--only", default=None, help="run benchmarks whose name contains this text")
+    parser.add_option("--baseline", default=None, help="json file with baseline results to compare against")
+    parser.add_option("--tolerance", type="float", default=0.25, help="allowed slowdown before reporting a regression")
+    parser.add_option("--save", default=None, help="write the results to this json file as a new baseline")
+    parser.add_option("--json", default=None, help="write the results to this json file")
+    options, args = parser.parse_args(argv)
+    sizes = [int(size) for size in options.sizes.split(",")]
+
+    standin.install()
+    results = {}
+    print "%-34s %10s %12s" % ("benchmark", "size", "seconds")
+    if not options.only or options.only in "startup":
+        seconds = run_startup(options.repeat)
+        results["startup"] = seconds
+        print "%-34s %10s %12.6f" % ("startup", "-", seconds)
+    selected = [(name, function) for name, function in BENCHMARKS if not options.only or options.only in name]
+    for size in sizes:
+        if not selected: break
+        # one document per size; objects added by a benchmark are deleted after it ran
+        doc = populate(standin.new_document(), size)
+        for name, function in selected:
+            seconds = run_benchmark(function, doc, size, options.repeat)
+            results["%s@%d" % (name, size)] = seconds
+            print "%-34s %10d %12.6f" % (name, size, seconds)
+            sys.stdout.flush()
+
+    for filename in (options.json, options.save):
+        if filename:
+            with open(filename, "w") as f: json.dump(results, f, indent=1, sort_keys=True)
+    if options.baseline:
+        with open(options.baseline) as f: baseline = json.load(f)
+        regressions = compare(results, baseline, options.tolerance)
+        for key, old, new in regressions:
+            print "REGRESSION %s: %.6f -> %.6f (%+.0f%%)" % (key, old, new, (new/old - 1.0)*100)
+        if regressions: return 1
+        print "no regressions against %s" % options.baseline
+    return 0
+
+
+if __name__=="__main__":
+    sys.exit(main(sys.argv[1:]))
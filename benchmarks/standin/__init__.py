@@ -0,0 +1,59 @@
+"""Pure Python stand-in for the subset of RhinoCommon (Rhino), the .NET
+System namespace and the RhinoPython host that the rhinoscript package uses.
+
+The stand-in lets the rhinoscript package run under CPython 2.7 without a
+Rhino session so that its overhead can be measured. It is not a geometry
+kernel: only the members reached by the benchmark entry points behave like
+their RhinoCommon counterparts.
+
+Usage:
+    import standin
+    doc = standin.install()       # must run before rhinoscript is imported
+    import rhinoscript.utility
+"""
+import math
+import os
+import sys
+
+import _namespace
+import document
+import geometry
+import system
+
+_installed = None
+
+
+def install(scripts_path=None):
+    """Registers the stand-in namespaces with the import system, puts the
+    rhinoscript package on sys.path and makes a new active document
+    Returns:
+      the new active document
+    """
+    global _installed
+    if _installed is None:
+        system_ns = system.create()
+        rhino_geometry, rhino_collections = geometry.create()
+        rhino_docobjects = document.create()
+        rhino_math = _namespace.Namespace("Rhino.RhinoMath", ZeroTolerance=geometry.ZERO_TOLERANCE,
+                                          SqrtEpsilon=1.490116119385e-08,
+                                          UnsetValue=geometry.UNSET, ToRadians=math.radians,
+                                          ToDegrees=math.degrees)
+        rhino = _namespace.Namespace("Rhino", Geometry=rhino_geometry, Collections=rhino_collections,
+                                     DocObjects=rhino_docobjects, RhinoDoc=document.RhinoDoc,
+                                     RhinoMath=rhino_math)
+        host = _namespace.Namespace("RhinoPython.Host", EscapePressed=lambda reset: False)
+        rhinopython = _namespace.Namespace("RhinoPython", Host=host)
+        _installed = _namespace.Importer({"Rhino": rhino, "System": system_ns, "RhinoPython": rhinopython})
+        sys.meta_path.insert(0, _installed)
+        if scripts_path is None:
+            scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
+        sys.path.insert(0, os.path.abspath(scripts_path))
+    return new_document()
+
+
+def new_document():
+    "Closes the active document, if any, and makes a new empty one active"
+    import scriptcontext
+    if scriptcontext.doc is not None: scriptcontext.doc.close()
+    scriptcontext.doc = document.RhinoDoc()
+    return scriptcontext.doc
@@ -0,0 +1,60 @@
+"""Module objects and the import hook that expose the stand-in classes under
+the CLR namespaces (Rhino, System, RhinoPython) used by rhinoscript.
+
+Names the stand-in does not implement resolve to inert placeholder classes so
+that every rhinoscript module can be imported. Placeholders only exist to get
+through module import; benchmarks must stay on implemented code paths.
+"""
+import sys
+import types
+
+
+class _PlaceholderType(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"): raise AttributeError(name)
+        value = placeholder("%s.%s" % (cls.__qualname, name))
+        setattr(cls, name, value)
+        return value
+
+
+class _Placeholder(object):
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def placeholder(qualname):
+    cls = _PlaceholderType(qualname.rsplit(".", 1)[-1], (_Placeholder,), {"__path__": []})
+    cls._PlaceholderType__qualname = qualname
+    return cls
+
+
+class Namespace(types.ModuleType):
+    """A CLR namespace. Missing attributes become placeholders"""
+    def __init__(self, name, **members):
+        types.ModuleType.__init__(self, name)
+        self.__path__ = []
+        self.__dict__.update(members)
+
+    def __getattr__(self, name):
+        if name.startswith("__"): raise AttributeError(name)
+        value = placeholder("%s.%s" % (self.__name__, name))
+        setattr(self, name, value)
+        return value
+
+
+class Importer(object):
+    """sys.meta_path hook serving the stand-in namespaces"""
+    def __init__(self, roots):
+        self.roots = roots
+
+    def find_module(self, fullname, path=None):
+        if fullname.split(".")[0] in self.roots: return self
+
+    def load_module(self, fullname):
+        if fullname in sys.modules: return sys.modules[fullname]
+        names = fullname.split(".")
+        rc = self.roots[names[0]]
+        for name in names[1:]:
+            rc = getattr(rc, name)
+        sys.modules[fullname] = rc
+        return rc
@@ -0,0 +1,513 @@
+"""Stand-in for Rhino.DocObjects and an in-memory Rhino.RhinoDoc"""
+import itertools
+
+import geometry as rg
+from system import Guid, Color
+from _namespace import Namespace
+
+
+class ObjectType(object):
+    Point = 1
+    PointSet = 2
+    Curve = 4
+    Surface = 8
+    Brep = 16
+    Mesh = 32
+    Light = 256
+    Annotation = 512
+    InstanceReference = 4096
+    TextDot = 8192
+    Grip = 16384
+    Detail = 32768
+    Hatch = 65536
+    MorphControl = 131072
+    PolysrfFilter = 2097152
+    Cage = 134217728
+    Phantom = 268435456
+    ClipPlane = 536870912
+    Extrusion = 1073741824
+    AnyObject = 4294967295
+setattr(ObjectType, "None", 0)
+
+
+class ObjectColorSource(object):
+    ColorFromLayer = 0
+    ColorFromObject = 1
+    ColorFromMaterial = 2
+    ColorFromParent = 3
+
+
+class ObjectAttributes(object):
+    def __init__(self):
+        self.LayerIndex = 0
+        self.Name = None
+        self.ObjectColor = Color.Black
+        self.ColorSource = ObjectColorSource.ColorFromLayer
+        self.Visible = True
+        self.Mode = 0
+        self._groups = []
+
+    def Duplicate(self):
+        rc = ObjectAttributes()
+        rc.__dict__.update(self.__dict__)
+        rc._groups = list(self._groups)
+        return rc
+
+    def DrawColor(self, doc):
+        if self.ColorSource==ObjectColorSource.ColorFromObject: return self.ObjectColor
+        return doc.Layers[self.LayerIndex].Color
+
+    def AddToGroup(self, index):
+        if index not in self._groups: self._groups.append(index)
+
+    def GetGroupList(self):
+        return list(self._groups)
+
+    GroupCount = property(lambda self: len(self._groups))
+
+
+class ObjectEnumeratorSettings(object):
+    def __init__(self):
+        self.NormalObjects = True
+        self.LockedObjects = True
+        self.HiddenObjects = False
+        self.DeletedObjects = False
+        self.ActiveObjects = True
+        self.ReferenceObjects = True
+        self.IncludeLights = False
+        self.IncludeGrips = False
+        self.IncludePhantoms = False
+        self.SelectedObjectsFilter = False
+        self.NameFilter = None
+        self.LayerIndexFilter = -1
+        self.ObjectTypeFilter = ObjectType.AnyObject
+
+
+class RhinoObject(object):
+    ObjectType = 0
+    NextRuntimeSerialNumber = 1
+    __serial = itertools.count(1)
+
+    def __init__(self, doc, id, geometry, attributes):
+        self.Document = doc
+        self.Id = id
+        self.Geometry = geometry
+        self.Attributes = attributes
+        self.RuntimeSerialNumber = next(RhinoObject.__serial)
+        RhinoObject.NextRuntimeSerialNumber = self.RuntimeSerialNumber + 1
+        self.IsDeleted = False
+        self._selected = False
+
+    Name = property(lambda self: self.Attributes.Name)
+    IsHidden = property(lambda self: self.Attributes.Mode==1)
+    IsLocked = property(lambda self: self.Attributes.Mode==2)
+    IsNormal = property(lambda self: self.Attributes.Mode==0)
+    IsReference = False
+    IsValid = True
+    GroupCount = property(lambda self: self.Attributes.GroupCount)
+
+    def GetGroupList(self):
+        return self.Attributes.GetGroupList()
+
+    def Select(self, on=True, *args):
+        if on and not self.IsNormal: return 0
+        self._selected = bool(on)
+        return 1
+
+    def IsSelected(self, check_subobjects=False):
+        return 2 if self._selected else 0
+
+    def IsSelectable(self, *args):
+        return self.IsNormal
+
+    def CommitChanges(self):
+        return self.Document.Objects.ModifyAttributes(self, self.Attributes, True)
+
+    def ShortDescription(self, plural):
+        return type(self).__name__
+
+
+class PointObject(RhinoObject):
+    ObjectType = ObjectType.Point
+
+
+class CurveObject(RhinoObject):
+    ObjectType = ObjectType.Curve
+    CurveGeometry = property(lambda self: self.Geometry)
+
+
+class BrepObject(RhinoObject):
+    ObjectType = ObjectType.Brep
+    BrepGeometry = property(lambda self: self.Geometry)
+
+
+class ExtrusionObject(RhinoObject):
+    ObjectType = ObjectType.Extrusion
+    ExtrusionGeometry = property(lambda self: self.Geometry)
+
+
+class MeshObject(RhinoObject):
+    ObjectType = ObjectType.Mesh
+    MeshGeometry = property(lambda self: self.Geometry)
+
+
+__object_classes = ((rg.Point, PointObject), (rg.Curve, CurveObject), (rg.Brep, BrepObject),
+                    (rg.Extrusion, ExtrusionObject), (rg.Mesh, MeshObject))
+
+
+def _objectclass(geometry):
+    for geometry_type, object_type in __object_classes:
+        if isinstance(geometry, geometry_type): return object_type
+    return RhinoObject
+
+
+class ObjRef(object):
+    def __init__(self, rhino_object):
+        self._object = rhino_object if isinstance(rhino_object, RhinoObject) else None
+        self.ObjectId = self._object.Id if self._object else rhino_object
+
+    def Object(self):
+        return self._object
+
+    def Geometry(self):
+        return self._object.Geometry if self._object else None
+
+    def Curve(self):
+        geometry = self.Geometry()
+        if isinstance(geometry, rg.Curve): return geometry
+
+    def Mesh(self):
+        geometry = self.Geometry()
+        if isinstance(geometry, rg.Mesh): return geometry
+
+    def Face(self):
+        geometry = self.Geometry()
+        if isinstance(geometry, rg.Brep) and geometry.Faces.Count==1: return geometry.Faces[0]
+
+
+class Layer(object):
+    def __init__(self, name="Default", color=Color.Black):
+        self.Name = name
+        self.Id = Guid.NewGuid()
+        self.Color = color
+        self.LayerIndex = -1
+        self.IsDeleted = False
+
+    FullPath = property(lambda self: self.Name)
+
+    @staticmethod
+    def GetDefaultLayerProperties():
+        return Layer()
+
+
+class _EventHook(object):
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self.handlers: self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers): handler(sender, args)
+
+
+class _EventArgs(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class ObjectTable(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self._objects = {}
+        self._order = []
+        self._serials = {}
+
+    Count = property(lambda self: len(self._objects))
+
+    # adding objects
+    def Add(self, geometry, attributes=None, *args):
+        if geometry is None: return Guid.Empty
+        attributes = attributes.Duplicate() if attributes else ObjectAttributes()
+        rhobj = _objectclass(geometry)(self.Document, Guid.NewGuid(), geometry, attributes)
+        self._objects[rhobj.Id] = rhobj
+        self._order.append(rhobj.Id)
+        self._serials[rhobj.RuntimeSerialNumber] = rhobj
+        RhinoDoc.AddRhinoObject.fire(self.Document, _EventArgs(ObjectId=rhobj.Id, TheObject=rhobj))
+        return rhobj.Id
+
+    def AddPoint(self, point, attributes=None, *args):
+        if not isinstance(point, rg.Point3d): point = rg.Point3d(*point)
+        return self.Add(rg.Point(point), attributes)
+
+    def AddPoints(self, points, attributes=None):
+        return [self.AddPoint(point, attributes) for point in points]
+
+    def AddCurve(self, curve, attributes=None, *args):
+        return self.Add(curve.Duplicate(), attributes)
+
+    def AddLine(self, start, end=None, attributes=None):
+        if end is None: start, end = start.From, start.To
+        return self.Add(rg.LineCurve(start, end), attributes)
+
+    def AddPolyline(self, points, attributes=None):
+        return self.Add(rg.PolylineCurve(points), attributes)
+
+    def AddMesh(self, mesh, attributes=None, *args):
+        return self.Add(mesh.Duplicate(), attributes)
+
+    def AddBrep(self, brep, attributes=None, *args):
+        return self.Add(brep.Duplicate(), attributes)
+
+    def AddExtrusion(self, extrusion, attributes=None, *args):
+        return self.Add(extrusion.Duplicate(), attributes)
+
+    # finding objects
+    def Find(self, key):
+        if isinstance(key, Guid):
+            rhobj = self._objects.get(key)
+        else:
+            rhobj = self._serials.get(key)
+            if rhobj is not None and self._objects.get(rhobj.Id) is not rhobj: rhobj = None
+        return rhobj
+
+    def __iter__(self):
+        return iter(self.GetObjectList(ObjectEnumeratorSettings()))
+
+    def _object(self, item):
+        if isinstance(item, RhinoObject): return self._objects.get(item.Id)
+        if isinstance(item, ObjRef): return self._objects.get(item.ObjectId)
+        return self._objects.get(item)
+
+    def GetObjectList(self, settings):
+        if not isinstance(settings, ObjectEnumeratorSettings):
+            object_type = settings
+            settings = ObjectEnumeratorSettings()
+            settings.ObjectTypeFilter = object_type
+        objects = self._objects
+        for id in list(self._order):
+            rhobj = objects.get(id)
+            if rhobj is None: continue
+            mode = rhobj.Attributes.Mode
+            if mode==0 and not settings.NormalObjects: continue
+            if mode==1 and not settings.HiddenObjects: continue
+            if mode==2 and not settings.LockedObjects: continue
+            if settings.SelectedObjectsFilter and not rhobj._selected: continue
+            if settings.NameFilter and settings.NameFilter!=rhobj.Attributes.Name: continue
+            if settings.LayerIndexFilter>=0 and rhobj.Attributes.LayerIndex!=settings.LayerIndexFilter: continue
+            if settings.ObjectTypeFilter!=ObjectType.AnyObject and not (rhobj.ObjectType & settings.ObjectTypeFilter): continue
+            yield rhobj
+
+    def FindByLayer(self, layer):
+        if not isinstance(layer, Layer): layer = self.Document.Layers[self.Document.Layers.Find(layer, True)]
+        return [rhobj for rhobj in self.GetObjectList(ObjectEnumeratorSettings())
+                if rhobj.Attributes.LayerIndex==layer.LayerIndex]
+
+    def FindByDrawColor(self, color, include_lights):
+        return [rhobj for rhobj in self.GetObjectList(ObjectEnumeratorSettings())
+                if rhobj.Attributes.DrawColor(self.Document)==color]
+
+    def FindByGroup(self, group_index):
+        return [rhobj for rhobj in self.GetObjectList(ObjectEnumeratorSettings())
+                if group_index in rhobj.Attributes.GetGroupList()]
+
+    def GetSelectedObjects(self, include_lights, include_grips):
+        return [rhobj for rhobj in self._objects.values() if rhobj._selected]
+
+    def UnselectAll(self, *args):
+        rc = 0
+        for rhobj in self._objects.values():
+            if rhobj._selected:
+                rhobj._selected = False
+                rc += 1
+        return rc
+
+    # modifying objects
+    def _replace(self, old, geometry, attributes):
+        rhobj = _objectclass(geometry)(self.Document, old.Id, geometry, attributes)
+        old.IsDeleted = True
+        self._objects[rhobj.Id] = rhobj
+        self._serials[rhobj.RuntimeSerialNumber] = rhobj
+        return rhobj
+
+    def Replace(self, item, geometry, *args):
+        old = self._object(item)
+        if old is None: return False
+        rhobj = self._replace(old, geometry, old.Attributes.Duplicate())
+        RhinoDoc.ReplaceRhinoObject.fire(self.Document, _EventArgs(ObjectId=rhobj.Id, OldRhinoObject=old, NewRhinoObject=rhobj))
+        return True
+
+    def Transform(self, item, xform, delete_original):
+        rhobj = self._object(item)
+        if rhobj is None: return Guid.Empty
+        geometry = rhobj.Geometry.Duplicate()
+        geometry.Transform(xform)
+        if delete_original:
+            self.Replace(rhobj, geometry)
+            return rhobj.Id
+        return self.Add(geometry, rhobj.Attributes)
+
+    def ModifyAttributes(self, item, attributes, quiet):
+        old = self._object(item)
+        if old is None: return False
+        old_attributes = old.Attributes
+        rhobj = self._replace(old, old.Geometry, attributes.Duplicate())
+        RhinoDoc.ModifyObjectAttributes.fire(self.Document, _EventArgs(RhinoObject=rhobj,
+            OldAttributes=old_attributes, NewAttributes=rhobj.Attributes))
+        return True
+
+    def Delete(self, item, quiet=True):
+        if not isinstance(item, (RhinoObject, ObjRef, Guid)):
+            return sum(1 for i in item if self.Delete(i, quiet))
+        rhobj = self._object(item)
+        if rhobj is None: return False
+        del self._objects[rhobj.Id]
+        if self._order[-1]==rhobj.Id: self._order.pop()
+        else: self._order.remove(rhobj.Id)
+        rhobj.IsDeleted = True
+        RhinoDoc.DeleteRhinoObject.fire(self.Document, _EventArgs(ObjectId=rhobj.Id, TheObject=rhobj))
+        return True
+
+    def _setmode(self, item, mode):
+        rhobj = self._object(item)
+        if rhobj is None or rhobj.Attributes.Mode==mode: return False
+        attributes = rhobj.Attributes.Duplicate()
+        attributes.Mode = mode
+        return self.ModifyAttributes(rhobj, attributes, True)
+
+    def Hide(self, item, ignore_layer_mode):
+        return self._setmode(item, 1)
+
+    def Lock(self, item, ignore_layer_mode):
+        return self._setmode(item, 2)
+
+    def Show(self, item, ignore_layer_mode):
+        rhobj = self._object(item)
+        return rhobj is not None and rhobj.IsHidden and self._setmode(item, 0)
+
+    def Unlock(self, item, ignore_layer_mode):
+        rhobj = self._object(item)
+        return rhobj is not None and rhobj.IsLocked and self._setmode(item, 0)
+
+    def Select(self, item, select=True, *args):
+        rhobj = self._object(item)
+        return rhobj is not None and rhobj.Select(select)
+
+
+class LayerTable(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self._layers = []
+        self.Add(Layer("Default"))
+        self.CurrentLayerIndex = 0
+
+    Count = property(lambda self: len(self._layers))
+    CurrentLayer = property(lambda self: self._layers[self.CurrentLayerIndex])
+
+    def Add(self, layer, *args):
+        if not isinstance(layer, Layer): layer = Layer(layer, *args)
+        if self.Find(layer.Name, True)>=0: return -1
+        layer.LayerIndex = len(self._layers)
+        self._layers.append(layer)
+        return layer.LayerIndex
+
+    def Find(self, name_or_id, ignore_deleted):
+        for layer in self._layers:
+            if layer.IsDeleted and ignore_deleted: continue
+            if layer.Id==name_or_id or (isinstance(name_or_id, basestring) and layer.Name.lower()==name_or_id.lower()):
+                return layer.LayerIndex
+        return -1
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+
+class GroupTable(object):
+    def __init__(self, doc=None):
+        self.Document = doc
+        self._names = []
+
+    Count = property(lambda self: len(self._names))
+
+    def Add(self, name=None):
+        self._names.append(name or "Group%02d" % len(self._names))
+        return len(self._names) - 1
+
+    def Find(self, name, ignore_deleted):
+        for i, group_name in enumerate(self._names):
+            if group_name.lower()==name.lower(): return i
+        return -1
+
+    def GroupName(self, index):
+        return self._names[index]
+
+    def AddToGroup(self, index, object_ids):
+        if not 0<=index<len(self._names): return False
+        if isinstance(object_ids, Guid): object_ids = [object_ids]
+        objects = self.Document.Objects
+        for id in object_ids:
+            rhobj = objects.Find(id)
+            if rhobj is None: return False
+            attributes = rhobj.Attributes.Duplicate()
+            attributes.AddToGroup(index)
+            objects.ModifyAttributes(rhobj, attributes, True)
+        return True
+
+
+class ViewTable(object):
+    def __init__(self):
+        self.RedrawEnabled = True
+        self.RedrawCount = 0
+
+    def Redraw(self):
+        self.RedrawCount += 1
+
+
+class RhinoDoc(object):
+    __serial = itertools.count(1)
+    AddRhinoObject = _EventHook()
+    DeleteRhinoObject = _EventHook()
+    UndeleteRhinoObject = _EventHook()
+    ReplaceRhinoObject = _EventHook()
+    ModifyObjectAttributes = _EventHook()
+    CloseDocument = _EventHook()
+    NewDocument = _EventHook()
+    EndOpenDocument = _EventHook()
+
+    def __init__(self):
+        self.RuntimeSerialNumber = next(RhinoDoc.__serial)
+        self.Objects = ObjectTable(self)
+        self.Layers = LayerTable(self)
+        self.Groups = GroupTable(self)
+        self.Views = ViewTable()
+        self.ModelAbsoluteTolerance = 0.001
+        self.ModelAngleToleranceRadians = 0.017453292519943295
+        self.ModelAngleToleranceDegrees = 1.0
+        self.UndoRecordCount = 0
+        self.__undo = itertools.count(1)
+
+    def BeginUndoRecord(self, description):
+        self.UndoRecordCount += 1
+        return next(self.__undo)
+
+    def EndUndoRecord(self, serial_number):
+        return True
+
+    def close(self):
+        RhinoDoc.CloseDocument.fire(self, _EventArgs(Document=self))
+
+
+def create():
+    return Namespace("Rhino.DocObjects", ObjectType=ObjectType, ObjectColorSource=ObjectColorSource,
+                     ObjectAttributes=ObjectAttributes, ObjectEnumeratorSettings=ObjectEnumeratorSettings,
+                     RhinoObject=RhinoObject, PointObject=PointObject, CurveObject=CurveObject,
+                     BrepObject=BrepObject, ExtrusionObject=ExtrusionObject, MeshObject=MeshObject,
+                     ObjRef=ObjRef, Layer=Layer)
@@ -0,0 +1,1038 @@
+"""Stand-in for the subset of Rhino.Geometry used by rhinoscript.
+
+Only the members that the benchmark entry points reach are implemented.
+Curves are evaluated exactly for lines, polylines and arcs; everything else
+about a curve is derived from those evaluations.
+"""
+import copy
+import math
+
+from _namespace import Namespace
+
+UNSET = -1.23432101234321e+308
+ZERO_TOLERANCE = 2.3283064365386963e-10
+
+
+class _Triple(object):
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if not isinstance(x, (int, long, float)):
+            x, y, z = x.X, x.Y, x.Z
+        self.X, self.Y, self.Z = float(x), float(y), float(z)
+
+    @property
+    def IsValid(self):
+        return self.X!=UNSET and self.Y!=UNSET and self.Z!=UNSET
+
+    def DistanceTo(self, other):
+        return math.sqrt((self.X-other.X)**2 + (self.Y-other.Y)**2 + (self.Z-other.Z)**2)
+
+    def Transform(self, xform):
+        rc = xform * self
+        self.X, self.Y, self.Z = rc.X, rc.Y, rc.Z
+
+    def __getitem__(self, index):
+        return (self.X, self.Y, self.Z)[index]
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.X==other.X and self.Y==other.Y and self.Z==other.Z
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.X, self.Y, self.Z))
+
+    def __repr__(self):
+        return "%s(%r, %r, %r)" % (type(self).__name__, self.X, self.Y, self.Z)
+
+
+class Point3d(_Triple):
+    __slots__ = ()
+
+    def __add__(self, other):
+        return Point3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+
+    def __sub__(self, other):
+        if isinstance(other, Point3d): return Vector3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+        return Point3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+
+    def __mul__(self, factor):
+        return Point3d(self.X*factor, self.Y*factor, self.Z*factor)
+    __rmul__ = __mul__
+
+    def __div__(self, factor):
+        return Point3d(self.X/factor, self.Y/factor, self.Z/factor)
+    __truediv__ = __div__
+
+Point3d.Origin = Point3d(0, 0, 0)
+Point3d.Unset = Point3d(UNSET, UNSET, UNSET)
+
+
+class Point3f(Point3d):
+    __slots__ = ()
+
+
+class Vector3d(_Triple):
+    __slots__ = ()
+
+    @property
+    def Length(self):
+        return math.sqrt(self.X*self.X + self.Y*self.Y + self.Z*self.Z)
+
+    @property
+    def SquareLength(self):
+        return self.X*self.X + self.Y*self.Y + self.Z*self.Z
+
+    @property
+    def IsZero(self):
+        return self.X==0 and self.Y==0 and self.Z==0
+
+    def IsTiny(self, tolerance=ZERO_TOLERANCE):
+        return abs(self.X)<=tolerance and abs(self.Y)<=tolerance and abs(self.Z)<=tolerance
+
+    def Unitize(self):
+        length = self.Length
+        if length<=0: return False
+        self.X, self.Y, self.Z = self.X/length, self.Y/length, self.Z/length
+        return True
+
+    def Reverse(self):
+        self.X, self.Y, self.Z = -self.X, -self.Y, -self.Z
+        return True
+
+    def Transform(self, xform):
+        rc = xform * self
+        self.X, self.Y, self.Z = rc.X, rc.Y, rc.Z
+
+    @staticmethod
+    def CrossProduct(a, b):
+        return Vector3d(a.Y*b.Z - a.Z*b.Y, a.Z*b.X - a.X*b.Z, a.X*b.Y - a.Y*b.X)
+
+    @staticmethod
+    def Multiply(a, b):
+        return a * b
+
+    @staticmethod
+    def VectorAngle(a, b):
+        a = Vector3d(a)
+        b = Vector3d(b)
+        if not a.Unitize() or not b.Unitize(): return UNSET
+        return math.acos(max(-1.0, min(1.0, a*b)))
+
+    def __add__(self, other):
+        if isinstance(other, Point3d): return Point3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+        return Vector3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+
+    def __sub__(self, other):
+        return Vector3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+
+    def __neg__(self):
+        return Vector3d(-self.X, -self.Y, -self.Z)
+
+    def __mul__(self, other):
+        if isinstance(other, _Triple): return self.X*other.X + self.Y*other.Y + self.Z*other.Z
+        return Vector3d(self.X*other, self.Y*other, self.Z*other)
+
+    def __rmul__(self, factor):
+        return Vector3d(self.X*factor, self.Y*factor, self.Z*factor)
+
+    def __div__(self, factor):
+        return Vector3d(self.X/factor, self.Y/factor, self.Z/factor)
+    __truediv__ = __div__
+
+Vector3d.Zero = Vector3d(0, 0, 0)
+Vector3d.XAxis = Vector3d(1, 0, 0)
+Vector3d.YAxis = Vector3d(0, 1, 0)
+Vector3d.ZAxis = Vector3d(0, 0, 1)
+Vector3d.Unset = Vector3d(UNSET, UNSET, UNSET)
+
+
+class Vector3f(Vector3d):
+    __slots__ = ()
+
+
+class Point2d(object):
+    __slots__ = ("X", "Y")
+
+    def __init__(self, x=0.0, y=0.0):
+        self.X, self.Y = float(x), float(y)
+
+    def __eq__(self, other):
+        return type(other) is Point2d and self.X==other.X and self.Y==other.Y
+
+    def __repr__(self):
+        return "Point2d(%r, %r)" % (self.X, self.Y)
+
+
+class Interval(object):
+    __slots__ = ("T0", "T1")
+
+    def __init__(self, t0=0.0, t1=0.0):
+        self.T0, self.T1 = float(t0), float(t1)
+
+    Min = property(lambda self: min(self.T0, self.T1))
+    Max = property(lambda self: max(self.T0, self.T1))
+    Length = property(lambda self: self.T1 - self.T0)
+    Mid = property(lambda self: 0.5*(self.T0 + self.T1))
+
+    def ParameterAt(self, normalized):
+        return self.T0 + normalized*(self.T1 - self.T0)
+
+    def NormalizedParameterAt(self, t):
+        if self.T1==self.T0: return UNSET
+        return (t - self.T0)/(self.T1 - self.T0)
+
+    def IncludesParameter(self, t):
+        return self.Min<=t<=self.Max
+
+    def __getitem__(self, index):
+        return (self.T0, self.T1)[index]
+
+
+class Transform(object):
+    __slots__ = ("_m",)
+
+    def __init__(self, diagonal=0.0):
+        self._m = [[0.0]*4 for i in range(4)]
+        for i in range(4): self._m[i][i] = float(diagonal)
+
+    def __getitem__(self, index):
+        return self._m[index[0]][index[1]]
+
+    def __setitem__(self, index, value):
+        self._m[index[0]][index[1]] = float(value)
+
+    @staticmethod
+    def Identity():
+        return Transform(1.0)
+
+    @staticmethod
+    def Translation(*args):
+        v = args[0] if len(args)==1 else Vector3d(*args)
+        xf = Transform(1.0)
+        xf._m[0][3], xf._m[1][3], xf._m[2][3] = v.X, v.Y, v.Z
+        return xf
+
+    @staticmethod
+    def Rotation(*args):
+        if len(args)==3 and isinstance(args[0], (int, long, float)):
+            angle, axis, center = args
+        elif len(args)==2 and isinstance(args[0], (int, long, float)):
+            angle, axis, center = args[0], args[1], Point3d.Origin
+        else:
+            start, end, center = args
+            start = Vector3d(start); end = Vector3d(end)
+            start.Unitize(); end.Unitize()
+            axis = Vector3d.CrossProduct(start, end)
+            if axis.IsTiny(): axis = Vector3d.ZAxis
+            angle = Vector3d.VectorAngle(start, end)
+        axis = Vector3d(axis)
+        axis.Unitize()
+        c, s = math.cos(angle), math.sin(angle)
+        t = 1.0 - c
+        x, y, z = axis.X, axis.Y, axis.Z
+        xf = Transform(1.0)
+        m = xf._m
+        m[0][0], m[0][1], m[0][2] = t*x*x + c, t*x*y - s*z, t*x*z + s*y
+        m[1][0], m[1][1], m[1][2] = t*x*y + s*z, t*y*y + c, t*y*z - s*x
+        m[2][0], m[2][1], m[2][2] = t*x*z - s*y, t*y*z + s*x, t*z*z + c
+        moved = xf * Point3d(center)
+        m[0][3], m[1][3], m[2][3] = center.X - moved.X, center.Y - moved.Y, center.Z - moved.Z
+        return xf
+
+    @staticmethod
+    def Scale(anchor, *factors):
+        if len(factors)==1: factors = (factors[0],)*3
+        origin = anchor.Origin if isinstance(anchor, Plane) else anchor
+        xf = Transform(1.0)
+        for i in range(3):
+            xf._m[i][i] = float(factors[i])
+            xf._m[i][3] = origin[i]*(1.0 - factors[i])
+        return xf
+
+    @staticmethod
+    def Mirror(point, normal):
+        n = Vector3d(normal)
+        n.Unitize()
+        xf = Transform(1.0)
+        d = Vector3d(point)*n
+        for i in range(3):
+            for j in range(3):
+                xf._m[i][j] -= 2.0*n[i]*n[j]
+            xf._m[i][3] = 2.0*d*n[i]
+        return xf
+
+    @staticmethod
+    def PlaneToPlane(plane0, plane1):
+        xf = Transform(1.0)
+        axes0 = (plane0.XAxis, plane0.YAxis, plane0.ZAxis)
+        axes1 = (plane1.XAxis, plane1.YAxis, plane1.ZAxis)
+        for i in range(3):
+            for j in range(3):
+                xf._m[i][j] = sum(axes1[k][i]*axes0[k][j] for k in range(3))
+        moved = xf * Point3d(plane0.Origin)
+        for i in range(3): xf._m[i][3] = plane1.Origin[i] - moved[i]
+        return xf
+
+    def __mul__(self, other):
+        m = self._m
+        if isinstance(other, Transform):
+            o = other._m
+            rc = Transform()
+            rc._m = [[sum(m[i][k]*o[k][j] for k in range(4)) for j in range(4)] for i in range(4)]
+            return rc
+        x, y, z = other.X, other.Y, other.Z
+        if isinstance(other, Vector3d):
+            return type(other)(m[0][0]*x + m[0][1]*y + m[0][2]*z,
+                               m[1][0]*x + m[1][1]*y + m[1][2]*z,
+                               m[2][0]*x + m[2][1]*y + m[2][2]*z)
+        w = m[3][0]*x + m[3][1]*y + m[3][2]*z + m[3][3]
+        if w==0: w = 1.0
+        return type(other)((m[0][0]*x + m[0][1]*y + m[0][2]*z + m[0][3])/w,
+                           (m[1][0]*x + m[1][1]*y + m[1][2]*z + m[1][3])/w,
+                           (m[2][0]*x + m[2][1]*y + m[2][2]*z + m[2][3])/w)
+
+    def __eq__(self, other):
+        return isinstance(other, Transform) and self._m==other._m
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class Plane(object):
+    __slots__ = ("Origin", "XAxis", "YAxis", "ZAxis")
+
+    def __init__(self, origin=None, a=None, b=None):
+        if isinstance(origin, Plane):
+            origin, a, b = origin.Origin, origin.XAxis, origin.YAxis
+        if origin is None:
+            origin, a, b = Point3d.Origin, Vector3d.XAxis, Vector3d.YAxis
+        self.Origin = Point3d(origin)
+        if b is None:
+            z = Vector3d(a)
+            z.Unitize()
+            x = Vector3d.CrossProduct(Vector3d.ZAxis if abs(z.Z)<0.9 else Vector3d.XAxis, z)
+            if abs(z.Z)>=0.9: x = -x
+            x.Unitize()
+            self.XAxis, self.YAxis, self.ZAxis = x, Vector3d.CrossProduct(z, x), z
+            return
+        if isinstance(a, Point3d): a = a - self.Origin
+        if isinstance(b, Point3d): b = b - self.Origin
+        x = Vector3d(a)
+        x.Unitize()
+        z = Vector3d.CrossProduct(x, Vector3d(b))
+        z.Unitize()
+        self.XAxis, self.YAxis, self.ZAxis = x, Vector3d.CrossProduct(z, x), z
+
+    WorldXY = property(lambda self: Plane())
+    Normal = property(lambda self: Vector3d(self.ZAxis))
+
+    @property
+    def IsValid(self):
+        return self.ZAxis.Length>0.5
+
+    def PointAt(self, u, v, w=0.0):
+        return self.Origin + self.XAxis*u + self.YAxis*v + self.ZAxis*w
+
+    def ClosestParameter(self, point):
+        v = point - self.Origin
+        return True, v*self.XAxis, v*self.YAxis
+
+    def ClosestPoint(self, point):
+        ok, u, v = self.ClosestParameter(point)
+        return self.PointAt(u, v)
+
+    def DistanceTo(self, point):
+        return (point - self.Origin)*self.ZAxis
+
+    def Transform(self, xform):
+        origin = xform*Point3d(self.Origin)
+        x = xform*Point3d(self.Origin + self.XAxis) - origin
+        y = xform*Point3d(self.Origin + self.YAxis) - origin
+        rc = Plane(origin, x, y)
+        self.Origin, self.XAxis, self.YAxis, self.ZAxis = rc.Origin, rc.XAxis, rc.YAxis, rc.ZAxis
+        return True
+
+Plane.WorldXY = Plane()
+
+
+class BoundingBox(object):
+    __slots__ = ("Min", "Max")
+
+    def __init__(self, *args):
+        if len(args)==6:
+            self.Min, self.Max = Point3d(*args[:3]), Point3d(*args[3:])
+        elif len(args)==2 and isinstance(args[0], Point3d):
+            self.Min, self.Max = Point3d(args[0]), Point3d(args[1])
+        elif len(args)==1:
+            points = list(args[0])
+            xs = [p.X for p in points]; ys = [p.Y for p in points]; zs = [p.Z for p in points]
+            self.Min = Point3d(min(xs), min(ys), min(zs))
+            self.Max = Point3d(max(xs), max(ys), max(zs))
+        else:
+            self.Min, self.Max = Point3d(1, 0, 0), Point3d(-1, 0, 0)
+
+    @property
+    def IsValid(self):
+        return self.Min.X<=self.Max.X and self.Min.Y<=self.Max.Y and self.Min.Z<=self.Max.Z
+
+    Center = property(lambda self: (self.Min + self.Max)*0.5)
+    Diagonal = property(lambda self: self.Max - self.Min)
+
+    def Union(self, other):
+        if not other.IsValid: return
+        if not self.IsValid:
+            self.Min, self.Max = Point3d(other.Min), Point3d(other.Max)
+            return
+        self.Min = Point3d(min(self.Min.X, other.Min.X), min(self.Min.Y, other.Min.Y), min(self.Min.Z, other.Min.Z))
+        self.Max = Point3d(max(self.Max.X, other.Max.X), max(self.Max.Y, other.Max.Y), max(self.Max.Z, other.Max.Z))
+
+    @staticmethod
+    def Intersection(a, b):
+        rc = BoundingBox(Point3d(max(a.Min.X, b.Min.X), max(a.Min.Y, b.Min.Y), max(a.Min.Z, b.Min.Z)),
+                         Point3d(min(a.Max.X, b.Max.X), min(a.Max.Y, b.Max.Y), min(a.Max.Z, b.Max.Z)))
+        if rc.IsValid: return rc
+        return BoundingBox.Empty
+
+    def Contains(self, other, strict=False):
+        if isinstance(other, BoundingBox):
+            return self.Contains(other.Min) and self.Contains(other.Max)
+        return (self.Min.X<=other.X<=self.Max.X and self.Min.Y<=other.Y<=self.Max.Y and
+                self.Min.Z<=other.Z<=self.Max.Z)
+
+    def ClosestPoint(self, point):
+        return Point3d(min(max(point.X, self.Min.X), self.Max.X),
+                       min(max(point.Y, self.Min.Y), self.Max.Y),
+                       min(max(point.Z, self.Min.Z), self.Max.Z))
+
+    def Inflate(self, amount):
+        self.Min = Point3d(self.Min.X-amount, self.Min.Y-amount, self.Min.Z-amount)
+        self.Max = Point3d(self.Max.X+amount, self.Max.Y+amount, self.Max.Z+amount)
+
+    def GetCorners(self):
+        a, b = self.Min, self.Max
+        return [Point3d(x, y, z) for z in (a.Z, b.Z) for y in (a.Y, b.Y) for x in (a.X, b.X)]
+
+    def Transform(self, xform):
+        rc = BoundingBox([xform*p for p in self.GetCorners()])
+        self.Min, self.Max = rc.Min, rc.Max
+        return True
+
+BoundingBox.Empty = BoundingBox()
+
+
+class Line(object):
+    __slots__ = ("From", "To")
+
+    def __init__(self, start=None, end=None, *more):
+        if more:
+            start, end = Point3d(start, end, more[0]), Point3d(*more[1:])
+        self.From = Point3d(start) if start is not None else Point3d()
+        self.To = Point3d(end) if end is not None else Point3d()
+
+    Length = property(lambda self: self.From.DistanceTo(self.To))
+    Direction = property(lambda self: self.To - self.From)
+
+    def PointAt(self, t):
+        return self.From + (self.To - self.From)*t
+
+    def ClosestParameter(self, point):
+        d = self.To - self.From
+        length2 = d.SquareLength
+        if length2==0: return 0.0
+        return ((point - self.From)*d)/length2
+
+    def ClosestPoint(self, point, limit_to_finite_segment=True):
+        t = self.ClosestParameter(point)
+        if limit_to_finite_segment: t = max(0.0, min(1.0, t))
+        return self.PointAt(t)
+
+
+class Continuity(object):
+    C0_continuous, C1_continuous, C2_continuous, G1_continuous, G2_continuous = 1, 2, 3, 4, 5
+    C0_locus_continuous, C1_locus_continuous, C2_locus_continuous = 6, 7, 8
+    G1_locus_continuous, G2_locus_continuous = 9, 10
+
+
+def _samedirection(a, b):
+    a, b = Vector3d(a), Vector3d(b)
+    if not a.Unitize() or not b.Unitize(): return True
+    return a*b>=1.0 - 1e-9
+
+
+class GeometryBase(object):
+    ObjectType = 0
+
+    def Duplicate(self):
+        return copy.deepcopy(self)
+
+    @property
+    def IsValid(self):
+        return True
+
+    def Translate(self, vector):
+        return self.Transform(Transform.Translation(vector))
+
+    def GetBoundingBox(self, accurate=True):
+        if isinstance(accurate, Plane):
+            xf = Transform.PlaneToPlane(accurate, Plane.WorldXY)
+            return BoundingBox([xf*p for p in self._points()])
+        return BoundingBox(self._points())
+
+
+class Point(GeometryBase):
+    ObjectType = 1
+
+    def __init__(self, location):
+        self.Location = Point3d(location)
+
+    def _points(self):
+        return [self.Location]
+
+    def Transform(self, xform):
+        self.Location = xform*self.Location
+        return True
+
+
+class Curve(GeometryBase):
+    """Base class of the stand-in curves. Subclasses implement PointAt and
+    Domain; lengths and closest points use a dense polyline approximation"""
+    ObjectType = 4
+    _samples = 64
+
+    PointAtStart = property(lambda self: self.PointAt(self.Domain.T0))
+    PointAtEnd = property(lambda self: self.PointAt(self.Domain.T1))
+
+    @property
+    def IsClosed(self):
+        return self.PointAtStart.DistanceTo(self.PointAtEnd)<=ZERO_TOLERANCE
+
+    def _parameters(self):
+        domain = self.Domain
+        return [domain.ParameterAt(i/float(self._samples)) for i in range(self._samples+1)]
+
+    def _points(self):
+        return [self.PointAt(t) for t in self._parameters()]
+
+    def DerivativeAt(self, t, count):
+        h = 1e-5*max(1.0, self.Domain.Length)
+        rc = [Vector3d(self.PointAt(t))]
+        p = lambda s: self.PointAt(min(max(s, self.Domain.Min), self.Domain.Max))
+        if count>=1:
+            rc.append((p(t+h) - p(t-h))*(1.0/(min(t+h, self.Domain.Max) - max(t-h, self.Domain.Min))))
+        if count>=2:
+            rc.append((Vector3d(p(t+h)) + Vector3d(p(t-h)) - Vector3d(p(t))*2.0)*(1.0/(h*h)))
+        while len(rc)<=count: rc.append(Vector3d(0, 0, 0))
+        return rc
+
+    def TangentAt(self, t):
+        d = self.DerivativeAt(t, 1)[1]
+        d.Unitize()
+        return d
+
+    def CurvatureAt(self, t):
+        d = self.DerivativeAt(t, 2)
+        d1, d2 = d[1], d[2]
+        length2 = d1.SquareLength
+        if length2<=0: return Vector3d(0, 0, 0)
+        tangent = d1*(1.0/math.sqrt(length2))
+        k = (d2 - tangent*(d2*tangent))*(1.0/length2)
+        return k
+
+    def FrameAt(self, t):
+        origin = self.PointAt(t)
+        tangent = self.TangentAt(t)
+        k = self.CurvatureAt(t)
+        if k.IsTiny(1e-12):
+            return True, Plane(origin, tangent, Vector3d.CrossProduct(Plane(origin, tangent).XAxis, tangent) * -1)
+        return True, Plane(origin, tangent, k)
+
+    def PerpendicularFrameAt(self, t):
+        ok, frame = self.FrameAt(t)
+        return ok, Plane(frame.Origin, frame.YAxis, Vector3d.CrossProduct(frame.XAxis, frame.YAxis) * -1)
+
+    def GetLength(self, sub_domain=None):
+        points = self._points() if sub_domain is None else self._subpoints(sub_domain)
+        return sum(points[i].DistanceTo(points[i+1]) for i in range(len(points)-1))
+
+    def _subpoints(self, interval):
+        n = self._samples
+        return [self.PointAt(interval.ParameterAt(i/float(n))) for i in range(n+1)]
+
+    def _lengthparameters(self, lengths):
+        "curve parameters at the given arc lengths"
+        params = self._parameters()
+        points = [self.PointAt(t) for t in params]
+        rc = []
+        accumulated = 0.0
+        i = 0
+        for length in lengths:
+            while i<len(points)-1:
+                segment = points[i].DistanceTo(points[i+1])
+                if accumulated + segment>=length - 1e-12:
+                    s = (length - accumulated)/segment if segment>0 else 0.0
+                    rc.append(params[i] + s*(params[i+1] - params[i]))
+                    break
+                accumulated += segment
+                i += 1
+            else:
+                rc.append(params[-1])
+        return rc
+
+    def DivideByCount(self, count, include_ends):
+        if count<1: return None
+        total = self.GetLength()
+        rc = self._lengthparameters([total*i/float(count) for i in range(count+1)])
+        rc[0], rc[-1] = self.Domain.T0, self.Domain.T1
+        # closed curves do not repeat the seam, so they get count parameters
+        if self.IsClosed: rc = rc[:-1] if include_ends else rc[1:-1]
+        elif not include_ends: rc = rc[1:-1]
+        return rc
+
+    def DivideByLength(self, length, include_ends):
+        total = self.GetLength()
+        if length<=0 or length>total: return None
+        count = int(total/length + 1e-9)
+        rc = self._lengthparameters([length*i for i in range(count+1)])
+        rc[0] = self.Domain.T0
+        if not include_ends: rc = rc[1:]
+        return rc
+
+    def DivideEquidistant(self, distance):
+        "walks a dense polyline, placing points at the given chord distance"
+        if distance<=0: return None
+        domain = self.Domain
+        samples = [self.PointAt(domain.ParameterAt(i/1024.0)) for i in range(1025)]
+        rc = [samples[0]]
+        for point in samples[1:]:
+            if rc[-1].DistanceTo(point)>=distance: rc.append(point)
+        if len(rc)<2: return None
+        return rc
+
+    def DuplicateCurve(self):
+        return copy.deepcopy(self)
+
+    def GetNextDiscontinuity(self, continuity, t0, t1):
+        "stand-in curves are smooth unless a subclass says otherwise"
+        return False, UNSET
+
+    def TryGetPolyline(self):
+        return False, None
+
+    def ToPolyline(self, tolerance, angle_tolerance, minimum_length, maximum_length):
+        "the dense sample polyline, whatever the tolerances"
+        return PolylineCurve(self._points())
+
+    def Reverse(self):
+        return False
+
+    @staticmethod
+    def PlanarCurveCollision(curve_a, curve_b, plane, tolerance):
+        "true if the polyline approximations come within tolerance"
+        pa, pb = curve_a._points(), curve_b._points()
+        for i in range(len(pa)-1):
+            for j in range(len(pb)-1):
+                s, t = _segmentclosest(pa[i], pa[i+1], pb[j], pb[j+1])
+                a = pa[i] + (pa[i+1] - pa[i])*s
+                b = pb[j] + (pb[j+1] - pb[j])*t
+                if a.DistanceTo(b)<=tolerance: return True
+        return False
+
+    @staticmethod
+    def PlanarClosedCurveRelationship(curve_a, curve_b, plane, tolerance):
+        "0 disjoint, 1 intersecting, 2 a inside b, 3 b inside a"
+        if Curve.PlanarCurveCollision(curve_a, curve_b, plane, tolerance): return 1
+        def inside(point, curve):
+            points, rc = curve._points(), False
+            for a, b in zip(points, points[1:]):
+                if (a.Y>point.Y)!=(b.Y>point.Y) and a.X + (point.Y - a.Y)*(b.X - a.X)/(b.Y - a.Y)>point.X: rc = not rc
+            return rc
+        if inside(curve_a.PointAtStart, curve_b): return 2
+        if inside(curve_b.PointAtStart, curve_a): return 3
+        return 0
+
+    @staticmethod
+    def JoinCurves(curves, tolerance=0.0, preserve_direction=False):
+        "chains curves whose ends are within tolerance, scanning all curves for every join"
+        remaining = [curve.DuplicateCurve() for curve in curves]
+        rc = []
+        while remaining:
+            chain = [remaining.pop(0)]
+            extended = True
+            while extended:
+                extended = False
+                for i, curve in enumerate(remaining):
+                    start, end = chain[0].PointAtStart, chain[-1].PointAtEnd
+                    if curve.PointAtStart.DistanceTo(end)<=tolerance: chain.append(curve)
+                    elif curve.PointAtEnd.DistanceTo(start)<=tolerance: chain.insert(0, curve)
+                    elif curve.PointAtEnd.DistanceTo(end)<=tolerance and curve.Reverse(): chain.append(curve)
+                    elif curve.PointAtStart.DistanceTo(start)<=tolerance and curve.Reverse(): chain.insert(0, curve)
+                    else: continue
+                    del remaining[i]
+                    extended = True
+                    break
+            rc.append(chain[0] if len(chain)==1 else PolyCurve(chain))
+        return rc
+
+    def ClosestPoint(self, point, maximum_distance=0.0):
+        params = self._parameters()
+        best, best_t = None, params[0]
+        for i in range(len(params)-1):
+            segment = Line(self.PointAt(params[i]), self.PointAt(params[i+1]))
+            s = max(0.0, min(1.0, segment.ClosestParameter(point)))
+            d = segment.PointAt(s).DistanceTo(point)
+            if best is None or d<best:
+                best, best_t = d, params[i] + s*(params[i+1] - params[i])
+        if maximum_distance>0 and best>maximum_distance: return False, 0.0
+        return True, best_t
+
+    def IsPlanar(self, tolerance=ZERO_TOLERANCE):
+        ok, plane = self.TryGetPlane(tolerance)
+        return ok
+
+    def TryGetPlane(self, tolerance=ZERO_TOLERANCE):
+        points = self._points()
+        origin = points[0]
+        normal = Vector3d(0, 0, 0)
+        for i in range(1, len(points)-1):
+            normal = normal + Vector3d.CrossProduct(points[i]-origin, points[i+1]-origin)
+        if normal.IsTiny(1e-12): return False, Plane.WorldXY
+        plane = Plane(origin, normal)
+        for p in points:
+            if abs(plane.DistanceTo(p))>max(tolerance, 1e-9): return False, plane
+        return True, plane
+
+    @property
+    def IsLinear(self):
+        start, end = self.PointAtStart, self.PointAtEnd
+        line = Line(start, end)
+        return all(line.ClosestPoint(p, False).DistanceTo(p)<=1e-9 for p in self._points())
+
+
+class LineCurve(Curve):
+    def __init__(self, start, end=None):
+        if end is None: start, end = start.From, start.To
+        self.Line = Line(start, end)
+        self.Domain = Interval(0.0, self.Line.Length)
+
+    def PointAt(self, t):
+        return self.Line.PointAt(self.Domain.NormalizedParameterAt(t))
+
+    def Reverse(self):
+        self.Line = Line(self.Line.To, self.Line.From)
+        return True
+
+    def _parameters(self):
+        return [self.Domain.T0, self.Domain.T1]
+
+    def _subpoints(self, interval):
+        return [self.PointAt(interval.T0), self.PointAt(interval.T1)]
+
+    def Transform(self, xform):
+        self.Line = Line(xform*self.Line.From, xform*self.Line.To)
+        return True
+
+
+class PolylineCurve(Curve):
+    def __init__(self, points):
+        self.Points = [Point3d(p) for p in points]
+        self.Domain = Interval(0.0, len(self.Points) - 1.0)
+
+    PointCount = property(lambda self: len(self.Points))
+
+    def PointAt(self, t):
+        i = int(math.floor(t))
+        i = max(0, min(i, len(self.Points) - 2))
+        s = t - i
+        return self.Points[i] + (self.Points[i+1] - self.Points[i])*s
+
+    def _parameters(self):
+        return [float(i) for i in range(len(self.Points))]
+
+    def _subpoints(self, interval):
+        t0, t1 = interval.Min, interval.Max
+        params = [t0] + [float(i) for i in range(len(self.Points)) if t0<i<t1] + [t1]
+        return [self.PointAt(t) for t in params]
+
+    def TryGetPolyline(self):
+        return True, list(self.Points)
+
+    def GetNextDiscontinuity(self, continuity, t0, t1):
+        "every vertex where the direction changes is a kink; locus continuity also checks the seam"
+        points = self.Points
+        for i in range(1, len(points) - 1):
+            if t0<i<t1 and not _samedirection(points[i] - points[i-1], points[i+1] - points[i]):
+                return True, float(i)
+        locus = continuity in (Continuity.C1_locus_continuous, Continuity.G1_locus_continuous)
+        if locus and t1>=self.Domain.T1 and len(points)>2 and self.IsClosed:
+            if not _samedirection(points[-1] - points[-2], points[1] - points[0]): return True, self.Domain.T1
+        return False, UNSET
+
+    def Reverse(self):
+        self.Points.reverse()
+        return True
+
+    def Transform(self, xform):
+        self.Points = [xform*p for p in self.Points]
+        return True
+
+
+class ArcCurve(Curve):
+    "circular arc on a plane, parameterized by angle in radians"
+    def __init__(self, plane, radius, angle=2*math.pi):
+        self.Plane = Plane(plane)
+        self.Radius = float(radius)
+        self.Domain = Interval(0.0, float(angle))
+
+    def PointAt(self, t):
+        return self.Plane.PointAt(self.Radius*math.cos(t), self.Radius*math.sin(t))
+
+    def GetLength(self, sub_domain=None):
+        domain = sub_domain or self.Domain
+        return abs(domain.Length)*self.Radius
+
+    def _lengthparameters(self, lengths):
+        return [self.Domain.T0 + length/self.Radius for length in lengths]
+
+    def Transform(self, xform):
+        self.Plane.Transform(xform)
+        return True
+
+
+class PolyCurve(Curve):
+    "segment i spans the parameters i to i+1"
+    def __init__(self, segments=None):
+        self._segments = list(segments or [])
+
+    SegmentCount = property(lambda self: len(self._segments))
+    Domain = property(lambda self: Interval(0.0, float(len(self._segments))))
+
+    def PointAt(self, t):
+        i = max(0, min(int(math.floor(t)), len(self._segments) - 1))
+        segment = self._segments[i]
+        return segment.PointAt(segment.Domain.ParameterAt(t - i))
+
+    def _parameters(self):
+        return [i + j/8.0 for i in range(len(self._segments)) for j in range(8)] + [float(len(self._segments))]
+
+    def Reverse(self):
+        if not all(segment.Reverse() for segment in self._segments): return False
+        self._segments.reverse()
+        return True
+
+    def Transform(self, xform):
+        return all(segment.Transform(xform) for segment in self._segments)
+
+    def SegmentCurve(self, index):
+        return self._segments[index]
+
+
+class Surface(GeometryBase):
+    ObjectType = 8
+
+
+class BrepFace(Surface):
+    def __init__(self, brep, index):
+        self.Brep = brep
+        self.FaceIndex = index
+
+
+class _FaceList(list):
+    Count = property(lambda self: len(self))
+
+
+class Brep(GeometryBase):
+    ObjectType = 16
+
+    def __init__(self, face_count=1, box=None):
+        self.Faces = _FaceList(BrepFace(self, i) for i in range(face_count))
+        self._box = box or BoundingBox(Point3d(0, 0, 0), Point3d(1, 1, 1))
+
+    def _points(self):
+        return self._box.GetCorners()
+
+    def Transform(self, xform):
+        self._box.Transform(xform)
+        return True
+
+    IsSolid = property(lambda self: len(self.Faces)>=6)
+
+
+class Extrusion(Surface):
+    ObjectType = 1073741824
+
+    def __init__(self, profile_count=1, capped=False, box=None):
+        self.ProfileCount = profile_count
+        self.IsCappedAtBottom = self.IsCappedAtTop = capped
+        self._box = box or BoundingBox(Point3d(0, 0, 0), Point3d(1, 1, 1))
+
+    CapCount = property(lambda self: 2 if self.IsCappedAtTop else 0)
+
+    def Profile3d(self, profile_index, s):
+        "every profile is the rectangle at the bottom of the box, so ToBrep gives 4 faces per profile"
+        if not 0<=profile_index<self.ProfileCount: return None
+        box = self._box
+        z = box.Min.Z + s*(box.Max.Z - box.Min.Z)
+        points = [Point3d(box.Min.X, box.Min.Y, z), Point3d(box.Max.X, box.Min.Y, z),
+                  Point3d(box.Max.X, box.Max.Y, z), Point3d(box.Min.X, box.Max.Y, z)]
+        return PolylineCurve(points + points[:1])
+
+    def _points(self):
+        return self._box.GetCorners()
+
+    def Transform(self, xform):
+        self._box.Transform(xform)
+        return True
+
+    def ToBrep(self, split_kinky_faces=True):
+        return Brep(4*self.ProfileCount + self.CapCount, BoundingBox(self._box.Min, self._box.Max))
+
+
+class _MeshVertexList(list):
+    Count = property(lambda self: len(self))
+
+    def Add(self, x, y=None, z=None):
+        if y is None: x, y, z = x.X, x.Y, x.Z
+        self.append(Point3f(x, y, z))
+        return len(self) - 1
+
+
+class _MeshFaceList(list):
+    Count = property(lambda self: len(self))
+
+    def AddFace(self, *indices):
+        self.append(tuple(indices))
+        return len(self) - 1
+
+
+class Mesh(GeometryBase):
+    ObjectType = 32
+
+    def __init__(self):
+        self.Vertices = _MeshVertexList()
+        self.Faces = _MeshFaceList()
+
+    def _points(self):
+        return self.Vertices
+
+    def Transform(self, xform):
+        self.Vertices = _MeshVertexList(xform*p for p in self.Vertices)
+        return True
+
+    IsClosed = property(lambda self: False)
+
+
+class Point3dList(list):
+    Count = property(lambda self: len(self))
+
+
+class Sphere(object):
+    def __init__(self, center, radius):
+        self.Center = Point3d(center)
+        self.Radius = float(radius)
+
+
+class RTreeEventArgs(object):
+    def __init__(self, id):
+        self.Id = id
+        self.Cancel = False
+
+
+class RTree(object):
+    """Same interface as Rhino.Geometry.RTree. Searches scan every element,
+    so query timings do not reflect a real R-tree"""
+    def __init__(self):
+        self._boxes = {}
+
+    Count = property(lambda self: len(self._boxes))
+
+    def Insert(self, box, element):
+        self._boxes[element] = BoundingBox(box.Min, box.Max)
+        return True
+
+    def Remove(self, box, element):
+        return self._boxes.pop(element, None) is not None
+
+    def Clear(self):
+        self._boxes.clear()
+
+    def Search(self, region, callback):
+        if isinstance(region, Sphere):
+            center, radius = region.Center, region.Radius
+            hit = lambda box: box.ClosestPoint(center).DistanceTo(center)<=radius
+        else:
+            hit = lambda box: BoundingBox.Intersection(region, box).IsValid
+        found = False
+        for element, box in self._boxes.items():
+            if not hit(box): continue
+            found = True
+            e = RTreeEventArgs(element)
+            callback(self, e)
+            if e.Cancel: break
+        return found
+
+
+class IntersectionEvent(object):
+    "point event; overlaps are not produced by the stand-in"
+    IsOverlap = False
+
+    def __init__(self, point_a, point_b, t_a, t_b):
+        self.PointA = self.PointA2 = point_a
+        self.PointB = self.PointB2 = point_b
+        self.OverlapA = Interval(t_a, t_a)
+        self.OverlapB = Interval(t_b, t_b)
+        self.ParameterA, self.ParameterB = t_a, t_b
+
+
+class CurveIntersections(list):
+    Count = property(len)
+
+
+def _segmentclosest(p0, p1, q0, q1):
+    "normalized parameters of the closest points of two segments"
+    d1, d2, r = p1 - p0, q1 - q0, p0 - q0
+    a, e, f = d1*d1, d2*d2, d2*r
+    if a<=1e-24 and e<=1e-24: return 0.0, 0.0
+    if a<=1e-24: return 0.0, max(0.0, min(1.0, f/e))
+    c = d1*r
+    if e<=1e-24: return max(0.0, min(1.0, -c/a)), 0.0
+    b = d1*d2
+    denominator = a*e - b*b
+    s = max(0.0, min(1.0, (b*f - c*e)/denominator)) if denominator>1e-24 else 0.0
+    t = (b*s + f)/e
+    if t<0.0: t, s = 0.0, max(0.0, min(1.0, -c/a))
+    elif t>1.0: t, s = 1.0, max(0.0, min(1.0, (b - c)/a))
+    return s, t
+
+
+class Intersection(object):
+    @staticmethod
+    def CurveCurve(curve_a, curve_b, tolerance, overlap_tolerance):
+        "intersects the polyline approximations of the curves"
+        ta, tb = curve_a._parameters(), curve_b._parameters()
+        pa, pb = [curve_a.PointAt(t) for t in ta], [curve_b.PointAt(t) for t in tb]
+        rc = CurveIntersections()
+        for i in range(len(pa)-1):
+            for j in range(len(pb)-1):
+                s, t = _segmentclosest(pa[i], pa[i+1], pb[j], pb[j+1])
+                a = pa[i] + (pa[i+1] - pa[i])*s
+                b = pb[j] + (pb[j+1] - pb[j])*t
+                if a.DistanceTo(b)>tolerance: continue
+                if any(a.DistanceTo(e.PointA)<=tolerance for e in rc): continue
+                rc.append(IntersectionEvent(a, b, ta[i] + s*(ta[i+1] - ta[i]), tb[j] + t*(tb[j+1] - tb[j])))
+        return rc
+
+def create():
+    geometry = Namespace("Rhino.Geometry", Point3d=Point3d, Point3f=Point3f, Vector3d=Vector3d,
+                         Vector3f=Vector3f, Point2d=Point2d, Interval=Interval, Transform=Transform,
+                         Plane=Plane, BoundingBox=BoundingBox, Line=Line, GeometryBase=GeometryBase,
+                         Point=Point, Curve=Curve, LineCurve=LineCurve, PolylineCurve=PolylineCurve,
+                         ArcCurve=ArcCurve, PolyCurve=PolyCurve, Surface=Surface, BrepFace=BrepFace,
+                         Brep=Brep, Extrusion=Extrusion, Mesh=Mesh, Sphere=Sphere, RTree=RTree,
+                         RTreeEventArgs=RTreeEventArgs, Continuity=Continuity)
+    geometry.Intersect = Namespace("Rhino.Geometry.Intersect", Intersection=Intersection,
+                                   IntersectionEvent=IntersectionEvent, CurveIntersections=CurveIntersections)
+    collections = Namespace("Rhino.Collections", Point3dList=Point3dList)
+    return geometry, collections
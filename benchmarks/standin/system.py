@@ -0,0 +1,118 @@
+"""Stand-in for the parts of the .NET System namespace used by rhinoscript"""
+import uuid
+
+from _namespace import Namespace
+
+
+class Guid(object):
+    __slots__ = ("_value",)
+
+    def __init__(self, value=None):
+        if value is None: self._value = uuid.UUID(int=0)
+        elif isinstance(value, uuid.UUID): self._value = value
+        else: self._value = uuid.UUID(str(value))
+
+    @staticmethod
+    def NewGuid():
+        return Guid(uuid.uuid4())
+
+    def __eq__(self, other):
+        return type(other) is Guid and self._value == other._value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __str__(self):
+        return str(self._value)
+
+    def __repr__(self):
+        return "<System.Guid object (%s)>" % self._value
+
+Guid.Empty = Guid()
+
+
+class _ArrayType(type):
+    __cache = {}
+
+    def __getitem__(cls, element_type):
+        rc = _ArrayType.__cache.get(element_type)
+        if rc is None:
+            rc = _ArrayType("%s[]" % element_type.__name__, (Array,), {"ElementType": element_type})
+            _ArrayType.__cache[element_type] = rc
+        return rc
+
+
+class Array(list):
+    __metaclass__ = _ArrayType
+    ElementType = object
+
+    @property
+    def Length(self):
+        return len(self)
+
+    @staticmethod
+    def CreateInstance(element_type, length):
+        return Array[element_type]([element_type() for i in range(length)])
+
+
+class Enum(object):
+    @staticmethod
+    def ToObject(enum_type, value):
+        return value
+
+
+class Color(object):
+    __slots__ = ("A", "R", "G", "B")
+
+    def __init__(self, a=255, r=0, g=0, b=0):
+        for value in (a, r, g, b):
+            if not isinstance(value, (int, long)) or not 0<=value<=255:
+                raise TypeError("expected int in range 0 to 255, got %r" % (value,))
+        self.A, self.R, self.G, self.B = a, r, g, b
+
+    @staticmethod
+    def FromArgb(*args):
+        if len(args)==1:
+            argb = args[0] & 0xFFFFFFFF
+            return Color((argb >> 24) & 0xFF, (argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF)
+        if len(args)==3: return Color(255, args[0], args[1], args[2])
+        return Color(*args)
+
+    def ToArgb(self):
+        return (self.A << 24) | (self.R << 16) | (self.G << 8) | self.B
+
+    def __eq__(self, other):
+        return type(other) is Color and self.ToArgb()==other.ToArgb()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return self.ToArgb()
+
+Color.Black = Color(255, 0, 0, 0)
+Color.White = Color(255, 255, 255, 255)
+
+
+class Parallel(object):
+    "Runs the loop body in order on the calling thread"
+    @staticmethod
+    def For(start, stop, body):
+        for i in range(start, stop): body(i)
+
+    @staticmethod
+    def ForEach(items, body):
+        for item in items: body(item)
+
+
+def create():
+    drawing = Namespace("System.Drawing", Color=Color)
+    forms = Namespace("System.Windows.Forms")
+    windows = Namespace("System.Windows", Forms=forms)
+    tasks = Namespace("System.Threading.Tasks", Parallel=Parallel)
+    threading = Namespace("System.Threading", Tasks=tasks)
+    return Namespace("System", Guid=Guid, Array=Array, Enum=Enum, Drawing=drawing,
+                     Windows=windows, Threading=threading)
@@ -0,0 +1,43 @@
+"""Checks of rhinoscript.curve results against the stand-in in standin/.
+
+    python -m unittest discover -s benchmarks
+"""
+import unittest
+
+import standin
+
+
+class CurveDeviationProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.doc = standin.install()
+
+    def add_line(self, x0, x1, y):
+        import Rhino
+        rg = Rhino.Geometry
+        return self.doc.Objects.AddCurve(rg.LineCurve(rg.Point3d(x0, y, 0), rg.Point3d(x1, y, 0)))
+
+    def test_longer_second_curve(self):
+        import rhinoscript.curve as curve
+        # every point of the short curve is 1 from the long one, but the long
+        # curve runs on 9 units past the end of the short one
+        short_id, long_id = self.add_line(0, 1, 0), self.add_line(0, 10, 1)
+        rc = curve.CurveDeviationProfile(short_id, long_id, 11)
+        self.assertEqual(len(rc), 7)
+        for distance in rc[2]: self.assertAlmostEqual(distance, 1.0, 6)
+        self.assertEqual(len(rc[3]), 11)
+        # the far end of the long curve is (9, 1) away from the short curve's end
+        self.assertAlmostEqual(max(rc[5]), 82**0.5, 6)
+        self.assertAlmostEqual(rc[6][0], 1.0, 6)
+        self.assertAlmostEqual(rc[6][1], 82**0.5, 6)
+
+    def test_profiles_match_single_profile(self):
+        import rhinoscript.curve as curve
+        a, b = self.add_line(0, 4, 0), self.add_line(-2, 3, 2)
+        single = curve.CurveDeviationProfile(a, b, 5)
+        profiles = curve.CurveDeviationProfiles([(a, b), (b, a)], 5, False)
+        self.assertEqual(profiles[0], single)
+        self.assertEqual(profiles[1][6][1], single[6][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
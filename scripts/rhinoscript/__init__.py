@@ -5,6 +5,38 @@ __all__ = ["application", "block", "curve", "dimension", "document", "geometry",
            "transformation", "userdata", "userinterface", "utility", "view"]
 
 
-import application, block, curve, dimension, document, geometry, grips, group
-import hatch, layer, line, linetype, light, mesh, object, plane, pointvector
-import selection, surface, transformation, userdata, userinterface, utility, view
\ No newline at end of file
+# Submodules, and the RhinoCommon and .NET assemblies they use, are imported
+# the first time they are used. Until then each name in __all__ is bound to a
+# placeholder. Importing a submodule binds its name to the submodule itself,
+# so the placeholder is only used until then. The package module itself is
+# never replaced, which keeps the importers of CPython and IronPython happy.
+import sys
+
+
+class _LazyModule(object):
+    "Placeholder for a submodule that imports it on first attribute access"
+    __slots__ = ("_fullname",)
+
+    def __init__(self, fullname):
+        super(_LazyModule, self).__setattr__("_fullname", fullname)
+
+    def _module(self):
+        __import__(self._fullname)
+        return sys.modules[self._fullname]
+
+    def __getattr__(self, name):
+        return getattr(self._module(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._module(), name, value)
+
+    def __dir__(self):
+        return dir(self._module())
+
+    def __repr__(self):
+        return repr(self._module())
+
+
+for _name in __all__:
+    globals()[_name] = _LazyModule(__name__ + "." + _name)
+del _name
@@ -191,7 +191,7 @@ def ExplodeBlockInstance(object_id):
     rc = scriptcontext.doc.Objects.AddExplodedInstancePieces(instance)
     if rc:
         scriptcontext.doc.Objects.Delete(instance, True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return rc
 
 
@@ -230,7 +230,7 @@ def InsertBlock2(block_name, xform):
     xform = rhutil.coercexform(xform, True)
     id = scriptcontext.doc.Objects.AddInstanceObject(idef.Index, xform )
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return id
 
 
@@ -20,7 +20,7 @@ def AddArc(plane, radius, angle_degrees):
     arc = Rhino.Geometry.Arc(plane, radius, radians)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -38,7 +38,7 @@ def AddArc3Pt(start, end, point_on_arc):
     arc = Rhino.Geometry.Arc(start, pton, end)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -54,7 +54,7 @@ def AddArcPtTanPt(start, direction, end):
     arc = Rhino.Geometry.Arc(start, direction, end)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -76,7 +76,7 @@ def AddBlendCurve(curves, parameters, reverses, continuities):
     curve = Rhino.Geometry.Curve.CreateBlendCurve(crv0, parameters[0], reverses[0], c0, crv1, parameters[1], reverses[1], c1)
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -103,7 +103,7 @@ def AddCircle(plane_or_center, radius):
         circle = Rhino.Geometry.Circle(plane, radius)
         rc = scriptcontext.doc.Objects.AddCircle(circle)
     if rc==System.Guid.Empty: raise Exception("Unable to add circle to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -120,7 +120,7 @@ def AddCircle3Pt(first, second, third):
     circle = Rhino.Geometry.Circle(start, end, third)
     rc = scriptcontext.doc.Objects.AddCircle(circle)
     if rc==System.Guid.Empty: raise Exception("Unable to add circle to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -137,7 +137,7 @@ def AddCurve(points, degree=3):
     if not curve: raise Exception("unable to create control point curve from given points")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -154,7 +154,7 @@ def AddEllipse(plane, radiusX, radiusY):
     ellipse = Rhino.Geometry.Ellipse(plane, radiusX, radiusY)
     rc = scriptcontext.doc.Objects.AddEllipse(ellipse)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -173,7 +173,7 @@ def AddEllipse3Pt(center, second, third):
     ellipse = Rhino.Geometry.Ellipse(center, second, third)
     rc = scriptcontext.doc.Objects.AddEllipse(ellipse)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -213,7 +213,7 @@ def AddFilletCurve(curve0id, curve1id, radius=1.0, base_point0=None, base_point1
     arc = Rhino.Geometry.Curve.CreateFillet(curve0, curve1, radius, crv0_t, crv1_t)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -235,7 +235,7 @@ def AddInterpCrvOnSrf(surface_id, points):
     if not curve: raise Exception("unable to create InterpolatedCurveOnSurface")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -257,7 +257,7 @@ def AddInterpCrvOnSrfUV(surface_id, points):
     if not curve: raise Exception("unable to create InterpolatedCurveOnSurfaceUV")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -296,7 +296,7 @@ def AddInterpCurve(points, degree=3, knotstyle=0, start_tangent=None, end_tangen
     if not curve: raise Exception("unable to CreateInterpolatedCurve")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -311,7 +311,7 @@ def AddLine(start, end):
     end = rhutil.coerce3dpoint(end, True)
     rc = scriptcontext.doc.Objects.AddLine(start, end)
     if rc==System.Guid.Empty: raise Exception("Unable to add line to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -343,7 +343,7 @@ def AddNurbsCurve(points, knots, degree, weights=None):
     for i in xrange(knotcount): nc.Knots[i] = knots[i]
     rc = scriptcontext.doc.Objects.AddCurve(nc)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -369,7 +369,7 @@ def AddPolyline(points, replace_id=None):
     else:
         rc = scriptcontext.doc.Objects.AddPolyline(points)
     if rc==System.Guid.Empty: raise Exception("Unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -387,7 +387,7 @@ def AddRectangle(plane, width, height):
     poly = rect.ToPolyline()
     rc = scriptcontext.doc.Objects.AddPolyline(poly)
     if rc==System.Guid.Empty: raise Exception("Unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -405,7 +405,7 @@ def AddSubCrv(curve_id, param0, param1):
     if not trimcurve: raise Exception("unable to trim curve")
     rc = scriptcontext.doc.Objects.AddCurve(trimcurve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -531,7 +531,7 @@ def CloseCurve(curve_id, tolerance=-1.0):
     if not curve.MakeClosed(tolerance): return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 def ClosedCurveOrientation(curve_id, direction=(0,0,1)):
@@ -608,6 +608,19 @@ def CurveArcLengthPoint(curve_id, length, from_start=True):
             dupe.Dispose()
 
 
+def __curveareamassproperties(curve_id):
+    tol = scriptcontext.doc.ModelAbsoluteTolerance
+    def compute():
+        curve = rhutil.coercecurve(curve_id, -1, True)
+        mp = Rhino.Geometry.AreaMassProperties.Compute(curve, tol)
+        if mp is None: raise Exception("unable to compute area mass properties")
+        try:
+            return mp.Area, mp.AreaError, mp.Centroid, mp.CentroidError
+        finally:
+            mp.Dispose()
+    return rhutil.measurement(curve_id, ("AreaMassProperties", tol), compute)
+
+
 def CurveArea(curve_id):
     """Returns area of closed planar curves. The results are based on the
     current drawing units.
@@ -620,10 +633,8 @@ def CurveArea(curve_id):
                  value will be the cumulative area.
         1        The absolute (+/-) error bound for the area.
     """
-    curve = rhutil.coercecurve(curve_id, -1, True)
-    tol = scriptcontext.doc.ModelAbsoluteTolerance
-    mp = Rhino.Geometry.AreaMassProperties.Compute(curve, tol)
-    return mp.Area, mp.AreaError
+    area, error, centroid, centroid_error = __curveareamassproperties(curve_id)
+    return area, error
 
 
 def CurveAreaCentroid(curve_id):
@@ -639,10 +650,8 @@ def CurveAreaCentroid(curve_id):
         1        A 3d vector with the absolute (+/-) error bound for the area
                  centroid.
     """
-    curve = rhutil.coercecurve(curve_id, -1, True)
-    tol = scriptcontext.doc.ModelAbsoluteTolerance
-    mp = Rhino.Geometry.AreaMassProperties.Compute(curve, tol)
-    return mp.Centroid, mp.CentroidError
+    area, error, centroid, centroid_error = __curveareamassproperties(curve_id)
+    return centroid, centroid_error
 
 
 def CurveArrows(curve_id, arrow_style=None):
@@ -673,7 +682,7 @@ def CurveArrows(curve_id, arrow_style=None):
             attr.ObjectDecoration = Rhino.DocObjects.ObjectDecoration.BothArrowhead
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.ModifyAttributes(id, attr, True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     if rc==Rhino.DocObjects.ObjectDecoration.None: return 0
     if rc==Rhino.DocObjects.ObjectDecoration.StartArrowhead: return 1
     if rc==Rhino.DocObjects.ObjectDecoration.EndArrowhead: return 2
@@ -700,7 +709,7 @@ def CurveBooleanDifference(curve_id_0, curve_id_1):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return curves
 
 
@@ -724,7 +733,7 @@ def CurveBooleanIntersection(curve_id_0, curve_id_1):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return curves
 
 
@@ -747,7 +756,7 @@ def CurveBooleanUnion(curve_id):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return curves
 
 
@@ -782,7 +791,7 @@ def CurveBrepIntersect(curve_id, brep_id, tolerance=None):
         if point and point.IsValid:
             rc = scriptcontext.doc.Objects.AddPoint(point)
             points.append(rc)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return curves, points
 
 
@@ -883,6 +892,83 @@ def CurveCurvature(curve_id, parameter):
     return point, tangent, center, radius, cv
 
 
+def __sampleparameters(curve, count):
+    """count parameters evenly spaced by arc length, or None on error. Open
+    curves are sampled at both ends. Closed curves do not repeat the seam
+    """
+    if curve.IsClosed: return curve.DivideByCount(count, True)
+    if count==1: return [curve.Domain.Min]
+    return curve.DivideByCount(count-1, True)
+
+
+def __curvaturesamples(curve, samples, adaptive):
+    "(parameters, points, curvature vectors, radii, inflection parameters) or None"
+    parameters = __sampleparameters(curve, samples)
+    if not parameters: return None
+    parameters = list(parameters)
+    curvatures = [curve.CurvatureAt(t) for t in parameters]
+    if adaptive:
+        # split intervals where the curvature vector changes by more than a
+        # tenth of the largest sampled curvature, up to 16 times as dense
+        threshold = 0.1*max(k.Length for k in curvatures)
+        for level in range(4):
+            refined_parameters = [parameters[0]]
+            refined_curvatures = [curvatures[0]]
+            for i in xrange(1, len(parameters)):
+                if threshold>0.0 and (curvatures[i] - curvatures[i-1]).Length>threshold:
+                    t = 0.5*(parameters[i-1] + parameters[i])
+                    refined_parameters.append(t)
+                    refined_curvatures.append(curve.CurvatureAt(t))
+                refined_parameters.append(parameters[i])
+                refined_curvatures.append(curvatures[i])
+            if len(refined_parameters)==len(parameters): break
+            parameters, curvatures = refined_parameters, refined_curvatures
+    points = [curve.PointAt(t) for t in parameters]
+    radii = []
+    for k in curvatures:
+        length = k.Length
+        if length<Rhino.RhinoMath.SqrtEpsilon: radii.append(None)
+        else: radii.append(1.0/length)
+    # inflections are where the curvature vector flips to the other side
+    inflections = []
+    previous = None
+    for t, k, radius in zip(parameters, curvatures, radii):
+        if radius is None: continue
+        if previous:
+            t0, k0 = previous
+            a = k0.Length
+            b = (k*k0)/a
+            if b<0.0: inflections.append(t0 + (t - t0)*a/(a - b))
+        previous = t, k
+    return parameters, points, curvatures, radii, inflections
+
+
+def CurveCurvatureSamples(curve_ids, samples=100, adaptive=False, parallel=True):
+    """Samples the curvature of many curves, for example to draw curvature
+    combs or to check the fairness of curves. See the Rhino help for details
+    on curve curvature
+    Parameters:
+      curve_ids = identifiers of the curves
+      samples [opt] = number of evenly spaced samples along each curve, at
+        least 2
+      adaptive [opt] = if True, samples are added where the curvature
+        changes quickly
+      parallel [opt] = if True, the curves are sampled on several threads
+    Returns:
+      list with the curvature information of every curve. The item is None
+      for curves that could not be sampled
+        element 0 = list of sample parameters
+        element 1 = list of points at the samples
+        element 2 = list of curvature vectors at the samples
+        element 3 = list of radii of curvature at the samples. The radius is
+                    None where the curve is straight
+        element 4 = list of parameters of the inflection points
+    """
+    if samples<2: raise ValueError("samples must be at least 2")
+    curves = [rhutil.coercecurve(id, -1, True) for id in curve_ids]
+    return rhutil.parallelmap(lambda curve: __curvaturesamples(curve, samples, adaptive), curves, parallel)
+
+
 def CurveCurveIntersection(curveA, curveB=None, tolerance=-1):
     """Calculates the intersection of two curve objects.
     Parameters:
@@ -929,6 +1015,11 @@ def CurveCurveIntersection(curveA, curveB=None, tolerance=-1):
         rc = Rhino.Geometry.Intersect.Intersection.CurveCurve(curveA, curveB, tolerance, 0.0)
     else:
         rc = Rhino.Geometry.Intersect.Intersection.CurveSelf(curveA, tolerance)
+    return __curveintersectionevents(rc)
+
+
+def __curveintersectionevents(rc):
+    "CurveIntersections converted to the tuples returned by CurveCurveIntersection"
     events = []
     if rc:
         for i in xrange(rc.Count):
@@ -981,6 +1072,78 @@ def CurveDeviation(curve_a, curve_b):
     return maxa, maxb, maxd, mina, minb, mind
 
 
+def __onesideddeviation(curve_a, curve_b, samples):
+    "(parameters on a, closest parameters on b, distances) or None"
+    parameters_a = __sampleparameters(curve_a, samples)
+    if not parameters_a: return None
+    parameters_a = list(parameters_a)
+    parameters_b = []
+    distances = []
+    for t in parameters_a:
+        point = curve_a.PointAt(t)
+        rc, s = curve_b.ClosestPoint(point)
+        if not rc: return None
+        parameters_b.append(s)
+        distances.append(point.DistanceTo(curve_b.PointAt(s)))
+    return parameters_a, parameters_b, distances
+
+
+def __deviationprofile(curve_a, curve_b, samples):
+    "both one sided deviations followed by statistics of all distances, or None"
+    a_to_b = __onesideddeviation(curve_a, curve_b, samples)
+    if a_to_b is None: return None
+    b_to_a = __onesideddeviation(curve_b, curve_a, samples)
+    if b_to_a is None: return None
+    distances = a_to_b[2] + b_to_a[2]
+    mean = sum(distances)/len(distances)
+    variance = sum((d-mean)*(d-mean) for d in distances)/len(distances)
+    statistics = min(distances), max(distances), mean, math.sqrt(variance)
+    return a_to_b + b_to_a + (statistics,)
+
+
+def CurveDeviationProfile(curve_a, curve_b, samples=100):
+    """Returns the deviation between two curves at evenly spaced samples
+    along both curves. Each curve is sampled and measured against the other,
+    so parts of either curve that are far from the other curve are found
+    Parameters:
+      curve_a, curve_b = identifiers of the curves to compare
+      samples [opt] = number of samples along each curve, at least 2
+    Returns:
+      tuple of deviation information on success
+        element 0 = list of curve_a parameters of the samples on curve_a
+        element 1 = list of curve_b parameters of their closest points
+        element 2 = list of distances from the samples on curve_a to curve_b
+        element 3 = list of curve_b parameters of the samples on curve_b
+        element 4 = list of curve_a parameters of their closest points
+        element 5 = list of distances from the samples on curve_b to curve_a
+        element 6 = tuple of (minimum, maximum, mean, standard deviation)
+                    of the distances in both directions
+      None on error
+    """
+    if samples<2: raise ValueError("samples must be at least 2")
+    curve_a = rhutil.coercecurve(curve_a, -1, True)
+    curve_b = rhutil.coercecurve(curve_b, -1, True)
+    rc = __deviationprofile(curve_a, curve_b, samples)
+    if rc is None: return scriptcontext.errorhandler()
+    return rc
+
+
+def CurveDeviationProfiles(curve_pairs, samples=100, parallel=True):
+    """Returns the deviation profiles of many pairs of curves. See
+    CurveDeviationProfile
+    Parameters:
+      curve_pairs = list of (curve_a, curve_b) identifier pairs
+      samples [opt] = number of samples along each curve, at least 2
+      parallel [opt] = if True, the pairs are measured on several threads
+    Returns:
+      list with the deviation information of every pair, as returned by
+      CurveDeviationProfile. The item is None for pairs that failed
+    """
+    if samples<2: raise ValueError("samples must be at least 2")
+    pairs = [(rhutil.coercecurve(a, -1, True), rhutil.coercecurve(b, -1, True)) for a, b in curve_pairs]
+    return rhutil.parallelmap(lambda pair: __deviationprofile(pair[0], pair[1], samples), pairs, parallel)
+
+
 def CurveDim(curve_id, segment_index=-1):
     """Returns the dimension of a curve object
     Parameters:
@@ -1167,6 +1330,72 @@ def CurveFrame(curve_id, parameter, segment_index=-1):
     return scriptcontext.errorhandler()
 
 
+def CurveFrames(curve_id, count_or_parameters, kind="rmf", segment_index=-1):
+    """Returns the planes at many parameters of a curve, computed in one pass
+    Parameters:
+      curve_id = identifier of the curve object
+      count_or_parameters = number of planes evenly spaced along the curve,
+        at least 2, or a list of parameters to evaluate
+      kind [opt] = the kind of planes
+        "frenet" = planes based on the tangent and curvature vectors, like
+                   CurveFrame
+        "perp" = perpendicular planes computed independently, like
+                 CurvePerpFrame
+        "rmf" = perpendicular, rotation minimizing planes. Each plane is the
+                previous plane carried along the curve without twisting
+      segment_index [opt] = the curve segment if curve_id identifies a polycurve
+    Returns:
+      tuple of four lists, parallel to the parameters, on success
+        element 0 = plane origins
+        element 1 = plane x axes
+        element 2 = plane y axes
+        element 3 = plane z axes. For "perp" and "rmf" planes, the tangents
+      None on error
+    """
+    if kind not in ("frenet", "perp", "rmf"): raise ValueError("kind must be frenet, perp or rmf")
+    curve = rhutil.coercecurve(curve_id, segment_index, True)
+    if isinstance(count_or_parameters, (int, long)):
+        if count_or_parameters<2: raise ValueError("count must be at least 2")
+        parameters = __sampleparameters(curve, count_or_parameters)
+        if not parameters: return scriptcontext.errorhandler()
+    else:
+        parameters = [float(t) for t in count_or_parameters]
+        if not parameters: raise ValueError("parameters must not be empty")
+    origins, x_axes, y_axes, z_axes = [], [], [], []
+    if kind!="rmf":
+        if kind=="frenet": frame_at = curve.FrameAt
+        else: frame_at = curve.PerpendicularFrameAt
+        for t in parameters:
+            rc, plane = frame_at(t)
+            if not rc: return scriptcontext.errorhandler()
+            origins.append(plane.Origin)
+            x_axes.append(plane.XAxis)
+            y_axes.append(plane.YAxis)
+            z_axes.append(plane.ZAxis)
+        return origins, x_axes, y_axes, z_axes
+    # double reflection method, Wang et al. 2008
+    rc, plane = curve.PerpendicularFrameAt(parameters[0])
+    if not rc: return scriptcontext.errorhandler()
+    point, tangent, x = plane.Origin, plane.ZAxis, plane.XAxis
+    for t in parameters:
+        next_point = curve.PointAt(t)
+        next_tangent = curve.TangentAt(t)
+        v1 = next_point - point
+        c1 = v1*v1
+        if c1>0.0:
+            x = x - v1*(2.0*(v1*x)/c1)
+            tangent = tangent - v1*(2.0*(v1*tangent)/c1)
+        v2 = next_tangent - tangent
+        c2 = v2*v2
+        if c2>0.0: x = x - v2*(2.0*(v2*x)/c2)
+        point, tangent = next_point, next_tangent
+        origins.append(point)
+        x_axes.append(x)
+        y_axes.append(Rhino.Geometry.Vector3d.CrossProduct(tangent, x))
+        z_axes.append(tangent)
+    return origins, x_axes, y_axes, z_axes
+
+
 def CurveKnotCount(curve_id, segment_index=-1):
     """Returns the knot count of a curve object.
     Parameters:
@@ -1212,12 +1441,14 @@ def CurveLength(curve_id, segment_index=-1, sub_domain=None):
       None if not successful, or on error.
     """
     curve = rhutil.coercecurve(curve_id, segment_index, True)
-    if sub_domain:
-        if len(sub_domain)==2:
+    if sub_domain and len(sub_domain)!=2: return scriptcontext.errorhandler()
+    def length():
+        if sub_domain:
             dom = Rhino.Geometry.Interval(sub_domain[0], sub_domain[1])
             return curve.GetLength(dom)
-        return scriptcontext.errorhandler()
-    return curve.GetLength()
+        return curve.GetLength()
+    key = "CurveLength", segment_index, sub_domain and (sub_domain[0], sub_domain[1])
+    return rhutil.measurement(curve_id, key, length)
 
 
 def CurveMidPoint(curve_id, segment_index=-1):
@@ -1235,6 +1466,63 @@ def CurveMidPoint(curve_id, segment_index=-1):
     return scriptcontext.errorhandler()
 
 
+def __overlappingboxes(boxes):
+    "sweep and prune: sorted index pairs (i, j), i<j, of the boxes that overlap"
+    extents = [(b.Min.X, b.Max.X, b.Min.Y, b.Max.Y, b.Min.Z, b.Max.Z) for b in boxes]
+    order = sorted(xrange(len(extents)), key=lambda i: extents[i][0])
+    pairs = []
+    active = []
+    for i in order:
+        x0, x1, y0, y1, z0, z1 = extents[i]
+        active = [j for j in active if extents[j][1]>=x0]
+        for j in active:
+            e = extents[j]
+            if e[2]<=y1 and y0<=e[3] and e[4]<=z1 and z0<=e[5]:
+                pairs.append((j, i) if j<i else (i, j))
+        active.append(i)
+    pairs.sort()
+    return pairs
+
+
+def CurveNetworkIntersections(curve_ids, tolerance=-1, parallel=True):
+    """Calculates the intersections between every pair of curves in a list.
+    Only pairs of curves with overlapping bounding boxes are intersected,
+    which is much faster than calling CurveCurveIntersection for all pairs
+    Parameters:
+      curve_ids = identifiers of the curve objects
+      tolerance [opt] = The absolute tolerance in drawing units. If omitted,
+                        the document's current absolute tolerance is used.
+      parallel [opt] = If True, the candidate pairs are intersected on
+                       several threads
+    Returns:
+      A list of tuples of intersection information if successful. Elements
+      [n][0] to [n][8] are the same as the ones returned by
+      CurveCurveIntersection, with the pair's curve at index [n][9] as the
+      first curve and the curve at index [n][10] as the second.
+        [n][9]  Number   Index in curve_ids of the first curve
+        [n][10] Number   Index in curve_ids of the second curve
+      The events are sorted by the two indices
+    """
+    curves = [rhutil.coercecurve(id, -1, True) for id in curve_ids]
+    if tolerance is None or tolerance<0.0:
+        tolerance = scriptcontext.doc.ModelAbsoluteTolerance
+    boxes = []
+    for curve in curves:
+        box = curve.GetBoundingBox(True)
+        box.Inflate(tolerance)
+        boxes.append(box)
+    pairs = __overlappingboxes(boxes)
+    intersect = Rhino.Geometry.Intersect.Intersection.CurveCurve
+    def intersection(pair):
+        return intersect(curves[pair[0]], curves[pair[1]], tolerance, 0.0)
+    results = rhutil.parallelmap(intersection, pairs, parallel)
+    events = []
+    for pair, rc in zip(pairs, results):
+        for event in __curveintersectionevents(rc):
+            events.append(event + pair)
+    return events
+
+
 def CurveNormal(curve_id, segment_index=-1):
     """Returns the normal direction of the plane in which a planar curve object lies.
     Parameters:
@@ -1395,7 +1683,7 @@ def CurveStartPoint(curve_id, segment_index=-1, point=None):
         if point and curve.SetStartPoint(point):
             curve_id = rhutil.coerceguid(curve_id, True)
             scriptcontext.doc.Objects.Replace(curve_id, curve)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -1527,7 +1815,7 @@ def DivideCurve(curve_id, segments, create_points=False, return_points=True):
         if create_points:
             for point in outputpoints:
                 if point.IsValid: scriptcontext.doc.Objects.AddPoint(point)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -1548,7 +1836,7 @@ def DivideCurveEquidistant(curve_id, distance, create_points=False, return_point
     if not points: return scriptcontext.errorhandler()
     if create_points:
         for point in points: scriptcontext.doc.Objects.AddPoint(point)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     if return_points: return points
     tvals = []
     for point in points:
@@ -1585,6 +1873,106 @@ def DivideCurveLength(curve_id, length, create_points=False, return_points=True)
     return rc
 
 
+def __dividecurves(curve_ids, divide, create_points, return_points, parallel):
+    "runs divide(curve) -> (parameters, points) over curves on a thread pool"
+    ids = []
+    seen = set()
+    for id in curve_ids:
+        id = rhutil.coerceguid(id, True)
+        if id not in seen:
+            seen.add(id)
+            ids.append(id)
+    # look the curves up here, the worker threads only read their geometry
+    curves = [rhutil.coercecurve(id, -1, True) for id in ids]
+    results = rhutil.parallelmap(divide, curves, parallel)
+    rc = {}
+    for id, result in zip(ids, results):
+        if result is None: rc[id] = None
+        elif return_points: rc[id] = result[1]
+        else: rc[id] = result[0]
+    if create_points:
+        points = [point for result in results if result for point in result[1] if point.IsValid]
+        for point in points: scriptcontext.doc.Objects.AddPoint(point)
+        rhutil.redraw()
+    return rc
+
+
+def DivideCurves(curve_ids, segments, create_points=False, return_points=True, parallel=True):
+    """Divides many curve objects into a specified number of segments. The
+    divisions are computed on several threads and all division points are
+    added to the document with a single redraw
+    Parameters:
+      curve_ids = identifiers of the curve objects
+      segments = The number of segments of each curve.
+      create_points [opt] = Create the division points. If omitted or False,
+          points are not created.
+      return_points [opt] = If omitted or True, points are returned.
+          If False, then lists of curve parameters are returned.
+      parallel [opt] = If False, all curves are divided on the calling thread
+    Returns:
+      dictionary mapping the Guid of each curve to a list of 3D division
+      points or curve parameters, based on the value of return_points. The
+      value is None for curves that could not be divided
+    """
+    compute_points = return_points or create_points
+    def divide(curve):
+        parameters = curve.DivideByCount(segments, True)
+        if not parameters: return None
+        if not compute_points: return parameters, None
+        return parameters, [curve.PointAt(t) for t in parameters]
+    return __dividecurves(curve_ids, divide, create_points, return_points, parallel)
+
+
+def DivideCurvesEquidistant(curve_ids, distance, create_points=False, return_points=True, parallel=True):
+    """Divides many curves such that the linear distance between the points is
+    equal. The divisions are computed on several threads and all division
+    points are added to the document with a single redraw
+    Parameters:
+      curve_ids = identifiers of the curve objects
+      distance = linear distance between division points
+      create_points[opt] = create the division points
+      return_points[opt] = If True, return lists of points.
+          If False, return lists of curve parameters
+      parallel[opt] = If False, all curves are divided on the calling thread
+    Returns:
+      dictionary mapping the Guid of each curve to a list of points or curve
+      parameters based on the value of return_points. The value is None for
+      curves that could not be divided
+    """
+    def divide(curve):
+        points = curve.DivideEquidistant(distance)
+        if not points: return None
+        if return_points: return None, points
+        return [curve.ClosestPoint(point)[1] for point in points], points
+    return __dividecurves(curve_ids, divide, create_points, return_points, parallel)
+
+
+def DivideCurvesLength(curve_ids, length, create_points=False, return_points=True, parallel=True):
+    """Divides many curve objects into segments of a specified length. The
+    divisions are computed on several threads and all division points are
+    added to the document with a single redraw
+    Parameters:
+      curve_ids = identifiers of the curve objects
+      length = The length of each segment.
+      create_points [opt] = Create the division points. If omitted or False,
+          points are not created.
+      return_points [opt] = If omitted or True, points are returned.
+          If False, then lists of curve parameters are returned.
+      parallel [opt] = If False, all curves are divided on the calling thread
+    Returns:
+      dictionary mapping the Guid of each curve to a list of 3D division
+      points or curve parameters, based on the value of return_points. The
+      value is None for curves that could not be divided
+    """
+    compute_points = return_points or create_points
+    def divide(curve):
+        parameters = curve.DivideByLength(length, True)
+        if not parameters: return None
+        if not compute_points: return parameters, None
+        return parameters, [curve.PointAt(t) for t in parameters]
+    return __dividecurves(curve_ids, divide, create_points, return_points, parallel)
+
+
 def EllipseCenterPoint(curve_id):
     """Returns the center point of an elliptical-shaped curve object.
     Parameters:
@@ -1625,6 +2013,35 @@ def EvaluateCurve(curve_id, t, segment_index=-1):
     return curve.PointAt(t)
 
 
+def EvaluateCurveMany(curve_id, parameters, derivatives=0, segment_index=-1):
+    """Evaluates a curve at many parameters. The curve is only looked up once,
+    which makes this much faster than calling EvaluateCurve, CurveTangent and
+    CurveCurvature for every parameter
+    Parameters:
+      curve_id = identifier of the curve object
+      parameters = list of parameters to evaluate
+      derivatives [opt] = what to compute at each parameter
+        0 = points only
+        1 = points and unit tangent vectors
+        2 = points, unit tangent vectors and curvature vectors
+      segment_index [opt] = the curve segment if curve_id identifies a polycurve
+    Returns:
+      list of 3D points if derivatives is 0
+      tuple of (points, tangents) if derivatives is 1
+      tuple of (points, tangents, curvatures) if derivatives is 2
+      The lists are parallel to parameters.
+    """
+    if derivatives not in (0, 1, 2): raise ValueError("derivatives must be 0, 1 or 2")
+    curve = rhutil.coercecurve(curve_id, segment_index, True)
+    parameters = [float(t) for t in parameters]
+    points = map(curve.PointAt, parameters)
+    if derivatives==0: return points
+    tangents = map(curve.TangentAt, parameters)
+    if derivatives==1: return points, tangents
+    curvatures = map(curve.CurvatureAt, parameters)
+    return points, tangents, curvatures
+
+
 def ExplodeCurves(curve_ids, delete_input=False):
     """Explodes, or un-joins, one curves. Polycurves will be exploded into curve
     segments. Polylines will be exploded into line segments. ExplodeCurves will
@@ -1647,7 +2064,7 @@ def ExplodeCurves(curve_ids, delete_input=False):
             if delete_input:
                 id = rhutil.coerceguid(id, True)
                 scriptcontext.doc.Objects.Delete(id, True)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -1681,7 +2098,7 @@ def ExtendCurve(curve_id, extension_type, side, boundary_object_ids):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -1713,7 +2130,7 @@ def ExtendCurveLength(curve_id, extension_type, side, length):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -1741,7 +2158,7 @@ def ExtendCurvePoint(curve_id, side, point):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace( curve_id, newcurve ):
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -1767,7 +2184,7 @@ def FairCurve(curve_id, tolerance=1.0):
     if not newcurve: return False
     curve_id = rhutil.coerceguid(curve_id, True)
     if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return True
     return False
 
@@ -1805,7 +2222,7 @@ def FitCurve(curve_id, degree=3, distance_tolerance=-1, angle_tolerance=-1):
         else:
             rc = scriptcontext.doc.Objects.AddCurve(curve)
         if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return rc
     return scriptcontext.errorhandler()
 
@@ -1835,7 +2252,7 @@ def InsertCurveKnot(curve_id, parameter, symmetrical=False ):
         if rc:
             curve_id = rhutil.coerceguid(curve_id)
             rc = scriptcontext.doc.Objects.Replace(curve_id, nc)
-            if rc: scriptcontext.doc.Views.Redraw()
+            if rc: rhutil.redraw()
     return rc
 
 
@@ -2018,6 +2435,40 @@ def IsPolyline( object_id, segment_index=-1 ):
     return isinstance(curve, Rhino.Geometry.PolylineCurve)
 
 
+def __joingroups(curves, tolerance):
+    """Groups of indices of curves that are connected by end points within
+    tolerance of each other, ordered by their first curve. End points are
+    hashed into a grid with cells the size of the tolerance, so each end
+    point is only compared with the end points in the neighbouring cells
+    """
+    parent = range(len(curves))
+    def root(i):
+        while parent[i]!=i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    size = max(tolerance, Rhino.RhinoMath.ZeroTolerance)
+    tolerance2 = tolerance*tolerance
+    neighbours = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+    grid = {}
+    for index, curve in enumerate(curves):
+        for point in (curve.PointAtStart, curve.PointAtEnd):
+            x, y, z = point.X, point.Y, point.Z
+            cx, cy, cz = int(math.floor(x/size)), int(math.floor(y/size)), int(math.floor(z/size))
+            for i, j, k in neighbours:
+                for other, ox, oy, oz in grid.get((cx+i, cy+j, cz+k), ()):
+                    if (ox-x)*(ox-x) + (oy-y)*(oy-y) + (oz-z)*(oz-z)>tolerance2: continue
+                    a, b = root(index), root(other)
+                    # the smallest index is the root of its group
+                    if a<b: parent[b] = a
+                    elif b<a: parent[a] = b
+            grid.setdefault((cx, cy, cz), []).append((index, x, y, z))
+    groups = {}
+    for index in xrange(len(curves)):
+        groups.setdefault(root(index), []).append(index)
+    return [groups[first] for first in sorted(groups)]
+
+
 def JoinCurves(object_ids, delete_input=False, tolerance=None):
     """Joins multiple curves together to form one or more curves or polycurves
     Parameters:
@@ -2032,15 +2483,16 @@ def JoinCurves(object_ids, delete_input=False, tolerance=None):
     curves = [rhutil.coercecurve(id, -1, True) for id in object_ids]
     if tolerance is None:
         tolerance = 2.1 * scriptcontext.doc.ModelAbsoluteTolerance
-    newcurves = Rhino.Geometry.Curve.JoinCurves(curves, tolerance)
-    rc = []
-    if newcurves:
-        rc = [scriptcontext.doc.Objects.AddCurve(crv) for crv in newcurves]
+    newcurves = []
+    for group in __joingroups(curves, tolerance):
+        joined = Rhino.Geometry.Curve.JoinCurves([curves[i] for i in group], tolerance)
+        if joined: newcurves.extend(joined)
+    rc = [scriptcontext.doc.Objects.AddCurve(crv) for crv in newcurves]
     if rc and delete_input:
         for id in object_ids:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, False)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -2087,7 +2539,7 @@ def MakeCurveNonPeriodic(curve_id, delete_input=False):
             if rhobj: attrs = rhobj.Attributes
         rc = scriptcontext.doc.Objects.AddCurve(nc, attrs)
         if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -2106,7 +2558,7 @@ def MeanCurve(curve0, curve1, tolerance=None):
     crv = Rhino.Geometry.Curve.CreateMeanCurve(curve0,curve1,tolerance)
     if crv:
         rc = scriptcontext.doc.Objects.AddCurve(crv)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return rc
 
 
@@ -2123,7 +2575,7 @@ def MeshPolyline(polyline_id):
     mesh = Rhino.Geometry.Mesh.CreateFromPlanarBoundary(curve)
     if not mesh: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddMesh(mesh)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -2152,7 +2604,7 @@ def OffsetCurve(object_id, direction, distance, normal=None, style=1):
     curves = curve.Offset(direction, normal, distance, tolerance, style)
     if curves is None: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddCurve(curve) for curve in curves]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -2181,7 +2633,7 @@ def OffsetCurveOnSurface(curve_id, surface_id, distance_or_parameter):
     curves = curve.OffsetOnSurface(surface, x, tol)
     if curves is None: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddCurve(curve) for curve in curves]
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -2234,6 +2686,50 @@ def PlanarCurveCollision(curve_a, curve_b, plane=None, tolerance=None):
     return Rhino.Geometry.Curve.PlanarCurveCollision(curve_a, curve_b, plane, tolerance)
 
 
+def PlanarCurveRelationships(curve_ids, plane=None, tolerance=None, parallel=True):
+    """Determines the relationships between all pairs of coplanar curves in a
+    list. Pairs of curves with bounding boxes that do not overlap are known
+    to be disjoint and are not tested, which is much faster than calling
+    PlanarClosedCurveContainment or PlanarCurveCollision for every pair
+    Parameters:
+      curve_ids = identifiers of planar curves
+      plane[opt] = test plane. If omitted, the currently active construction
+        plane is used
+      tolerance[opt] = if omitted, the document absolute tolerance is used
+      parallel[opt] = if True, the pairs are tested on several threads
+    Returns:
+      dictionary mapping pairs of indices (i, j) into curve_ids, with i less
+      than j, to a number identifying the relationship of curve i (a) and
+      curve j (b). Disjoint pairs are left out.
+        1 = the two curves intersect
+        2 = the region bounded by curve a is inside of curve b
+        3 = the region bounded by curve b is inside of curve a
+      Pairs that include an open curve can only be 1
+    """
+    curves = [rhutil.coercecurve(id, -1, True) for id in curve_ids]
+    if tolerance is None or tolerance<=0:
+        tolerance = scriptcontext.doc.ModelAbsoluteTolerance
+    if plane:
+        plane = rhutil.coerceplane(plane)
+    else:
+        plane = scriptcontext.doc.Views.ActiveView.ActiveViewport.ConstructionPlane()
+    boxes = []
+    for curve in curves:
+        box = curve.GetBoundingBox(True)
+        box.Inflate(tolerance)
+        boxes.append(box)
+    closed = [curve.IsClosed for curve in curves]
+    def relationship(pair):
+        a, b = pair
+        if closed[a] and closed[b]:
+            return int(Rhino.Geometry.Curve.PlanarClosedCurveRelationship(curves[a], curves[b], plane, tolerance))
+        if Rhino.Geometry.Curve.PlanarCurveCollision(curves[a], curves[b], plane, tolerance): return 1
+        return 0
+    pairs = __overlappingboxes(boxes)
+    results = rhutil.parallelmap(relationship, pairs, parallel)
+    return dict((pair, rc) for pair, rc in zip(pairs, results) if rc)
+
+
 def PointInPlanarClosedCurve(point, curve, plane=None, tolerance=None):
     """Determines if a point is inside of a closed curve, on a closed curve, or
     outside of a closed curve
@@ -2264,6 +2760,103 @@ def PointInPlanarClosedCurve(point, curve, plane=None, tolerance=None):
     return 2
 
 
+def __polygonindex(curve, plane, tolerance, angle_tolerance):
+    """Converts a closed curve to a polygon in plane coordinates and sorts its
+    edges into horizontal bands. Every band lists the edges that come within
+    tolerance of it. Returns (bounding rectangle, band height, bands)
+    """
+    rc, polyline = curve.TryGetPolyline()
+    if not rc:
+        polyline = curve.ToPolyline(0.5*tolerance, angle_tolerance, 0.0, 0.0)
+        if polyline is None: raise Exception("unable to convert curve to a polyline")
+        rc, polyline = polyline.TryGetPolyline()
+    vertices = []
+    for point in polyline:
+        rc, u, v = plane.ClosestParameter(point)
+        vertices.append((u, v))
+    edges = [a + b for a, b in zip(vertices, vertices[1:])]
+    us = [u for u, v in vertices]
+    vs = [v for u, v in vertices]
+    rectangle = min(us)-tolerance, min(vs)-tolerance, max(us)+tolerance, max(vs)+tolerance
+    count = max(1, len(edges))
+    height = (rectangle[3] - rectangle[1])/count
+    bands = [[] for i in xrange(count)]
+    for edge in edges:
+        first = int((min(edge[1], edge[3]) - tolerance - rectangle[1])/height)
+        last = int((max(edge[1], edge[3]) + tolerance - rectangle[1])/height)
+        for band in xrange(max(first, 0), min(last, count-1)+1):
+            bands[band].append(edge)
+    return rectangle, height, bands
+
+
+def __classifypoints(index, points, tolerance):
+    "0 (outside), 1 (inside) or 2 (on the polygon) for every (u, v) point"
+    (u0, v0, u1, v1), height, bands = index
+    last = len(bands) - 1
+    tolerance2 = tolerance*tolerance
+    rc = []
+    for u, v in points:
+        if u<u0 or u>u1 or v<v0 or v>v1:
+            rc.append(0)
+            continue
+        code = 0
+        for au, av, bu, bv in bands[min(int((v - v0)/height), last)]:
+            du, dv = bu - au, bv - av
+            length2 = du*du + dv*dv
+            t = ((u - au)*du + (v - av)*dv)/length2 if length2 else 0.0
+            t = min(max(t, 0.0), 1.0)
+            cu, cv = au + t*du - u, av + t*dv - v
+            if cu*cu + cv*cv<=tolerance2:
+                code = 2
+                break
+            # crossings of a ray from the point in the +u direction
+            if (av>v)!=(bv>v) and au + (v - av)*du/dv>u: code = 1 - code
+        rc.append(code)
+    return rc
+
+
+def PointsInPlanarClosedCurves(points, curves, plane=None, tolerance=None, parallel=True):
+    """Determines for many points if they are inside of, on, or outside of
+    many closed curves. Each curve is converted to a polygon within tolerance
+    once and its edges are indexed, which is much faster than calling
+    PointInPlanarClosedCurve for every point and curve
+    Parameters:
+      points = list of points to test
+      curves = identifiers of closed, planar curve objects
+      plane[opt] = plane containing the closed curves and points. If omitted,
+          the currently active construction plane is used
+      tolerance[opt] = if omitted, the document absolute tolerance is used
+      parallel[opt] = if True, the curves are processed on several threads
+    Returns:
+      list with a list of numbers for every point, one for every curve
+          0 = point is outside of the curve
+          1 = point is inside of the curve
+          2 = point in on the curve
+    """
+    points = rhutil.coerce3dpointlist(points, True)
+    curves = [rhutil.coercecurve(id, -1, True) for id in curves]
+    if tolerance is None or tolerance<=0:
+        tolerance = scriptcontext.doc.ModelAbsoluteTolerance
+    for curve in curves:
+        if not curve.IsClosed: raise ValueError("curves must be closed")
+        if not curve.IsPlanar(tolerance): raise ValueError("curves must be planar")
+    if plane:
+        plane = rhutil.coerceplane(plane)
+    else:
+        plane = scriptcontext.doc.Views.ActiveView.ActiveViewport.ConstructionPlane()
+    angle_tolerance = scriptcontext.doc.ModelAngleToleranceRadians
+    uv = []
+    for point in points:
+        rc, u, v = plane.ClosestParameter(point)
+        uv.append((u, v))
+    if not curves: return [[] for point in uv]
+    def classify(curve):
+        index = __polygonindex(curve, plane, tolerance, angle_tolerance)
+        return __classifypoints(index, uv, tolerance)
+    columns = rhutil.parallelmap(classify, curves, parallel)
+    return [list(row) for row in zip(*columns)]
+
+
 def PolyCurveCount(curve_id, segment_index=-1):
     """Returns the number of curve segments that make up a polycurve"""
     curve = rhutil.coercecurve(curve_id, segment_index, True)
@@ -2296,7 +2889,7 @@ def ProjectCurveToMesh(curve_ids, mesh_ids, direction):
     tolerance = scriptcontext.doc.ModelAbsoluteTolerance
     newcurves = Rhino.Geometry.Curve.ProjectToMesh(curves, meshes, direction, tolerance)
     ids = [scriptcontext.doc.Objects.AddCurve(curve) for curve in newcurves]
-    if ids: scriptcontext.doc.Views.Redraw()
+    if ids: rhutil.redraw()
     return ids
 
 
@@ -2317,7 +2910,7 @@ def ProjectCurveToSurface(curve_ids, surface_ids, direction):
     tolerance = scriptcontext.doc.ModelAbsoluteTolerance
     newcurves = Rhino.Geometry.Curve.ProjectToBrep(curves, breps, direction, tolerance)
     ids = [scriptcontext.doc.Objects.AddCurve(curve) for curve in newcurves]
-    if ids: scriptcontext.doc.Views.Redraw()
+    if ids: rhutil.redraw()
     return ids
 
 
@@ -2336,7 +2929,7 @@ def RebuildCurve(curve_id, degree=3, point_count=10):
     newcurve = curve.Rebuild(point_count, degree, False)
     if not newcurve: return False
     scriptcontext.doc.Objects.Replace(curve_id, newcurve)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return True
 
 
@@ -2371,7 +2964,7 @@ def SimplifyCurve(curve_id, flags=0):
     if newcurve:
         curve_id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Replace(curve_id, newcurve)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return True
     return False
 
@@ -2397,7 +2990,7 @@ def SplitCurve(curve_id, parameter, delete_input=True):
     if rc and delete_input:
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -2426,5 +3019,5 @@ def TrimCurve(curve_id, interval, delete_input=True):
     if delete_input:
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
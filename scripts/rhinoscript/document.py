@@ -149,7 +149,7 @@ def RenderColor(item, color=None):
         if item==0: settings.AmbientLight = color
         else: settings.BackgroundColorTop = color
         scriptcontext.doc.RenderSettings = settings
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
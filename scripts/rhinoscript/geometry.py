@@ -44,7 +44,7 @@ def AddClippingPlane(plane, u_magnitude, v_magnitude, views=None):
     if not viewlist: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddClippingPlane(plane, u_magnitude, v_magnitude, viewlist)
     if rc==System.Guid.Empty: raise Exception("unable to add clipping plane to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -59,7 +59,7 @@ def AddPoint(point, y=None, z=None):
     point = rhutil.coerce3dpoint(point, True)
     rc = scriptcontext.doc.Objects.AddPoint(point)
     if rc==System.Guid.Empty: raise Exception("unable to add point to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -80,7 +80,7 @@ def AddPointCloud(points, colors=None):
         points = pc
     rc = scriptcontext.doc.Objects.AddPointCloud(points)
     if rc==System.Guid.Empty: raise Exception("unable to add point cloud to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -93,7 +93,7 @@ def AddPoints(points):
     """
     points = rhutil.coerce3dpointlist(points, True)
     rc = [scriptcontext.doc.Objects.AddPoint(point) for point in points]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -132,7 +132,7 @@ def AddText(text, point_or_plane, height=1.0, font="Arial", font_style=0, justif
         just = System.Enum.ToObject(Rhino.Geometry.TextJustification, justification)
         id = scriptcontext.doc.Objects.AddText(text, plane, height, font, bold, italic, just)
     if id==System.Guid.Empty: raise ValueError("unable to add text to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -149,16 +149,21 @@ def AddTextDot(text, point):
     if not isinstance(text, str): text = str(text)
     rc = scriptcontext.doc.Objects.AddTextDot(text, point)
     if id==System.Guid.Empty: raise ValueError("unable to add text dot to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
 def Area(object_id):
     "Compute the area of a closed curve, hatch, surface, polysurface, or mesh"
-    rhobj = rhutil.coercerhinoobject(object_id, True, True)
-    mp = Rhino.Geometry.AreaMassProperties.Compute(rhobj.Geometry)
-    if mp is None: raise Exception("unable to compute area mass properties")
-    return mp.Area
+    def area():
+        rhobj = rhutil.coercerhinoobject(object_id, True, True)
+        mp = Rhino.Geometry.AreaMassProperties.Compute(rhobj.Geometry)
+        if mp is None: raise Exception("unable to compute area mass properties")
+        try:
+            return mp.Area
+        finally:
+            mp.Dispose()
+    return rhutil.measurement(object_id, ("Area",), area)
 
 
 def BoundingBox(objects, view_or_plane=None, in_world_coords=True):
@@ -232,7 +237,7 @@ def ExplodeText(text_id, delete=False):
     attr = rhobj.Attributes
     rc = [scriptcontext.doc.Objects.AddCurve(curve,attr) for curve in curves]
     if delete: scriptcontext.doc.Objects.Delete(rhobj,True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -334,7 +339,7 @@ def PointCoordinates(object_id, point=None):
             point = rhutil.coerce3dpoint(point, True)
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, point)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
         return rc
     return scriptcontext.errorhandler()
 
@@ -356,7 +361,7 @@ def TextDotPoint(object_id, point=None):
             textdot.Point = rhutil.coerce3dpoint(point, True)
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
         return rc
     return scriptcontext.errorhandler()
 
@@ -379,7 +384,7 @@ def TextDotText(object_id, text=None):
             textdot.Text = text
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
         return rc
     return scriptcontext.errorhandler()
 
@@ -405,7 +410,7 @@ def TextObjectFont(object_id, font=None):
         annotation.FontIndex = index
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -427,7 +432,7 @@ def TextObjectHeight(object_id, height=None):
         annotation.TextHeight = height
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -449,7 +454,7 @@ def TextObjectPlane(object_id, plane=None):
         annotation.Plane = rhutil.coerceplane(plane, True)
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -473,7 +478,7 @@ def TextObjectPoint(object_id, point=None):
         text.Plane = plane
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, text)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -503,7 +508,7 @@ def TextObjectStyle(object_id, style=None):
         annotation.FontIndex = index
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -526,5 +531,5 @@ def TextObjectText(object_id, text=None):
         annotation.Text = text
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
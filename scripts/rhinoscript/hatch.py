@@ -53,7 +53,7 @@ def AddHatches(curve_ids, hatch_pattern=None, scale=1.0, rotation=0.0):
         if id==System.Guid.Empty: continue
         ids.append(id)
     if not ids: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return ids
 
 
@@ -146,7 +146,7 @@ def HatchPattern(hatch_id, hatch_pattern=None):
         if new_index<0: return scriptcontext.errorhandler()
         hatchobj.HatchGeometry.PatternIndex = new_index
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return scriptcontext.doc.HatchPatterns[old_index].Name
 
 
@@ -208,7 +208,7 @@ def HatchRotation(hatch_id, rotation=None):
         rotation = Rhino.RhinoMath.ToRadians(rotation)
         hatchobj.HatchGeometry.PatternRotation = rotation
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -230,7 +230,7 @@ def HatchScale(hatch_id, scale=None):
     if scale and scale!=rc:
         hatchobj.HatchGeometry.PatternScale = scale
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
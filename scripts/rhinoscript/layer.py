@@ -212,7 +212,7 @@ def LayerColor(layer, color=None):
         color = rhutil.coercecolor(color)
         layer.Color = color
         if scriptcontext.doc.Layers.Modify(layer, layer.LayerIndex, False):
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -239,7 +239,7 @@ def LayerLinetype(layer, linetype=None):
         if index==-1: return scriptcontext.errorhandler()
         layer.LinetypeIndex = index
         layer.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -257,7 +257,7 @@ def LayerLocked(layer, locked=None):
     if locked!=None and locked!=rc:
         layer.IsLocked = locked
         layer.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -316,7 +316,7 @@ def LayerPrintColor(layer, color=None):
         color = rhutil.coercecolor(color)
         layer.PlotColor = color
         layer.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -335,7 +335,7 @@ def LayerPrintWidth(layer, width=None):
     if width is not None and width!=rc:
         layer.PlotWeight = width
         layer.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -356,7 +356,7 @@ def LayerVisible(layer, visible=None, force_visible=False):
         else:
             layer.IsVisible = visible
             layer.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
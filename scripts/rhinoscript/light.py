@@ -27,7 +27,7 @@ def AddDirectionalLight(start_point, end_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -66,7 +66,7 @@ def AddLinearLight(start_point, end_point, width=None):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -84,7 +84,7 @@ def AddPointLight(point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -113,7 +113,7 @@ def AddRectangularLight(origin, width_point, height_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -138,7 +138,7 @@ def AddSpotLight(origin, radius, apex_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -159,7 +159,7 @@ def EnableLight(object_id, enable=None):
         id = rhutil.coerceguid(object_id)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 def IsDirectionalLight(object_id):
@@ -268,7 +268,7 @@ def LightColor(object_id, color=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -295,7 +295,7 @@ def LightDirection(object_id, direction=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -317,7 +317,7 @@ def LightLocation(object_id, location=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -337,7 +337,7 @@ def LightName(object_id, name=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -389,7 +389,7 @@ def SpotLightHardness(object_id, hardness=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -413,7 +413,7 @@ def SpotLightRadius(object_id, radius=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -435,5 +435,5 @@ def SpotLightShadowIntensity(object_id, intensity=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
@@ -49,7 +49,7 @@ def AddMesh(vertices, face_vertices, vertex_normals=None, texture_coordinates=No
         mesh.VertexColors.SetColors(colors)
     rc = scriptcontext.doc.Objects.AddMesh(mesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -67,7 +67,7 @@ def AddPlanarMesh(object_id, delete_input=False):
     if not mesh: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddMesh(mesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -124,7 +124,7 @@ def DuplicateMeshBorder(mesh_id):
         for polyline in polylines:
             id = scriptcontext.doc.Objects.AddPolyline(polyline)
             if id!=System.Guid.Empty: rc.append(id)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -151,7 +151,7 @@ def ExplodeMeshes(mesh_ids, delete=False):
                 for submesh in submeshes:
                     id = scriptcontext.doc.Objects.AddMesh(submesh)
                     if id!=System.Guid.Empty: rc.append(id)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -262,7 +262,7 @@ def MeshBooleanDifference(input0, input1, delete_input=True):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -291,7 +291,7 @@ def MeshBooleanIntersection(input0, input1, delete_input=True):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -321,7 +321,7 @@ def MeshBooleanSplit(input0, input1, delete_input=True):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -344,7 +344,7 @@ def MeshBooleanUnion(mesh_ids, delete_input=True):
         for id in mesh_ids:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -550,7 +550,7 @@ def MeshOffset(mesh_id, distance):
     if offsetmesh is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddMesh(offsetmesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -573,7 +573,7 @@ def MeshOutline(object_ids, view=None):
         for polyline in polylines:
             id = scriptcontext.doc.Objects.AddPolyline(polyline)
             rc.append(id)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -600,7 +600,7 @@ def MeshQuadsToTriangles(object_id):
         if rc:
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, mesh)
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 # [skipping for now] MeshTextureCoordinates
@@ -639,7 +639,7 @@ def MeshVertexColors(mesh_id, colors=0):
         for c in colors: mesh.VertexColors.Add(c)
         id = rhutil.coerceguid(mesh_id, True)
         scriptcontext.doc.Objects.Replace(id, mesh)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -755,7 +755,7 @@ def PullCurveToMesh(mesh_id, curve_id):
     if not polyline: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddCurve(polyline)
     if rc==System.Guid.Empty: raise Exception("unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -773,7 +773,7 @@ def SplitDisjointMesh(object_id, delete_input=False):
     if rc and delete_input:
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Delete(id)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -789,5 +789,5 @@ def UnifyMeshNormals(object_id):
     if rc>0:
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, mesh)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
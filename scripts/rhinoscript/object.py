@@ -3,6 +3,294 @@ import Rhino
 import utility as rhutil
 import System.Guid, System.Enum
 from layer import __getlayer
+from curve import __sampleparameters
+
+
+# Attribute changes made by the Object* functions while an attribute batch is
+# active are staged here and applied when the outermost batch ends, with one
+# attributes copy and one commit per object
+__attribute_batch_depth = 0
+__attribute_changes = None  # object id -> list of (attribute name, value)
+__attribute_order = []
+
+
+def __setattributes(rhino_objects, changes):
+    """Sets attributes of rhino_objects. changes is a sequence of (attribute
+    name, value) applied in order to one copy of each object's attributes
+    """
+    if __attribute_changes is not None:
+        for rhobj in rhino_objects:
+            staged = __attribute_changes.get(rhobj.Id)
+            if staged is None:
+                staged = __attribute_changes[rhobj.Id] = []
+                __attribute_order.append(rhobj.Id)
+            staged.extend(changes)
+        return
+    for rhobj in rhino_objects:
+        attributes = rhobj.Attributes.Duplicate()
+        for name, value in changes: setattr(attributes, name, value)
+        scriptcontext.doc.Objects.ModifyAttributes(rhobj, attributes, True)
+
+
+def beginattributebatch():
+    """Starts staging the attribute changes made by ObjectColor, ObjectLayer,
+    ObjectName, ObjectLinetype, ObjectMaterialSource, ObjectPrintColor,
+    ObjectPrintWidth and their source variants. Batches can be nested. Every
+    call must be matched by a call to endattributebatch. Queries made while a
+    batch is active return the attributes from before the batch
+    """
+    global __attribute_batch_depth, __attribute_changes, __attribute_order
+    rhutil.beginbatch()
+    if not __attribute_batch_depth:
+        __attribute_changes = {}
+        __attribute_order = []
+    __attribute_batch_depth += 1
+
+
+def endattributebatch(apply=True):
+    """Ends an attribute batch started with beginattributebatch. When the
+    outermost batch ends, the staged changes are applied and the views are
+    redrawn once
+    Parameters:
+      apply[opt] = False to discard the staged changes of the outermost batch
+    Returns:
+      number of objects modified
+    """
+    global __attribute_batch_depth, __attribute_changes, __attribute_order
+    if __attribute_batch_depth<1: raise Exception("endattributebatch called without a matching beginattributebatch")
+    __attribute_batch_depth -= 1
+    if __attribute_batch_depth:
+        rhutil.endbatch()
+        return 0
+    changes, order = __attribute_changes, __attribute_order
+    __attribute_changes, __attribute_order = None, []
+    rc = 0
+    try:
+        for id in order:
+            if not apply: break
+            rhobj = scriptcontext.doc.Objects.Find(id)
+            if rhobj is None or rhobj.IsDeleted: continue
+            __setattributes([rhobj], changes[id])
+            rc += 1
+        if rc: rhutil.redraw()
+    finally:
+        rhutil.endbatch()
+    return rc
+
+
+class attributebatch(object):
+    """Stages the attribute changes made by the Object* functions in a block
+    of code and applies them when the block ends, with one commit per object
+    and one redraw. If the block raises an exception, the staged changes are
+    discarded
+        with rhinoscript.object.attributebatch():
+            rs.ObjectColor(ids, (255,0,0))
+            rs.ObjectLayer(ids, "Walls")
+    """
+    def __enter__(self):
+        beginattributebatch()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.count = endattributebatch(exc_type is None)
+
+
+def __addgeometry(geometry, attributes):
+    """Adds geometry with attributes through the ObjectTable method for its
+    type. Returns Guid.Empty for geometry without one
+    """
+    objects = scriptcontext.doc.Objects
+    rg = Rhino.Geometry
+    if isinstance(geometry, rg.Point): return objects.AddPoint(geometry.Location, attributes)
+    if isinstance(geometry, rg.PointCloud): return objects.AddPointCloud(geometry, attributes)
+    if isinstance(geometry, rg.Curve): return objects.AddCurve(geometry, attributes)
+    if isinstance(geometry, rg.Extrusion): return objects.AddExtrusion(geometry, attributes)
+    if isinstance(geometry, rg.Brep): return objects.AddBrep(geometry, attributes)
+    if isinstance(geometry, rg.Surface): return objects.AddSurface(geometry, attributes)
+    if isinstance(geometry, rg.Mesh): return objects.AddMesh(geometry, attributes)
+    return System.Guid.Empty
+
+
+def __arraycopies(object_ids, xforms):
+    """Adds a copy of every object for every transform in a single batch and
+    undo record
+    Returns:
+      list with, for every object, the list of copy ids in transform order
+    """
+    id = rhutil.coerceguid(object_ids, False)
+    if id: object_ids = [id]
+    rhobjs = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    doc = scriptcontext.doc
+    rc = []
+    undo = doc.BeginUndoRecord("Array objects")
+    try:
+        for rhobj in rhobjs:
+            geometry = rhobj.Geometry
+            attributes = rhobj.Attributes
+            copies = []
+            for xform in xforms:
+                # adding a transformed duplicate avoids the object lookup and
+                # history handling of ObjectTable.Transform. Geometry that
+                # cannot be duplicated or added that way is copied by the table
+                copy = System.Guid.Empty
+                duplicate = geometry.Duplicate()
+                if duplicate and duplicate.Transform(xform):
+                    copy = __addgeometry(duplicate, attributes)
+                if copy==System.Guid.Empty:
+                    copy = doc.Objects.Transform(rhobj, xform, False)
+                copies.append(copy if copy!=System.Guid.Empty else None)
+            rc.append(copies)
+    finally:
+        if undo: doc.EndUndoRecord(undo)
+    if xforms and rhobjs: rhutil.redraw()
+    return rc
+
+
+def __arrayoffset(spacing, axis):
+    if type(spacing) in (int, long, float): return axis * float(spacing)
+    return rhutil.coerce3dvector(spacing, True)
+
+
+def ArrayAlongCurve(object_ids, curve_id, count, base_point=None, orient=True):
+    """Copies objects to points evenly spaced along a curve
+    Parameters:
+      object_ids = identifiers of the objects to copy
+      curve_id = identifier of the path curve
+      count = number of copies. On open curves the first and last copy are
+        placed at the curve's ends
+      base_point[opt] = point of the objects that is placed on the curve. If
+        omitted, the start of the curve is used
+      orient[opt] = rotate the copies with the curve's tangent direction,
+        relative to the tangent at the start of the curve
+    Returns:
+      list with, for every object, the list of the copy ids in order along
+      the curve. Copies that could not be made are None
+    """
+    curve = rhutil.coercecurve(curve_id, -1, True)
+    if count<1: raise ValueError("count must be at least 1")
+    parameters = __sampleparameters(curve, count)
+    if not parameters: return scriptcontext.errorhandler()
+    if base_point is None: base_point = curve.PointAtStart
+    else: base_point = rhutil.coerce3dpoint(base_point, True)
+    start_tangent = curve.TangentAt(curve.Domain.Min)
+    xforms = []
+    for t in parameters:
+        xform = Rhino.Geometry.Transform.Translation(curve.PointAt(t) - base_point)
+        if orient:
+            xform = xform * Rhino.Geometry.Transform.Rotation(start_tangent, curve.TangentAt(t), base_point)
+        xforms.append(xform)
+    return __arraycopies(object_ids, xforms)
+
+
+def ArrayGrid(object_ids, x_count, y_count, z_count=1, x_spacing=1.0, y_spacing=1.0, z_spacing=1.0):
+    """Copies objects in a rectangular grid. The objects themselves are the
+    first item of the grid
+    Parameters:
+      object_ids = identifiers of the objects to copy
+      x_count, y_count, z_count[opt] = number of items in each direction,
+        including the original objects
+      x_spacing, y_spacing, z_spacing[opt] = distance between items along
+        the world x, y and z axes, or a vector giving the offset between items
+    Returns:
+      list with, for every object, the list of the copy ids. Copies are in x
+      first order, skipping the original at (0,0,0): the item at (i,j,k) is
+      at index i + x_count*(j + y_count*k) - 1
+    """
+    if min(x_count, y_count, z_count)<1: raise ValueError("counts must be at least 1")
+    x = __arrayoffset(x_spacing, Rhino.Geometry.Vector3d.XAxis)
+    y = __arrayoffset(y_spacing, Rhino.Geometry.Vector3d.YAxis)
+    z = __arrayoffset(z_spacing, Rhino.Geometry.Vector3d.ZAxis)
+    xforms = []
+    for k in range(z_count):
+        for j in range(y_count):
+            for i in range(x_count):
+                if i or j or k: xforms.append(Rhino.Geometry.Transform.Translation(x*i + y*j + z*k))
+    return __arraycopies(object_ids, xforms)
+
+
+def ArrayLinear(object_ids, count, offset):
+    """Copies objects at equal offsets along a direction. The objects
+    themselves are the first item of the array
+    Parameters:
+      object_ids = identifiers of the objects to copy
+      count = number of items, including the original objects
+      offset = vector from one item to the next
+    Returns:
+      list with, for every object, the list of the count-1 copy ids
+    """
+    if count<1: raise ValueError("count must be at least 1")
+    offset = rhutil.coerce3dvector(offset, True)
+    xforms = [Rhino.Geometry.Transform.Translation(offset*i) for i in range(1, count)]
+    return __arraycopies(object_ids, xforms)
+
+
+def ArrayPolar(object_ids, count, center, angle=360.0, axis=None):
+    """Copies objects around a center point. The objects themselves are the
+    first item of the array
+    Parameters:
+      object_ids = identifiers of the objects to copy
+      count = number of items, including the original objects
+      center = center point of the array
+      angle[opt] = angle in degrees filled by the array. For a full circle
+        the items are spaced angle/count apart, otherwise angle/(count-1)
+      axis[opt] = rotation axis. If omitted, the world z axis is used
+    Returns:
+      list with, for every object, the list of the count-1 copy ids
+    """
+    if count<1: raise ValueError("count must be at least 1")
+    center = rhutil.coerce3dpoint(center, True)
+    if axis is None: axis = Rhino.Geometry.Vector3d.ZAxis
+    else: axis = rhutil.coerce3dvector(axis, True)
+    if abs(angle)>=360.0 or count==1: step = angle/count
+    else: step = angle/(count-1.0)
+    xforms = [Rhino.Geometry.Transform.Rotation(Rhino.RhinoMath.ToRadians(step*i), axis, center)
+              for i in range(1, count)]
+    return __arraycopies(object_ids, xforms)
+
+
+def __objectsoperation(object_ids, operation, verb, failures, lookup=False):
+    """Calls operation(id) once for every distinct object in object_ids, which
+    is a single identifier or any iterable of identifiers and objects. All
+    items are validated before any object is changed. With lookup, every
+    identifier must also name an object in the document; without a failures
+    list a missing object raises a ValueError and the number of items is
+    returned, as SelectObjects and UnselectObjects always did
+    Returns:
+      number of objects for which operation returned True
+    """
+    id = rhutil.coerceguid(object_ids, False)
+    if id: object_ids = [id]
+    ids = []
+    seen = set()
+    count = 0
+    for item in object_ids:
+        count += 1
+        id = rhutil.coerceguid(item, failures is None)
+        if id is None:
+            failures.append((item, "not an object identifier"))
+            continue
+        if id in seen: continue
+        seen.add(id)
+        if lookup and not rhutil.coercerhinoobject(id, True, failures is None):
+            failures.append((item, "not an object in the document"))
+            continue
+        ids.append(id)
+    rc = 0
+    for id in ids:
+        if operation(id): rc += 1
+        elif failures is not None: failures.append((id, "could not be %s" % verb))
+    if rc: rhutil.redraw()
+    if lookup and failures is None: return count
+    return rc
+
+
+def __deleteobject(id): return scriptcontext.doc.Objects.Delete(id, True)
+def __hideobject(id): return scriptcontext.doc.Objects.Hide(id, False)
+def __showobject(id): return scriptcontext.doc.Objects.Show(id, False)
+def __lockobject(id): return scriptcontext.doc.Objects.Lock(id, False)
+def __unlockobject(id): return scriptcontext.doc.Objects.Unlock(id, False)
+def __selectobject(id): return scriptcontext.doc.Objects.Select(id, True)
+def __unselectobject(id): return scriptcontext.doc.Objects.Select(id, False)
 
 
 def CopyObject(object_id, translation=None):
@@ -44,25 +332,22 @@ def DeleteObject(object_id):
     """
     object_id = rhutil.coerceguid(object_id, True)
     rc = scriptcontext.doc.Objects.Delete(object_id, True)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
-def DeleteObjects(object_ids):
+def DeleteObjects(object_ids, failures=None):
     """Deletes one or more objects from the document
     Parameters:
-      object_ids: identifiers of objects to delete
+      object_ids: identifiers of objects to delete. Any iterable of
+        identifiers or objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be deleted. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       Number of objects deleted
     """
-    rc = 0
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    for id in object_ids:
-        id = rhutil.coerceguid(id, True)
-        if scriptcontext.doc.Objects.Delete(id, True): rc+=1
-    if rc: scriptcontext.doc.Views.Redraw()
-    return rc
+    return __objectsoperation(object_ids, __deleteobject, "deleted", failures)
 
 
 def FlashObject(object_ids, style=True):
@@ -89,21 +374,18 @@ def HideObject(object_id):
     return HideObjects(object_id)==1
 
 
-def HideObjects(object_ids):
+def HideObjects(object_ids, failures=None):
     """Hides one or more objects
     Parameters:
-      object_ids: identifiers of objects to hide
+      object_ids: identifiers of objects to hide. Any iterable of
+        identifiers or objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be hidden. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       Number of objects hidden
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    rc = 0
-    for id in object_ids:
-        id = rhutil.coerceguid(id, True)
-        if scriptcontext.doc.Objects.Hide(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
-    return rc
+    return __objectsoperation(object_ids, __hideobject, "hidden", failures)
 
 
 def IsLayoutObject(object_id):
@@ -287,22 +569,19 @@ def LockObject(object_id):
     return LockObjects(object_id)==1
 
 
-def LockObjects(object_ids):
+def LockObjects(object_ids, failures=None):
     """Locks one or more objects. Locked objects are visible, and they can be
     snapped to. But, they cannot be selected.
     Parameters:
-      object_ids: list of Strings or Guids. The identifiers of objects
+      object_ids: list of Strings or Guids. The identifiers of objects. Any
+        iterable of identifiers or objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be locked. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       number of objects locked
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    rc = 0
-    for id in object_ids:
-        id = rhutil.coerceguid(id, True)
-        if scriptcontext.doc.Objects.Lock(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
-    return rc
+    return __objectsoperation(object_ids, __lockobject, "locked", failures)
 
 
 def MatchObjectAttributes(target_ids, source_id=None):
@@ -325,7 +604,7 @@ def MatchObjectAttributes(target_ids, source_id=None):
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.ModifyAttributes(id, source_attr, True):
             rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -421,19 +700,14 @@ def ObjectColor(object_ids, color=None):
         if rhino_objects: raise ValueError("color must be specified when a list of rhino objects is provided")
         return rhino_object.Attributes.DrawColor(scriptcontext.doc)
     color = rhutil.coercecolor(color, True)
+    changes = (("ObjectColor", color),
+               ("ColorSource", Rhino.DocObjects.ObjectColorSource.ColorFromObject))
     if rhino_objects is not None:
-        for rh_obj in rhino_objects:
-            attr = rh_obj.Attributes
-            attr.ObjectColor = color
-            attr.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
-            scriptcontext.doc.Objects.ModifyAttributes( rh_obj, attr, True)
+        __setattributes(rhino_objects, changes)
         return len(rhino_objects)
     rc = rhino_object.Attributes.DrawColor(scriptcontext.doc)
-    attr = rhino_object.Attributes
-    attr.ObjectColor = color
-    attr.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
-    scriptcontext.doc.Objects.ModifyAttributes( rhino_object, attr, True )
-    scriptcontext.doc.Views.Redraw()
+    __setattributes([rhino_object], changes)
+    rhutil.redraw()
     return rc
 
 
@@ -456,19 +730,16 @@ def ObjectColorSource(object_ids, source=None):
         rhobj = rhutil.coercerhinoobject(id, True, True)
         rc = int(rhobj.Attributes.ColorSource)
         if source is not None:
-            rhobj.Attributes.ColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectColorSource, source)
-            rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            source = System.Enum.ToObject(Rhino.DocObjects.ObjectColorSource, source)
+            __setattributes([rhobj], (("ColorSource", source),))
+            rhutil.redraw()
         return rc
     else:
-        rc = 0
         source = System.Enum.ToObject(Rhino.DocObjects.ObjectColorSource, source)
-        for id in object_ids:
-            rhobj = rhutil.coercerhinoobject(id, True, True)
-            rhobj.Attributes.ColorSource = source
-            rhobj.CommitChanges()
-            rc += 1
-        if rc: scriptcontext.doc.Views.Redraw()
+        rhobjs = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+        __setattributes(rhobjs, (("ColorSource", source),))
+        rc = len(rhobjs)
+        if rc: rhutil.redraw()
         return rc
 
 
@@ -508,11 +779,9 @@ def ObjectLayer(object_id, layer=None):
     if type(object_id) is not str and hasattr(object_id, "__len__"):
         layer = __getlayer(layer, True)
         index = layer.LayerIndex
-        for id in object_id:
-            obj = rhutil.coercerhinoobject(id, True, True)
-            obj.Attributes.LayerIndex = index
-            obj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        objs = [rhutil.coercerhinoobject(id, True, True) for id in object_id]
+        __setattributes(objs, (("LayerIndex", index),))
+        rhutil.redraw()
         return len(object_id)
     obj = rhutil.coercerhinoobject(object_id, True, True)
     if obj is None: return scriptcontext.errorhandler()
@@ -521,9 +790,8 @@ def ObjectLayer(object_id, layer=None):
     if layer:
         layer = __getlayer(layer, True)
         index = layer.LayerIndex
-        obj.Attributes.LayerIndex = index
-        obj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        __setattributes([obj], (("LayerIndex", index),))
+        rhutil.redraw()
     return rc
 
 
@@ -553,7 +821,7 @@ def ObjectLayout(object_id, layout=None, return_name=True):
             rhobj.Attributes.Space = Rhino.DocObjects.ActiveSpace.ModelSpace
             rhobj.Attributes.ViewportId = System.Guid.Empty
             rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     else:
         if layout:
             layout = scriptcontext.doc.Views.Find(layout, False)
@@ -561,7 +829,7 @@ def ObjectLayout(object_id, layout=None, return_name=True):
                 rhobj.Attributes.ViewportId = layout.MainViewport.Id
                 rhobj.Attributes.Space = Rhino.DocObjects.ActiveSpace.PageSpace
                 rhobj.CommitChanges()
-                scriptcontext.doc.Views.Redraw()
+                rhutil.redraw()
     return rc
 
 
@@ -583,20 +851,17 @@ def ObjectLinetype(object_ids, linetype=None):
         oldindex = scriptcontext.doc.Linetypes.LinetypeIndexForObject(rhino_object)
         if linetype:
             newindex = scriptcontext.doc.Linetypes.Find(linetype, True)
-            rhino_object.Attributes.LinetypeSource = Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject
-            rhino_object.Attributes.LinetypeIndex = newindex
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            __setattributes([rhino_object], (("LinetypeSource", Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject),
+                                             ("LinetypeIndex", newindex)))
+            rhutil.redraw()
         return scriptcontext.doc.Linetypes[oldindex].Name
 
     newindex = scriptcontext.doc.Linetypes.Find(linetype, True)
     if newindex<0: raise Exception("%s does not exist in LineTypes table"%linetype)
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.LinetypeSource = Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject
-        rhino_object.Attributes.LinetypeIndex = newindex
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("LinetypeSource", Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject),
+                                    ("LinetypeIndex", newindex)))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -620,16 +885,13 @@ def ObjectLinetypeSource(object_ids, source=None):
         oldsource = rhino_object.Attributes.LinetypeSource
         if source is not None:
             source = System.Enum.ToObject(Rhino.DocObjects.ObjectLinetypeSource, source)
-            rhino_object.Attributes.LinetypeSource = source
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            __setattributes([rhino_object], (("LinetypeSource", source),))
+            rhutil.redraw()
         return int(oldsource)
     source = System.Enum.ToObject(Rhino.DocObjects.ObjectLinetypeSource, source)
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.LinetypeSource = source
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("LinetypeSource", source),))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -672,15 +934,13 @@ def ObjectMaterialSource(object_ids, source=None):
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rc = int(rhino_object.Attributes.MaterialSource)
         if source is not None:
-            rhino_object.Attributes.MaterialSource = System.Enum.ToObject(Rhino.DocObjects.ObjectMaterialSource, source)
-            rhino_object.CommitChanges()
+            source = System.Enum.ToObject(Rhino.DocObjects.ObjectMaterialSource, source)
+            __setattributes([rhino_object], (("MaterialSource", source),))
         return rc
     # else working with multiple objects
     if source is None: raise Exception("source is required when object_ids represents multiple objects")
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.MaterialSource = source
-        rhino_object.CommitChanges()
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("MaterialSource", source),))
     return len(object_ids)
 
 
@@ -709,15 +969,11 @@ def ObjectName(object_id, name=None):
         if rhino_objects: raise Exception("name required when object_id represents multiple objects")
         return rhino_object.Name
     if rhino_objects:
-        for rh_obj in rhino_objects:
-            attr = rh_obj.Attributes
-            attr.Name = name
-            scriptcontext.doc.Objects.ModifyAttributes(rh_obj, attr, True)
+        __setattributes(rhino_objects, (("Name", name),))
         return len(rhino_objects)
     rc = rhino_object.Name
     if not type(name) is str: name = str(name)
-    rhino_object.Attributes.Name = name
-    rhino_object.CommitChanges()
+    __setattributes([rhino_object], (("Name", name),))
     return rc
 
 
@@ -736,18 +992,15 @@ def ObjectPrintColor(object_ids, color=None):
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rc = rhino_object.Attributes.PlotColor
         if color:
-            rhino_object.Attributes.PlotColorSource = Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
-            rhino_object.Attributes.PlotColor = rhutil.coercecolor(color, True)
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            __setattributes([rhino_object], (("PlotColorSource", Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject),
+                                             ("PlotColor", rhutil.coercecolor(color, True))))
+            rhutil.redraw()
         return rc
-    for id in object_ids:
-        color = rhutil.coercecolor(color, True)
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.PlotColorSource = Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
-        rhino_object.Attributes.PlotColor = color
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    color = rhutil.coercecolor(color, True)
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("PlotColorSource", Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject),
+                                    ("PlotColor", color)))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -769,15 +1022,14 @@ def ObjectPrintColorSource(object_ids, source=None):
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rc = int(rhino_object.Attributes.PlotColorSource)
         if source is not None:
-            rhino_object.Attributes.PlotColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            source = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
+            __setattributes([rhino_object], (("PlotColorSource", source),))
+            rhutil.redraw()
         return rc
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.PlotColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    source = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("PlotColorSource", source),))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -798,17 +1050,14 @@ def ObjectPrintWidth(object_ids, width=None):
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rc = rhino_object.Attributes.PlotWeight
         if width is not None:
-            rhino_object.Attributes.PlotWeightSource = Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject
-            rhino_object.Attributes.PlotWeight = width
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            __setattributes([rhino_object], (("PlotWeightSource", Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject),
+                                             ("PlotWeight", width)))
+            rhutil.redraw()
         return rc
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.PlotWeightSource = Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject
-        rhino_object.Attributes.PlotWeight = width
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("PlotWeightSource", Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject),
+                                    ("PlotWeight", width)))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -830,15 +1079,14 @@ def ObjectPrintWidthSource(object_ids, source=None):
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rc = int(rhino_object.Attributes.PlotWeightSource)
         if source is not None:
-            rhino_object.Attributes.PlotWeightSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
-            rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            source = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
+            __setattributes([rhino_object], (("PlotWeightSource", source),))
+            rhutil.redraw()
         return rc
-    for id in object_ids:
-        rhino_object = rhutil.coercerhinoobject(id, True, True)
-        rhino_object.Attributes.PlotWeightSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
-        rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    source = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
+    rhino_objects = [rhutil.coercerhinoobject(id, True, True) for id in object_ids]
+    __setattributes(rhino_objects, (("PlotWeightSource", source),))
+    rhutil.redraw()
     return len(object_ids)
 
 
@@ -904,7 +1152,7 @@ def OrientObject(object_id, reference, target, flags=0):
         xform_final = xform_move * xform_scale * xform_rotate
     rc = scriptcontext.doc.Objects.Transform(object_id, xform_final, not copy)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -995,23 +1243,22 @@ def SelectObject(object_id):
     """
     rhobj = rhutil.coercerhinoobject(object_id, True, True)
     rhobj.Select(True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return True
 
 
-def SelectObjects( object_ids):
+def SelectObjects(object_ids, failures=None):
     """Selects one or more objects
     Parameters:
-      object_ids = list of Guids identifying the objects to select
+      object_ids = list of Guids identifying the objects to select. Any
+        iterable of identifiers or objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be selected. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       number of selected objects
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    rc = 0
-    for id in object_ids:
-        if SelectObject(id)==True: rc += 1
-    return rc
+    return __objectsoperation(object_ids, __selectobject, "selected", failures, True)
 
 
 def ShowObject(object_id):
@@ -1025,22 +1272,20 @@ def ShowObject(object_id):
     return ShowObjects(object_id)==1
 
 
-def ShowObjects(object_ids):
+def ShowObjects(object_ids, failures=None):
     """Shows one or more objects. Hidden objects are not visible, cannot be
     snapped to and cannot be selected
     Parameters:
-      object_ids: list of Strings or Guids representing ids of objects to show
+      object_ids: list of Strings or Guids representing ids of objects to
+        show. Any iterable of identifiers or objects is accepted; duplicates
+        are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be shown. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       Number of objects shown
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    rc = 0
-    for id in object_ids:
-        id = rhutil.coerceguid(id, True)
-        if scriptcontext.doc.Objects.Show(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
-    return rc
+    return __objectsoperation(object_ids, __showobject, "shown", failures)
 
 
 def TransformObject(object_id, matrix, copy=False):
@@ -1072,12 +1317,51 @@ def TransformObjects(object_ids, matrix, copy=False):
     xform = rhutil.coercexform(matrix, True)
     id = rhutil.coerceguid(object_ids, False)
     if id: object_ids = [id]
+    object_ids = [rhutil.coerceguid(object_id, True) for object_id in object_ids]
+    rc = __transformobjects(object_ids, [xform]*len(object_ids), copy)
+    return [id for id in rc if id is not None]
+
+
+def TransformObjectsEx(object_ids, matrices, copy=False):
+    """Moves, scales, or rotates a list of objects, each with its own 4x4
+    transformation matrix. All input is validated before any object is
+    changed, the views are redrawn once and the changes form a single undo
+    step
+    Parameters:
+      object_ids = List of object identifiers.
+      matrices = List of transformation matrices, one for each object. Each
+        matrix is a Transform or a 4x4 array of numbers. A flat list of
+        16 numbers per object, in row order, is also accepted
+      copy[opt] = Copy the objects
+    Returns:
+      List of ids identifying the newly transformed objects, in the order of
+      object_ids. Objects that could not be transformed have None
+    """
+    id = rhutil.coerceguid(object_ids, False)
+    if id: object_ids = [id]
+    rhobjs = [rhutil.coercerhinoobject(object_id, True, True) for object_id in object_ids]
+    if matrices and len(matrices)==16*len(rhobjs) and not hasattr(matrices[0], "__len__") and \
+       not isinstance(matrices[0], Rhino.Geometry.Transform):
+        matrices = [[matrices[i+4*row:i+4*row+4] for row in range(4)] for i in range(0, len(matrices), 16)]
+    if len(matrices)!=len(rhobjs):
+        raise ValueError("expected %d matrices, got %d" % (len(rhobjs), len(matrices)))
+    xforms = [rhutil.coercexform(matrix, True) for matrix in matrices]
+    return __transformobjects(rhobjs, xforms, copy)
+
+
+def __transformobjects(objects, xforms, copy):
+    "Transforms objects[i] by xforms[i] with one redraw and one undo record"
+    doc = scriptcontext.doc
     rc = []
-    for object_id in object_ids:
-        object_id = rhutil.coerceguid(object_id, True)
-        id = scriptcontext.doc.Objects.Transform(object_id, xform, not copy)
-        if id!=System.Guid.Empty: rc.append(id)
-    if rc: scriptcontext.doc.Views.Redraw()
+    undo = doc.BeginUndoRecord("Transform objects")
+    try:
+        for object, xform in zip(objects, xforms):
+            id = doc.Objects.Transform(object, xform, not copy)
+            if id==System.Guid.Empty: id = None
+            rc.append(id)
+    finally:
+        if undo: doc.EndUndoRecord(undo)
+    if [id for id in rc if id is not None]: rhutil.redraw()
     return rc
 
 
@@ -1092,22 +1376,19 @@ def UnlockObject(object_id):
     return UnlockObjects(object_id)==1
 
 
-def UnlockObjects(object_ids):
+def UnlockObjects(object_ids, failures=None):
     """Unlocks one or more objects. Locked objects are visible, and can be
     snapped to, but they cannot be selected.
     Parameters:
-      object_ids: The identifiers of objects
+      object_ids: The identifiers of objects. Any iterable of identifiers or
+        objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be unlocked. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       number of objects unlocked
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    rc = 0
-    for id in object_ids:
-        id = rhutil.coerceguid(id, True)
-        if scriptcontext.doc.Objects.Unlock(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
-    return rc
+    return __objectsoperation(object_ids, __unlockobject, "unlocked", failures)
 
 
 def UnselectObject(object_id):
@@ -1120,18 +1401,15 @@ def UnselectObject(object_id):
     return UnselectObjects(object_id)==1
 
 
-def UnselectObjects(object_ids):
+def UnselectObjects(object_ids, failures=None):
     """Unselects one or more selected objects.
     Parameters:
-      object_ids = identifiers of the objects to unselect.
+      object_ids = identifiers of the objects to unselect. Any iterable of
+        identifiers or objects is accepted; duplicates are ignored
+      failures[opt] = list that receives (item, reason) for every item that
+        could not be unselected. If given, invalid identifiers are reported
+        there instead of raising an exception
     Returns:
       The number of objects unselected
     """
-    id = rhutil.coerceguid(object_ids, False)
-    if id: object_ids = [id]
-    count = len(object_ids)
-    for id in object_ids:
-        obj = rhutil.coercerhinoobject(id, True, True)
-        obj.Select(False)
-    if count: scriptcontext.doc.Views.Redraw()
-    return count
+    return __objectsoperation(object_ids, __unselectobject, "unselected", failures, True)
@@ -3,6 +3,111 @@ import Rhino
 import scriptcontext
 import math
 
+
+def __closestpoint(geometry, point):
+    "point on geometry closest to point, None if geometry is not supported"
+    if isinstance(geometry, Rhino.Geometry.Point): return geometry.Location
+    if isinstance(geometry, Rhino.Geometry.PointCloud):
+        index = geometry.ClosestPoint(point)
+        if index>=0: return geometry[index].Location
+        return None
+    if isinstance(geometry, Rhino.Geometry.Curve):
+        rc, t = geometry.ClosestPoint(point)
+        if rc: return geometry.PointAt(t)
+        return None
+    if isinstance(geometry, (Rhino.Geometry.Brep, Rhino.Geometry.Mesh)):
+        return geometry.ClosestPoint(point)
+    return None
+
+
+class __closestobjectindex(object):
+    "R-tree of the bounding boxes of a fixed set of objects, see ClosestObjectIndex"
+    __slots__ = ("ids", "geometry", "extents", "tree", "box", "spacing")
+    def __init__(self):
+        self.ids = []
+        self.geometry = []
+        self.extents = []
+        self.tree = Rhino.Geometry.RTree()
+        self.box = None
+        self.spacing = 0.0
+
+
+def __boxdistance(extents, point):
+    "distance from point to the box (minx, miny, minz, maxx, maxy, maxz)"
+    x0, y0, z0, x1, y1, z1 = extents
+    dx = max(x0 - point.X, 0.0, point.X - x1)
+    dy = max(y0 - point.Y, 0.0, point.Y - y1)
+    dz = max(z0 - point.Z, 0.0, point.Z - z1)
+    return math.sqrt(dx*dx + dy*dy + dz*dz)
+
+
+def __indexclosestobject(index, point):
+    """(distance, object id, point on object) for the indexed object closest
+    to point. Spheres of growing radius are searched until the closest
+    object found so far lies inside the searched sphere
+    """
+    if not index.ids: return None
+    found = []
+    def collect(sender, e): found.append(e.Id)
+    extents = index.extents
+    tested = set()
+    closest = None
+    radius = index.box.ClosestPoint(point).DistanceTo(point) + index.spacing
+    while True:
+        del found[:]
+        index.tree.Search(Rhino.Geometry.Sphere(point, radius), collect)
+        candidates = [(__boxdistance(extents[i], point), i) for i in found if i not in tested]
+        candidates.sort()
+        for box_distance, i in candidates:
+            if closest and box_distance>closest[0]: break
+            tested.add(i)
+            target = __closestpoint(index.geometry[i], point)
+            if target is None: continue
+            distance = point.DistanceTo(target)
+            if closest is None or (distance, i)<closest[:2]: closest = distance, i, target
+        if closest:
+            # every object that could be closer was inside the last sphere
+            if closest[0]<=radius: break
+            radius = closest[0]
+        elif len(tested)==len(extents): return None
+        else: radius = 2.0*radius or 1.0
+    return closest[0], index.ids[closest[1]], closest[2]
+
+
+def ClosestObjectIndex(object_ids):
+    """Builds an index of objects for fast repeated closest object queries.
+    The geometry and bounding boxes of the objects are looked up once. Each
+    query only computes closest points on the objects whose bounding boxes
+    are near the test point. The index is a snapshot, so build a new one
+    after the objects are modified or deleted
+    Parameters:
+      object_ids = identifiers of one or more point, point cloud, curve,
+        polysurface or mesh objects
+    Returns:
+      index that can be passed to PointClosestObject in place of object_ids
+    """
+    object_ids = rhutil.coerceguidlist(object_ids)
+    if not object_ids: raise ValueError("object_ids must contain at least one object identifier")
+    index = __closestobjectindex()
+    for id in object_ids:
+        geometry = rhutil.coercegeometry(id, True)
+        if not isinstance(geometry, (Rhino.Geometry.Point, Rhino.Geometry.PointCloud,
+            Rhino.Geometry.Curve, Rhino.Geometry.Brep, Rhino.Geometry.Mesh)): continue
+        box = geometry.GetBoundingBox(True)
+        if not box.IsValid: continue
+        index.tree.Insert(box, len(index.ids))
+        index.ids.append(id)
+        index.geometry.append(geometry)
+        index.extents.append((box.Min.X, box.Min.Y, box.Min.Z, box.Max.X, box.Max.Y, box.Max.Z))
+    if index.ids:
+        corners = zip(*index.extents)
+        index.box = Rhino.Geometry.BoundingBox(min(corners[0]), min(corners[1]), min(corners[2]),
+                                               max(corners[3]), max(corners[4]), max(corners[5]))
+        # first search radius: roughly the distance between neighbouring objects
+        index.spacing = index.box.Diagonal.Length / len(index.ids)**(1.0/3.0)
+    return index
+
+
 def IsVectorParallelTo(vector1, vector2):
     """Compares two vectors to see if they are parallel
     Parameters:
@@ -94,52 +199,24 @@ def PointClosestObject(point, object_ids):
     """Finds the object that is closest to a test point
     Parameters:
       point = point to test
-      object_id = identifiers of one or more objects
+      object_id = identifiers of one or more objects, or an index returned
+        by ClosestObjectIndex
     Returns:
       (closest object_id, point on object) on success
       None on failure
     """
-    object_ids = rhutil.coerceguidlist(object_ids)
     point = rhutil.coerce3dpoint(point, True)
-    closest = None
-    for id in object_ids:
-        geom = rhutil.coercegeometry(id, True)
-        point_geometry = geom
-        if isinstance(point_geometry, Rhino.Geometry.Point):
-            distance = point.DistanceTo( point_geometry.Location )
-            if closest is None or distance<closest[0]:
-                closest = distance, id, point_geometry.Location
-            continue
-        point_cloud = geom
-        if isinstance(point_cloud, Rhino.Geometry.PointCloud):
-            index = point_cloud.ClosestPoint(point)
-            if index>=0:
-                distance = point.DistanceTo( point_cloud[index].Location )
-                if closest is None or distance<closest[0]:
-                    closest = distance, id, point_cloud[index].Location
-            continue
-        curve = geom
-        if isinstance(curve, Rhino.Geometry.Curve):
-            rc, t = curve.ClosestPoint(point)
-            if rc:
-                distance = point.DistanceTo( curve.PointAt(t) )
-                if closest is None or distance<closest[0]:
-                    closest = distance, id, curve.PointAt(t)
-            continue
-        brep = geom
-        if isinstance(brep, Rhino.Geometry.Brep):
-            brep_closest = brep.ClosestPoint(point)
-            distance = point.DistanceTo( brep_closest )
-            if closest is None or distance<closest[0]:
-                closest = distance, id, brep_closest
-            continue
-        mesh = geom
-        if isinstance(mesh, Rhino.Geometry.Mesh):
-            mesh_closest = mesh.ClosestPoint(point)
-            distance = point.DistanceTo( mesh_closest )
+    if isinstance(object_ids, __closestobjectindex):
+        closest = __indexclosestobject(object_ids, point)
+    else:
+        object_ids = rhutil.coerceguidlist(object_ids)
+        closest = None
+        for id in object_ids:
+            target = __closestpoint(rhutil.coercegeometry(id, True), point)
+            if target is None: continue
+            distance = point.DistanceTo(target)
             if closest is None or distance<closest[0]:
-                closest = distance, id, mesh_closest
-            continue
+                closest = distance, id, target
     if closest: return closest[1], closest[2]
 
 
@@ -0,0 +1,253 @@
+# Call profiling for the functions of the rhinoscript package.
+# While profiling is enabled, every public function of the rhinoscript
+# modules is replaced by a wrapper that records how often it is called and
+# how long it takes. Disabling profiling puts the original functions back,
+# so scripts pay nothing for profiling when it is not in use.
+import sys
+import time
+import json
+import types
+import threading
+
+import rhinoscript
+
+if sys.platform in ("cli", "win32"): __timer = time.clock
+else: __timer = time.time
+
+__stats = {}        # "module.function" -> __functionstats
+__wrappers = {}     # id(wrapper) -> (wrapper, original)
+__local = threading.local()
+__lock = threading.Lock()
+
+
+class __functionstats(object):
+    __slots__ = ("name", "calls", "cumulative", "selftime", "arguments", "largest")
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.cumulative = 0.0
+        self.selftime = 0.0
+        self.arguments = 0
+        self.largest = 0
+
+
+def __argumentsize(args, kwargs):
+    "sum of the lengths of the list, tuple and dict arguments"
+    size = 0
+    for arg in args:
+        if isinstance(arg, (list, tuple, dict)): size += len(arg)
+    if kwargs:
+        for arg in kwargs.itervalues():
+            if isinstance(arg, (list, tuple, dict)): size += len(arg)
+    return size
+
+
+def __wrap(function, stats):
+    timer = __timer
+    local = __local
+    lock = __lock
+    argumentsize = __argumentsize
+    def profiled(*args, **kwargs):
+        # every active call on this thread has a slot for time spent in the
+        # profiled functions that it calls. Recursion depths are also kept
+        # per thread, so calls made on other threads are not mistaken for
+        # recursive calls
+        children = getattr(local, "children", None)
+        if children is None:
+            children = local.children = []
+            local.active = {}
+        active = local.active
+        size = argumentsize(args, kwargs)
+        active[stats] = active.get(stats, 0) + 1
+        children.append(0.0)
+        start = timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = timer() - start
+            child_time = children.pop()
+            if children: children[-1] += elapsed
+            depth = active[stats] - 1
+            if depth: active[stats] = depth
+            else: del active[stats]
+            with lock:
+                stats.calls += 1
+                stats.selftime += elapsed - child_time
+                # recursive calls are already part of the outermost call
+                if not depth: stats.cumulative += elapsed
+                stats.arguments += size
+                if size>stats.largest: stats.largest = size
+    profiled.__name__ = function.__name__
+    profiled.__doc__ = function.__doc__
+    profiled.__module__ = function.__module__
+    return profiled
+
+
+def __publicfunctions(module):
+    for name, value in vars(module).items():
+        if name.startswith("_") or type(value) is not types.FunctionType: continue
+        if value.__module__==module.__name__: yield name, value
+
+
+def __modulesreferencing(functions):
+    "modules, including flat namespaces like rhinoscriptsyntax, holding any of the functions"
+    ids = set(id(f) for f in functions)
+    for module in sys.modules.values():
+        if module is None: continue
+        try:
+            members = vars(module)
+        except TypeError:
+            continue
+        for value in members.values():
+            if id(value) in ids:
+                yield module
+                break
+
+
+def IsProfilingEnabled():
+    "Returns True if rhinoscript functions are being profiled"
+    return bool(__wrappers)
+
+
+def EnableProfiling(enable=True, modules=None):
+    """Enables or disables profiling of the rhinoscript functions. While
+    enabled, the number of calls, the time spent and the size of list
+    arguments are recorded for every public function. References to the
+    functions held by other modules, like rhinoscriptsyntax, are profiled too
+    Parameters:
+      enable[opt] = True to start profiling, False to stop and restore the
+        original functions. Recorded results are kept until ResetProfiling
+      modules[opt] = names of the rhinoscript modules to profile. If omitted,
+        all modules are profiled
+    Returns:
+      previous profiling state
+    """
+    rc = bool(__wrappers)
+    if enable==rc: return rc
+    if not enable:
+        originals = dict(__wrappers)
+        __wrappers.clear()
+        wrappers = [wrapper for wrapper, original in originals.itervalues()]
+        for module in list(__modulesreferencing(wrappers)):
+            for name, value in vars(module).items():
+                entry = originals.get(id(value))
+                if entry and entry[0] is value: setattr(module, name, entry[1])
+        return rc
+    if modules is None: modules = rhinoscript.__all__
+    elif isinstance(modules, str): modules = [modules]
+    replacements = {}
+    for module_name in modules:
+        if module_name not in rhinoscript.__all__:
+            raise ValueError("%s is not a rhinoscript module" % module_name)
+        module = getattr(rhinoscript, module_name)
+        for name, function in __publicfunctions(module):
+            key = "%s.%s" % (module_name, name)
+            stats = __stats.get(key)
+            if stats is None: stats = __stats[key] = __functionstats(key)
+            wrapper = __wrap(function, stats)
+            replacements[id(function)] = (function, wrapper)
+            __wrappers[id(wrapper)] = (wrapper, function)
+    originals = [function for function, wrapper in replacements.itervalues()]
+    for module in list(__modulesreferencing(originals)):
+        for name, value in vars(module).items():
+            entry = replacements.get(id(value))
+            if entry and entry[0] is value: setattr(module, name, entry[1])
+    return rc
+
+
+def ResetProfiling():
+    "Discards all recorded profiling results"
+    with __lock:
+        for stats in __stats.values():
+            stats.calls = stats.arguments = stats.largest = 0
+            stats.cumulative = stats.selftime = 0.0
+
+
+def ProfilingResults(sort="cumulative"):
+    """Returns the recorded profiling results for every function that was
+    called at least once
+    Parameters:
+      sort[opt] = "cumulative", "self", "calls", "arguments" or "name"
+    Returns:
+      list of dictionaries with the keys
+        name = module.function
+        calls = number of calls
+        cumulative = seconds spent in the function and the functions it calls
+        self = seconds spent in the function itself
+        average = cumulative seconds per call
+        arguments = average size of the list arguments per call
+        largest = largest total size of the list arguments of a single call
+    """
+    if sort not in ("cumulative", "self", "calls", "arguments", "name"):
+        raise ValueError("unknown sort key %s" % sort)
+    rc = []
+    for stats in __stats.values():
+        if not stats.calls: continue
+        rc.append({"name": stats.name, "calls": stats.calls,
+                   "cumulative": stats.cumulative, "self": stats.selftime,
+                   "average": stats.cumulative/stats.calls,
+                   "arguments": float(stats.arguments)/stats.calls,
+                   "largest": stats.largest})
+    rc.sort(key=lambda item: item[sort], reverse=(sort!="name"))
+    return rc
+
+
+def ProfilingReport(sort="cumulative", limit=None, format="text"):
+    """Returns the recorded profiling results as a report
+    Parameters:
+      sort[opt] = sort key, see ProfilingResults
+      limit[opt] = maximum number of functions to report
+      format[opt] = "text" for a table, "json" for a JSON document
+    Returns:
+      report string
+    """
+    results = ProfilingResults(sort)
+    if limit is not None: results = results[:limit]
+    if format=="json": return json.dumps(results, indent=1)
+    if format!="text": raise ValueError("unknown report format %s" % format)
+    lines = ["%-40s %10s %12s %12s %12s %10s %10s" % ("function", "calls", "cumulative", "self", "per call", "avg args", "max args")]
+    for item in results:
+        lines.append("%-40s %10d %12.6f %12.6f %12.6f %10.1f %10d" % (item["name"], item["calls"],
+            item["cumulative"], item["self"], item["average"], item["arguments"], item["largest"]))
+    return "\n".join(lines)
+
+
+def SaveProfilingReport(filename, sort="cumulative", limit=None):
+    """Writes the recorded profiling results to a file. Files with a .json
+    extension get a JSON document, all others a text table
+    Parameters:
+      filename = name of the file to write
+      sort[opt] = sort key, see ProfilingResults
+      limit[opt] = maximum number of functions to report
+    Returns:
+      True or False indicating success or failure
+    """
+    format = "text"
+    if filename.lower().endswith(".json"): format = "json"
+    report = ProfilingReport(sort, limit, format)
+    try:
+        f = open(filename, "w")
+        try:
+            f.write(report)
+        finally:
+            f.close()
+    except IOError:
+        return False
+    return True
+
+
+class profile(object):
+    """Profiles the rhinoscript functions called in a block of code
+        with rhinoscript.profiling.profile():
+            main()
+        print rhinoscript.profiling.ProfilingReport()
+    """
+    def __init__(self, modules=None):
+        self.modules = modules
+
+    def __enter__(self):
+        self.previous = EnableProfiling(True, self.modules)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        EnableProfiling(self.previous)
@@ -35,18 +35,12 @@ def AllObjects(select=False, include_lights=False, include_grips=False):
     Returns:
       List of Guids identifying the objects
     """
-    it = Rhino.DocObjects.ObjectEnumeratorSettings()
-    it.IncludeLights = include_lights
-    it.IncludeGrips = include_grips
-    it.NormalObjects = True
-    it.LockedObjects = True
-    it.HiddenObjects = True
-    e = scriptcontext.doc.Objects.GetObjectList(it)
+    objects = IterObjects(include_lights=include_lights, include_grips=include_grips, return_objects=True)
     object_ids = []
-    for object in e:
+    for object in objects:
         if select: object.Select(True)
         object_ids.append(object.Id)
-    if object_ids and select: scriptcontext.doc.Views.Redraw()
+    if object_ids and select: rhutil.redraw()
     return object_ids
 
 
@@ -449,14 +443,7 @@ def HiddenObjects(include_lights=False, include_grips=False):
       include_lights[opt] = include light objects
       include_grips[opt] = include grip objects
     """
-    settings = Rhino.DocObjects.ObjectEnumeratorSettings()
-    settings.NormalObjects = False
-    settings.LockedObjects = False
-    settings.HiddenObjects = True
-    settings.IncludeLights = include_lights
-    settings.IncludeGrips = include_grips
-    items = scriptcontext.doc.Objects.GetObjectList(settings)
-    return [item.Id for item in items]
+    return list(IterObjects(state=4, include_lights=include_lights, include_grips=include_grips))
 
 
 def InvertSelectedObjects(include_lights=False, include_grips=False):
@@ -475,10 +462,64 @@ def InvertSelectedObjects(include_lights=False, include_grips=False):
             obj.Select(True)
         else:
             obj.Select(False)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
+def IterObjects(filter=0, layer=None, state=0, selected=False, include_lights=False,
+                include_grips=False, return_objects=False, chunk_size=None):
+    """Iterates over the objects in the document without building a list of
+    all of them first. Objects are produced as the document is enumerated,
+    so do not add or delete objects until the iteration is finished
+    Parameters:
+      filter[opt] = the type(s) of geometry objects to iterate over, see
+        ObjectsByType. If omitted or 0, objects of all types are produced
+      layer[opt] = name or identifier of a layer. If specified, only objects
+        on this layer are produced
+      state[opt] = the object state(s) to iterate over
+         0 = normal, locked and hidden objects
+         1 = normal objects
+         2 = locked objects
+         4 = hidden objects
+      selected[opt] = only produce selected objects
+      include_lights[opt] = include light objects when filter is 0
+      include_grips[opt] = include grip objects when filter is 0
+      return_objects[opt] = produce Rhino.DocObjects.RhinoObject instead of
+        identifiers, avoiding a second look up for every object
+      chunk_size[opt] = produce lists of up to chunk_size items instead of
+        single items
+    Returns:
+      iterator of Guids, RhinoObjects or lists of either
+    """
+    if chunk_size is not None and chunk_size<1: raise ValueError("chunk_size must be at least 1")
+    it = Rhino.DocObjects.ObjectEnumeratorSettings()
+    if state:
+        it.NormalObjects = bool(state & 1)
+        it.LockedObjects = bool(state & 2)
+        it.HiddenObjects = bool(state & 4)
+    else:
+        it.NormalObjects = it.LockedObjects = it.HiddenObjects = True
+    it.SelectedObjectsFilter = selected
+    it.IncludeLights = include_lights
+    it.IncludeGrips = include_grips
+    if layer is not None: it.LayerIndexFilter = __getlayer(layer, True).LayerIndex
+    if filter: objects = (rhobj for rhobj, object_type in __objectsbytype(__FilterHelper(filter), it))
+    else: objects = scriptcontext.doc.Objects.GetObjectList(it)
+    if not return_objects: objects = (rhobj.Id for rhobj in objects)
+    if chunk_size is None: return iter(objects)
+    return __chunks(objects, chunk_size)
+
+
+def __chunks(items, chunk_size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk)==chunk_size:
+            yield chunk
+            chunk = []
+    if chunk: yield chunk
+
+
 def LastCreatedObjects(select=False):
     """Returns identifiers of the objects that were most recently created or changed
     by scripting a Rhino command using the Command function. It is important to
@@ -496,7 +537,7 @@ def LastCreatedObjects(select=False):
             rc.append(obj.Id)
             if select: obj.Select(True)
         serial_number += 1
-    if select==True and rc: scriptcontext.doc.Views.Redraw()
+    if select==True and rc: rhutil.redraw()
     return rc
 
 
@@ -521,7 +562,7 @@ def LastObject(select=False, include_lights=False, include_grips=False):
     rc = firstobj.Id
     if select:
         firstobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -550,12 +591,270 @@ def NextObject(object_id, select=False, include_lights=False, include_grips=Fals
 def NormalObjects(include_lights=False, include_grips=False):
     """Returns identifiers of all normal objects in the document. Normal objects
     are visible, can be snapped to, and are independent of selection state"""
-    iter = Rhino.DocObjects.ObjectEnumeratorSettings()
-    iter.NormalObjects = True
-    iter.LockedObjects = False
-    iter.IncludeLights = include_lights
-    iter.IncludeGrips = include_grips
-    return [obj.Id for obj in scriptcontext.doc.Objects.GetObjectList(iter)]
+    return list(IterObjects(state=1, include_lights=include_lights, include_grips=include_grips))
+
+
+# Opt-in index of the document objects by layer, name, color, group and
+# object type. Objects reported changed by the document are queued and looked
+# up again the next time the index is used, so the index always reflects the
+# document once the events that changed it have completed
+__object_index = None
+__object_index_doc = None
+__object_index_pending = set()
+
+
+def __objectindexentry(rhobj):
+    "(serial number, hidden, object type, layer, lower case name, color key, groups)"
+    attributes = rhobj.Attributes
+    source = attributes.ColorSource
+    if source==Rhino.DocObjects.ObjectColorSource.ColorFromObject:
+        color = ("object", attributes.ObjectColor.ToArgb())
+    elif source==Rhino.DocObjects.ObjectColorSource.ColorFromLayer:
+        color = ("layer", attributes.LayerIndex)
+    else:
+        color = ("other", None)
+    name = attributes.Name
+    if name: name = name.lower()
+    return (rhobj.RuntimeSerialNumber, rhobj.IsHidden, rhobj.ObjectType,
+            attributes.LayerIndex, name, color, tuple(attributes.GetGroupList() or ()))
+
+
+def __objectindexkeys(entry):
+    serial, hidden, object_type, layer, name, color, groups = entry
+    yield "type", object_type
+    yield "layer", layer
+    if name: yield "name", name
+    yield "color", color
+    for group in groups: yield "group", group
+
+
+def __objectindexadd(index, rhobj):
+    if rhobj.ObjectType==Rhino.DocObjects.ObjectType.Grip: return
+    entry = __objectindexentry(rhobj)
+    index["entries"][rhobj.Id] = entry
+    for table, key in __objectindexkeys(entry):
+        ids = index[table].get(key)
+        if ids is None: ids = index[table][key] = set()
+        ids.add(rhobj.Id)
+
+
+def __objectindexremove(index, object_id):
+    entry = index["entries"].pop(object_id, None)
+    if entry is None: return
+    for table, key in __objectindexkeys(entry):
+        ids = index[table][key]
+        ids.discard(object_id)
+        if not ids: del index[table][key]
+
+
+def __queueobjectindexupdate(object_id):
+    global __object_index_doc
+    if object_id is None: __object_index_doc = None
+    else: __object_index_pending.add(object_id)
+
+
+def __currentobjectindex():
+    "Returns the up to date object index or None if indexing is disabled"
+    global __object_index, __object_index_doc
+    if __object_index is None: return None
+    doc = scriptcontext.doc
+    if __object_index_doc is not doc:
+        __object_index_pending.clear()
+        __object_index = {"entries":{}, "type":{}, "layer":{}, "name":{}, "color":{}, "group":{}}
+        __object_index_doc = doc
+        settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+        settings.HiddenObjects = True
+        settings.DeletedObjects = False
+        settings.IncludeLights = True
+        settings.IncludeGrips = False
+        settings.IncludePhantoms = True
+        for rhobj in doc.Objects.GetObjectList(settings):
+            __objectindexadd(__object_index, rhobj)
+    while __object_index_pending:
+        object_id = __object_index_pending.pop()
+        __objectindexremove(__object_index, object_id)
+        rhobj = doc.Objects.Find(object_id)
+        if rhobj and not rhobj.IsDeleted: __objectindexadd(__object_index, rhobj)
+    return __object_index
+
+
+def __indexedobjectids(index, ids, hidden=False, lights=False, phantoms=False):
+    "Filters ids from the index like an object enumerator and sorts them in document order"
+    entries = index["entries"]
+    light = Rhino.DocObjects.ObjectType.Light
+    phantom = Rhino.DocObjects.ObjectType.Phantom
+    rc = []
+    for id in ids:
+        entry = entries[id]
+        if entry[1] and not hidden: continue
+        if entry[2]==light and not lights: continue
+        if entry[2]==phantom and not phantoms: continue
+        rc.append((entry[0], id))
+    rc.sort()
+    return [id for serial, id in rc]
+
+
+def __selectobjectids(object_ids):
+    for id in object_ids:
+        rhobj = scriptcontext.doc.Objects.Find(id)
+        if rhobj: rhobj.Select(True)
+    if object_ids: rhutil.redraw()
+
+
+def EnableObjectIndex(enable=True):
+    """Enables or disables an index of the document objects by layer, name,
+    color and group. While enabled, ObjectsByLayer, ObjectsByName,
+    ObjectsByColor and ObjectsByGroup take time proportional to the number of
+    objects they return instead of the number of objects in the document.
+    The index is built on first use and kept up to date from document events
+    Parameters:
+      enable[opt] = True to enable the index, False to disable and discard it
+    Returns:
+      previous object indexing state
+    """
+    global __object_index, __object_index_doc
+    rc = __object_index is not None
+    if enable==rc: return rc
+    __object_index_pending.clear()
+    __object_index_doc = None
+    if enable: __object_index = {}
+    else: __object_index = None
+    rhutil.watchdocument(__queueobjectindexupdate, enable)
+    return rc
+
+
+# Opt-in R-tree of the bounding boxes of the document objects, kept up to
+# date from document events in the same way as the object index
+__spatial_index = None
+__spatial_index_doc = None
+__spatial_index_pending = set()
+__morton_spread = [sum(((i>>bit)&1)<<(3*bit) for bit in range(8)) for i in range(256)]
+
+
+def __spatialindexable(rhobj):
+    object_type = rhobj.ObjectType
+    for excluded in (Rhino.DocObjects.ObjectType.Grip, Rhino.DocObjects.ObjectType.Light,
+                     Rhino.DocObjects.ObjectType.Phantom):
+        if object_type==excluded: return False
+    return True
+
+
+def __spatialindexadd(index, rhobj, box=None):
+    if box is None: box = rhobj.Geometry.GetBoundingBox(True)
+    if not box.IsValid: return
+    element = len(index["ids"])
+    index["ids"].append(rhobj.Id)
+    index["entries"][rhobj.Id] = (element, box, rhobj.RuntimeSerialNumber, rhobj.IsHidden)
+    index["tree"].Insert(box, element)
+
+
+def __spatialindexbuild(doc):
+    """Builds the R-tree for all objects in doc. RhinoCommon has no bulk load
+    for bounding boxes, so the boxes are inserted in Morton (Z-order) order of
+    their centers, which keeps neighbouring objects in the same tree nodes
+    """
+    index = {"tree": Rhino.Geometry.RTree(), "ids": [], "entries": {}}
+    settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+    settings.HiddenObjects = True
+    settings.DeletedObjects = False
+    settings.IncludeLights = False
+    settings.IncludeGrips = False
+    settings.IncludePhantoms = False
+    items = []
+    for rhobj in doc.Objects.GetObjectList(settings):
+        box = rhobj.Geometry.GetBoundingBox(True)
+        if box.IsValid: items.append((rhobj, box, box.Center))
+    if not items: return index
+    minimum = [min(c.X for r, b, c in items), min(c.Y for r, b, c in items), min(c.Z for r, b, c in items)]
+    maximum = [max(c.X for r, b, c in items), max(c.Y for r, b, c in items), max(c.Z for r, b, c in items)]
+    scale = [255.0/(b - a) if b>a else 0.0 for a, b in zip(minimum, maximum)]
+    spread = __morton_spread
+    def key(item):
+        c = item[2]
+        return (spread[int((c.X - minimum[0])*scale[0])] |
+                spread[int((c.Y - minimum[1])*scale[1])]<<1 |
+                spread[int((c.Z - minimum[2])*scale[2])]<<2)
+    items.sort(key=key)
+    for rhobj, box, center in items:
+        __spatialindexadd(index, rhobj, box)
+    return index
+
+
+def __queuespatialindexupdate(object_id):
+    global __spatial_index_doc
+    if object_id is None: __spatial_index_doc = None
+    else: __spatial_index_pending.add(object_id)
+
+
+def __currentspatialindex():
+    "Returns the up to date spatial index or None if it is disabled"
+    global __spatial_index, __spatial_index_doc
+    if __spatial_index is None: return None
+    doc = scriptcontext.doc
+    if __spatial_index_doc is not doc:
+        __spatial_index_pending.clear()
+        __spatial_index = __spatialindexbuild(doc)
+        __spatial_index_doc = doc
+    while __spatial_index_pending:
+        object_id = __spatial_index_pending.pop()
+        entry = __spatial_index["entries"].pop(object_id, None)
+        if entry:
+            __spatial_index["tree"].Remove(entry[1], entry[0])
+            __spatial_index["ids"][entry[0]] = None
+        rhobj = doc.Objects.Find(object_id)
+        if rhobj and not rhobj.IsDeleted and __spatialindexable(rhobj):
+            __spatialindexadd(__spatial_index, rhobj)
+    return __spatial_index
+
+
+def __spatialquery(region, test, include_hidden):
+    """Returns (serial number, object id, bounding box) for the objects whose
+    bounding box passes test. region is a BoundingBox or Sphere that contains
+    every passing box; it narrows the search when the spatial index is enabled
+    """
+    rc = []
+    index = __currentspatialindex()
+    if index is None:
+        settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+        settings.HiddenObjects = include_hidden
+        for rhobj in scriptcontext.doc.Objects.GetObjectList(settings):
+            box = rhobj.Geometry.GetBoundingBox(True)
+            if box.IsValid and test(box): rc.append((rhobj.RuntimeSerialNumber, rhobj.Id, box))
+        return rc
+    elements = []
+    def found(sender, e): elements.append(e.Id)
+    index["tree"].Search(region, found)
+    ids = index["ids"]
+    entries = index["entries"]
+    for element in elements:
+        id = ids[element]
+        if id is None: continue
+        element, box, serial, hidden = entries[id]
+        if hidden and not include_hidden: continue
+        if test(box): rc.append((serial, id, box))
+    return rc
+
+
+def EnableSpatialIndex(enable=True):
+    """Enables or disables an R-tree of the bounding boxes of the document
+    objects. While enabled, ObjectsInBox, ObjectsIntersectingBox and
+    ObjectsNearPoint only look at objects near the query region instead of
+    every object in the document. The R-tree is built on first use and kept
+    up to date from document events
+    Parameters:
+      enable[opt] = True to enable the index, False to disable and discard it
+    Returns:
+      previous spatial indexing state
+    """
+    global __spatial_index, __spatial_index_doc
+    rc = __spatial_index is not None
+    if enable==rc: return rc
+    __spatial_index_pending.clear()
+    __spatial_index_doc = None
+    if enable: __spatial_index = {}
+    else: __spatial_index = None
+    rhutil.watchdocument(__queuespatialindexupdate, enable)
+    return rc
 
 
 def ObjectsByColor(color, select=False, include_lights=False):
@@ -568,10 +867,23 @@ def ObjectsByColor(color, select=False, include_lights=False):
       list of identifiers
     """
     color = rhutil.coercecolor(color, True)
+    index = __currentobjectindex()
+    if index is not None:
+        argb = color.ToArgb()
+        tables = index["color"]
+        ids = set(tables.get(("object", argb), ()))
+        for layer in scriptcontext.doc.Layers:
+            if layer.Color.ToArgb()==argb: ids.update(tables.get(("layer", layer.LayerIndex), ()))
+        for id in tables.get(("other", None), ()):
+            rhobj = scriptcontext.doc.Objects.Find(id)
+            if rhobj and rhobj.Attributes.DrawColor(scriptcontext.doc).ToArgb()==argb: ids.add(id)
+        ids = __indexedobjectids(index, ids, lights=include_lights)
+        if select: __selectobjectids(ids)
+        return ids
     rhino_objects = scriptcontext.doc.Objects.FindByDrawColor(color, include_lights)
     if select:
         for obj in rhino_objects: obj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return [obj.Id for obj in rhino_objects]
 
 
@@ -585,11 +897,16 @@ def ObjectsByGroup(group_name, select=False):
     """
     group_index = scriptcontext.doc.Groups.Find(group_name, True)
     if group_index<0: raise ValueError("%s does not exist in GroupTable"%group_name)
+    index = __currentobjectindex()
+    if index is not None:
+        ids = __indexedobjectids(index, index["group"].get(group_index, ()))
+        if select: __selectobjectids(ids)
+        return ids
     rhino_objects = scriptcontext.doc.Objects.FindByGroup(group_index)
     if not rhino_objects: return []
     if select:
         for obj in rhino_objects: obj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return [obj.Id for obj in rhino_objects]
 
 
@@ -602,11 +919,16 @@ def ObjectsByLayer(layer_name, select=False):
       list of identifiers
     """
     layer = __getlayer(layer_name, True)
+    index = __currentobjectindex()
+    if index is not None:
+        ids = __indexedobjectids(index, index["layer"].get(layer.LayerIndex, ()))
+        if select: __selectobjectids(ids)
+        return ids
     rhino_objects = scriptcontext.doc.Objects.FindByLayer(layer)
     if not rhino_objects: return []
     if select:
         for rhobj in rhino_objects: rhobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return [rhobj.Id for rhobj in rhino_objects]
 
 
@@ -619,6 +941,13 @@ def ObjectsByName(name, select=False, include_lights=False):
     Returns:
       list of identifiers
     """
+    index = None
+    # the index only answers exact names, wildcard patterns need the object table
+    if name and not [c for c in "*?#[" if c in name]: index = __currentobjectindex()
+    if index is not None:
+        ids = __indexedobjectids(index, index["name"].get(name.lower(), ()), True, include_lights, True)
+        if select: __selectobjectids(ids)
+        return ids
     settings = Rhino.DocObjects.ObjectEnumeratorSettings()
     settings.HiddenObjects = True
     settings.DeletedObjects = False
@@ -631,10 +960,64 @@ def ObjectsByName(name, select=False, include_lights=False):
     if ids and select:
         objects = scriptcontext.doc.Objects.GetObjectList(settings)
         for rhobj in objects: rhobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return ids
    
 
+__object_type_values = (1, 2, 4, 8, 16, 32, 256, 512, 4096, 8192, 16384, 32768,
+                        65536, 131072, 134217728, 268435456, 536870912)
+__all_object_types = sum(__object_type_values)
+
+
+def __extrusionissurface(extrusion):
+    """True if extrusion converts to a single-face brep. That takes a single
+    uncapped profile without kinks, since ToBrep splits the faces at kinks
+    """
+    if extrusion.ProfileCount!=1 or extrusion.CapCount!=0: return False
+    profile = extrusion.Profile3d(0, 0.0)
+    if profile is None:
+        brep = extrusion.ToBrep(True)
+        return brep is not None and brep.Faces.Count==1
+    domain = profile.Domain
+    continuity = Rhino.Geometry.Continuity.G1_locus_continuous
+    rc, t = profile.GetNextDiscontinuity(continuity, domain.T0, domain.T1)
+    return not rc
+
+
+def __objectsbytype(geometry_filter, it=None):
+    """Enumerates the document once and yields (RhinoObject, object type) for
+    the objects matching geometry_filter. Breps and extrusions are reported
+    as ObjectType.Surface or ObjectType.Brep (polysurface) based on their own
+    geometry, without looking the object up again. Extrusions are only converted
+    to breps when their profile curve is not available.
+    The object type related fields of the optional enumerator settings it
+    are overwritten
+    """
+    if not geometry_filter: return
+    object_type_enum = Rhino.DocObjects.ObjectType
+    surface_filter = object_type_enum.Surface | object_type_enum.Brep
+    if it is None:
+        it = Rhino.DocObjects.ObjectEnumeratorSettings()
+        it.DeletedObjects = False
+        it.ActiveObjects = True
+        it.ReferenceObjects = True
+    it.IncludeLights = bool(geometry_filter & object_type_enum.Light)
+    it.IncludeGrips = bool(geometry_filter & object_type_enum.Grip)
+    it.IncludePhantoms = bool(geometry_filter & object_type_enum.Phantom)
+    if geometry_filter & surface_filter:
+        it.ObjectTypeFilter = geometry_filter | surface_filter | object_type_enum.Extrusion
+    else:
+        it.ObjectTypeFilter = geometry_filter
+    for rhobj in scriptcontext.doc.Objects.GetObjectList(it):
+        object_type = rhobj.ObjectType
+        if object_type==object_type_enum.Brep:
+            if rhobj.Geometry.Faces.Count==1: object_type = object_type_enum.Surface
+        elif object_type==object_type_enum.Extrusion:
+            if __extrusionissurface(rhobj.Geometry): object_type = object_type_enum.Surface
+            else: object_type = object_type_enum.Brep
+        if object_type & geometry_filter: yield rhobj, object_type
+
+
 def ObjectsByType(type, select=False):
     """Returns identifiers of all objects based on the objects' geometry type.
     Parameters:
@@ -664,49 +1047,95 @@ def ObjectsByType(type, select=False):
     Returns:
       A list of Guids identifying the objects.
     """
-    bSurface = False
-    bPolySurface = False
-    bLights = False
-    bGrips = False
-    bPhantoms = False
-    geometry_filter = __FilterHelper(type)
-    if geometry_filter & Rhino.DocObjects.ObjectType.Surface: bSurface = True
-    if geometry_filter & Rhino.DocObjects.ObjectType.Brep: bPolySurface = True
-    if geometry_filter & Rhino.DocObjects.ObjectType.Light: bLights = True
-    if geometry_filter & Rhino.DocObjects.ObjectType.Grip: bGrips = True
-    if geometry_filter & Rhino.DocObjects.ObjectType.Phantom: bPhantoms = True
-
-    it = Rhino.DocObjects.ObjectEnumeratorSettings()
-    it.DeletedObjects = False
-    it.ActiveObjects = True
-    it.ReferenceObjects = True
-    it.IncludeLights = bLights
-    it.IncludeGrips = bGrips
-    it.IncludePhantoms = bPhantoms
-
     object_ids = []
-    e = scriptcontext.doc.Objects.GetObjectList(it)
-    for object in e:
-        bFound = False
-        object_type = object.ObjectType
-        if object_type==Rhino.DocObjects.ObjectType.Brep and (bSurface or bPolySurface):
-            brep = rhutil.coercebrep(object.Id)
-            if brep:
-                if brep.Faces.Count==1:
-                    if bSurface: bFound = True
-                else:
-                    if bPolySurface: bFound = True
-        elif object_type & geometry_filter:
-            bFound = True
-
-        if bFound:
-            if select: object.Select(True)
-            object_ids.append(object.Id)
-
-    if object_ids and select: scriptcontext.doc.Views.Redraw()
+    for rhobj, object_type in __objectsbytype(__FilterHelper(type)):
+        if select: rhobj.Select(True)
+        object_ids.append(rhobj.Id)
+    if object_ids and select: rhutil.redraw()
     return object_ids
+
+
+def ObjectTypeCounts(type=None):
+    """Counts the objects in the document by geometry type in a single pass
+    Parameters:
+      type[opt] = the type(s) of geometry objects to count, see ObjectsByType.
+        If omitted, all types are counted
+    Returns:
+      dictionary mapping each requested type value to the number of objects
+      of that type. Surfaces (8) and polysurfaces (16) are counted separately
+    """
+    if type is None: type = __all_object_types
+    rc = {}
+    for bit in __object_type_values:
+        if type & bit: rc[bit] = 0
+    for rhobj, object_type in __objectsbytype(__FilterHelper(type)):
+        object_type = int(object_type)
+        if object_type in rc: rc[object_type] += 1
+        else:
+            for bit in rc:
+                if object_type & bit: rc[bit] += 1
+    return rc
   
 
+def ObjectsInBox(box, select=False, include_hidden=False):
+    """Returns identifiers of all objects whose bounding boxes are inside of
+    a bounding box
+    Parameters:
+      box = the bounding box, as eight corner points or a BoundingBox
+      select[opt] = select the objects
+      include_hidden[opt] = include hidden objects
+    Returns:
+      list of identifiers in document order
+    """
+    box = rhutil.coerceboundingbox(box, True)
+    found = __spatialquery(box, box.Contains, include_hidden)
+    found.sort()
+    ids = [id for serial, id, objbox in found]
+    if select: __selectobjectids(ids)
+    return ids
+
+
+def ObjectsIntersectingBox(box, select=False, include_hidden=False):
+    """Returns identifiers of all objects whose bounding boxes are inside of
+    or intersect a bounding box
+    Parameters:
+      box = the bounding box, as eight corner points or a BoundingBox
+      select[opt] = select the objects
+      include_hidden[opt] = include hidden objects
+    Returns:
+      list of identifiers in document order
+    """
+    box = rhutil.coerceboundingbox(box, True)
+    def intersects(objbox): return Rhino.Geometry.BoundingBox.Intersection(box, objbox).IsValid
+    found = __spatialquery(box, intersects, include_hidden)
+    found.sort()
+    ids = [id for serial, id, objbox in found]
+    if select: __selectobjectids(ids)
+    return ids
+
+
+def ObjectsNearPoint(point, radius, select=False, include_hidden=False):
+    """Returns identifiers of all objects whose bounding boxes are within a
+    distance of a point
+    Parameters:
+      point = the test point
+      radius = the maximum distance between the point and a bounding box
+      select[opt] = select the objects
+      include_hidden[opt] = include hidden objects
+    Returns:
+      list of identifiers, nearest bounding box first
+    """
+    point = rhutil.coerce3dpoint(point, True)
+    if radius<0: raise ValueError("radius must not be negative")
+    def distance(objbox): return objbox.ClosestPoint(point).DistanceTo(point)
+    sphere = Rhino.Geometry.Sphere(point, radius)
+    found = __spatialquery(sphere, lambda objbox: distance(objbox)<=radius, include_hidden)
+    found.sort(key=lambda item: (distance(item[2]), item[0]))
+    ids = [id for serial, id, objbox in found]
+    if select: __selectobjectids(ids)
+    return ids
+
+
 def SelectedObjects(include_lights=False, include_grips=False):
     """Returns the identifiers of all objects that are currently selected
     Parameters:
@@ -725,5 +1154,5 @@ def UnselectAllObjects():
       the number of objects that were unselected
     """
     rc = scriptcontext.doc.Objects.UnselectAll()
-    if rc>0: scriptcontext.doc.Views.Redraw()
+    if rc>0: rhutil.redraw()
     return rc
@@ -18,7 +18,7 @@ def AddBox(corners):
     if not brep: raise ValueError("unable to create brep from box")
     rc = scriptcontext.doc.Objects.AddBrep(brep)
     if rc==System.Guid.Empty: raise Exception("unable to add brep to document")
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -47,7 +47,7 @@ def AddCone(base, height, radius, cap=True):
     cone = Rhino.Geometry.Cone(plane, height, radius)
     brep = Rhino.Geometry.Brep.CreateFromCone(cone, cap)
     rc = scriptcontext.doc.Objects.AddBrep(brep)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -82,7 +82,7 @@ def AddCutPlane(object_ids, start_point, end_point, normal=None):
     if surface is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surface)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -119,7 +119,7 @@ def AddCylinder(base, height, radius, cap=True):
     brep = cylinder.ToBrep(cap, cap)
     id = scriptcontext.doc.Objects.AddBrep(brep)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -136,7 +136,7 @@ def AddEdgeSrf(curve_ids):
     if brep is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddBrep(brep)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -178,7 +178,7 @@ def AddNurbsSurface(point_count, points, knots_u, knots_v, degree, weights=None)
     if not ns.IsValid: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(ns)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -203,7 +203,7 @@ def AddPipe(curve_id, parameters, radii, blend_type=0, cap=0, fit=False):
     cap = System.Enum.ToObject(Rhino.Geometry.PipeCapMode, cap)
     breps = Rhino.Geometry.Brep.CreatePipe(rail, parameters, radii, blend_type==0, cap, fit, abs_tol, ang_tol)
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -220,7 +220,7 @@ def AddPlanarSrf(object_ids):
     curves = [rhutil.coercecurve(id,-1,True) for id in object_ids]
     breps = Rhino.Geometry.Brep.CreatePlanarBreps(curves)
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -241,7 +241,7 @@ def AddPlaneSurface(plane, u_dir, v_dir):
     if plane_surface is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(plane_surface)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -316,7 +316,7 @@ def AddLoftSrf(object_ids, start=None, end=None, loft_type=0, simplify_method=0,
     for brep in breps:
         id = scriptcontext.doc.Objects.AddBrep(brep)
         if id!=System.Guid.Empty: idlist.append(id)
-    if idlist: scriptcontext.doc.Views.Redraw()
+    if idlist: rhutil.redraw()
     return idlist
 
 
@@ -337,7 +337,7 @@ def AddRevSrf(curve_id, axis, start_angle=0.0, end_angle=360.0):
     srf = Rhino.Geometry.RevSurface.Create(curve, axis, start_angle, end_angle)
     if not srf: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(srf)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -358,7 +358,7 @@ def AddSphere(center_or_plane, radius):
     sphere = Rhino.Geometry.Sphere(center, radius)
     rc = scriptcontext.doc.Objects.AddSphere(sphere)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -393,7 +393,7 @@ def AddSrfContourCrvs(object_id, points_or_plane, interval=None):
     for crv in curves:
         id = scriptcontext.doc.Objects.AddCurve(crv)
         if id!=System.Guid.Empty: rc.append(id)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -412,7 +412,7 @@ def AddSrfControlPtGrid(count, points, degree=(3,3)):
     if not surf: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surf)
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return id
 
 
@@ -433,7 +433,7 @@ def AddSrfPt(points):
     if surface is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(surface)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -453,7 +453,7 @@ def AddSrfPtGrid(count, points, degree=(3,3), closed=(False,False)):
     if not surf: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surf)
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return id
 
 
@@ -474,7 +474,7 @@ def AddSweep1(rail, shapes, closed=False):
     breps = Rhino.Geometry.Brep.CreateFromSweep(rail, shapes, closed, tolerance)
     if not breps: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -496,7 +496,7 @@ def AddSweep2(rails, shapes, closed=False):
     breps = Rhino.Geometry.Brep.CreateFromSweep(rail1, rail2, shapes, closed, tolerance)
     if not breps: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -524,7 +524,7 @@ def AddTorus(base, major_radius, minor_radius, direction=None):
     torus = Rhino.Geometry.Torus(baseplane, major_radius, minor_radius)
     revsurf = torus.ToRevSurface()
     rc = scriptcontext.doc.Objects.AddSurface(revsurf)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -556,7 +556,7 @@ def BooleanDifference(input0, input1, delete_input=True):
     if delete_input:
         for id in input0: scriptcontext.doc.Objects.Delete(id, True)
         for id in input1: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -587,7 +587,7 @@ def BooleanIntersection(input0, input1, delete_input=True):
     if delete_input:
         for id in input0: scriptcontext.doc.Objects.Delete(id, True)
         for id in input1: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -611,7 +611,7 @@ def BooleanUnion(input, delete_input=True):
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in newbreps]
     if delete_input:
         for id in input: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -659,7 +659,7 @@ def CapPlanarHoles(surface_id):
             newbrep.Flip()
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id and scriptcontext.doc.Objects.Replace(surface_id, newbrep):
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
             return True
     return False
 
@@ -686,7 +686,7 @@ def DuplicateEdgeCurves(object_id, select=False):
             if rc==System.Guid.Empty: return None
             curves.append(rc)
             if select: rhobject.SelectObject(rc)
-    if curves: scriptcontext.doc.Views.Redraw()
+    if curves: rhutil.redraw()
     return curves
 
 
@@ -705,7 +705,7 @@ def DuplicateSurfaceBorder(surface_id):
     curves = Rhino.Geometry.Curve.JoinCurves(curves, tolerance)
     if curves is None: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddCurve(c) for c in curves]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -736,7 +736,7 @@ def ExtendSurface(surface_id, parameter, length, smooth=True):
     if newsrf:
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id: scriptcontext.doc.Objects.Replace(surface_id, newsrf)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return newsrf is not None
 
 
@@ -760,7 +760,7 @@ def ExplodePolysurfaces(object_ids, delete_input=False):
                 face_id = scriptcontext.doc.Objects.AddBrep(copyface)
                 if face_id!=System.Guid.Empty: ids.append(face_id)
             if delete_input: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return ids
 
 
@@ -797,7 +797,7 @@ def ExtractIsoCurve(surface_id, parameter, direction):
             for curve in curves:
                 id = scriptcontext.doc.Objects.AddCurve(curve)
                 if id!=System.Guid.Empty: ids.append(id)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return ids
 
 
@@ -824,7 +824,7 @@ def ExtractSurface(object_id, face_indices, copy=False):
         for index in face_indices: brep.Faces.RemoveAt(index)
         id = rhutil.coerceguid(object_id)
         scriptcontext.doc.Objects.Replace(id, brep)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -842,7 +842,7 @@ def ExtrudeCurve(curve_id, path_id):
     srf = Rhino.Geometry.SumSurface.Create(curve1, curve2)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -860,7 +860,7 @@ def ExtrudeCurvePoint(curve_id, point):
     srf = Rhino.Geometry.Surface.CreateExtrusionToPoint(curve, point)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -880,7 +880,7 @@ def ExtrudeCurveStraight(curve_id, start_point, end_point):
     srf = Rhino.Geometry.Surface.CreateExtrusion(curve, vec)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -911,7 +911,7 @@ def FilletSurfaces(surface0, surface1, radius, uvparam0=None, uvparam1=None):
     rc = []
     for surf in surfaces:
         rc.append( scriptcontext.doc.Objects.AddSurface(surf) )
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -934,7 +934,7 @@ def FlipSurface(surface_id, flip=None):
         brep.Flip()
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id: scriptcontext.doc.Objects.Replace(surface_id, brep)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return old_reverse
 
 
@@ -980,7 +980,7 @@ def IntersectBreps(brep1, brep2, tolerance=None):
         rc = scriptcontext.doc.Objects.AddPoint(point)
         if rc==System.Guid.Empty: return scriptcontext.errorhandler()
         ids.append(rc)
-    if ids: scriptcontext.doc.Views.Redraw()
+    if ids: rhutil.redraw()
     return ids
 
 
@@ -1237,7 +1237,7 @@ def JoinSurfaces(object_ids, delete_input=False):
         for id in object_ids:
             id = rhutil.coerceguid(id)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -1260,7 +1260,7 @@ def MakeSurfacePeriodic(surface_id, direction, delete_input=False):
         scriptcontext.doc.Objects.Replace(id, newsurf)
     else:
         id = scriptcontext.doc.Objects.AddSurface(newsurf)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -1285,7 +1285,7 @@ def OffsetSurface(surface_id, distance, tolerance=None):
     if newbrep is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddBrep(newbrep)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -1304,7 +1304,7 @@ def RebuildSurface(object_id, degree=(3,3), pointcount=(10,10)):
     if newsurf is None: return False
     object_id = rhutil.coerceguid(object_id)
     rc = scriptcontext.doc.Objects.Replace(object_id, newsurf)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: rhutil.redraw()
     return rc
 
 
@@ -1364,7 +1364,7 @@ def ShortPath(surface_id, start_point, end_point):
     if curve is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddCurve(curve)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return id
 
 
@@ -1389,18 +1389,35 @@ def ShrinkTrimmedSurface(object_id, create_copy=False):
         rc = scriptcontext.doc.Objects.AddBrep(brep, attr)
     else:
         rc = scriptcontext.doc.Objects.Replace(object_id, brep)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
 def __GetMassProperties(object_id, area):
-    surface = rhutil.coercebrep(object_id)
-    if surface is None:
-        surface = rhutil.coercesurface(object_id)
-        if surface is None: return None
-    if area==True: return Rhino.Geometry.AreaMassProperties.Compute(surface)
-    if not surface.IsSolid: return None
-    return Rhino.Geometry.VolumeMassProperties.Compute(surface)
+    """Returns (area or volume, error bound, centroid, centroid error bound,
+    moments) of a surface, where moments is the tuple described in
+    SurfaceAreaMoments. The mass properties object itself is disposed here,
+    so only these immutable results are ever shared from the measurement cache
+    """
+    def compute():
+        surface = rhutil.coercebrep(object_id)
+        if surface is None:
+            surface = rhutil.coercesurface(object_id)
+            if surface is None: return None
+        if area==True:
+            mp = Rhino.Geometry.AreaMassProperties.Compute(surface)
+            if mp is None: return None
+            size, error = mp.Area, mp.AreaError
+        else:
+            if not surface.IsSolid: return None
+            mp = Rhino.Geometry.VolumeMassProperties.Compute(surface)
+            if mp is None: return None
+            size, error = mp.Volume, mp.VolumeError
+        try:
+            return size, error, mp.Centroid, mp.CentroidError, __moments(mp)
+        finally:
+            mp.Dispose()
+    return rhutil.measurement(object_id, ("MassProperties", area==True), compute)
 
 
 def SplitBrep(brep_id, cutter_id, delete_input=False):
@@ -1421,7 +1438,7 @@ def SplitBrep(brep_id, cutter_id, delete_input=False):
         brep_id = rhutil.coerceguid(brep_id)
         scriptcontext.doc.Objects.Delete(brep_id, True)
     rc = [scriptcontext.doc.Objects.AddBrep(piece) for piece in pieces]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -1435,7 +1452,7 @@ def SurfaceArea(object_id):
       None on error
     """
     amp = __GetMassProperties(object_id, True)
-    if amp: return amp.Area, amp.AreaError
+    if amp: return amp[0], amp[1]
 
 
 def SurfaceAreaCentroid(object_id):
@@ -1448,12 +1465,10 @@ def SurfaceAreaCentroid(object_id):
     """
     amp = __GetMassProperties(object_id, True)
     if amp is None: return scriptcontext.errorhandler()
-    return amp.Centroid, amp.CentroidError
+    return amp[2], amp[3]
 
 
-def __AreaMomentsHelper(surface_id, area):
-    mp = __GetMassProperties(surface_id, area)
-    if mp is None: return scriptcontext.errorhandler()
+def __moments(mp):
     a = (mp.WorldCoordinatesFirstMoments.X, mp.WorldCoordinatesFirstMoments.Y, mp.WorldCoordinatesFirstMoments.Z)
     b = (mp.WorldCoordinatesFirstMomentsError.X, mp.WorldCoordinatesFirstMomentsError.Y, mp.WorldCoordinatesFirstMomentsError.Z)
     c = (mp.WorldCoordinatesSecondMoments.X, mp.WorldCoordinatesSecondMoments.Y, mp.WorldCoordinatesSecondMoments.Z)
@@ -1471,6 +1486,12 @@ def __AreaMomentsHelper(surface_id, area):
     return (a,b,c,d,e,f,g,h,i,j,k,l,m,n)
 
 
+def __AreaMomentsHelper(surface_id, area):
+    mp = __GetMassProperties(surface_id, area)
+    if mp is None: return scriptcontext.errorhandler()
+    return mp[4]
+
+
 def SurfaceAreaMoments(surface_id):
     """Calculates area moments of inertia of a surface or polysurface object.
     See the Rhino help for "Mass Properties calculation details"
@@ -1692,7 +1713,7 @@ def SurfaceIsocurveDensity(surface_id, density=None):
         if density<0: density = -1
         rhino_object.Attributes.WireDensity = density
         rhino_object.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     return rc
 
 
@@ -1835,7 +1856,7 @@ def SurfaceVolume(object_id):
       None on error
     """
     vmp = __GetMassProperties(object_id, False)
-    if vmp: return vmp.Volume, vmp.VolumeError
+    if vmp: return vmp[0], vmp[1]
 
 
 def SurfaceVolumeCentroid(object_id):
@@ -1847,7 +1868,7 @@ def SurfaceVolumeCentroid(object_id):
       None on error
     """
     vmp = __GetMassProperties(object_id, False)
-    if vmp: return vmp.Centroid, vmp.CentroidError
+    if vmp: return vmp[2], vmp[3]
 
 
 def SurfaceVolumeMoments(surface_id):
@@ -1911,7 +1932,7 @@ def TrimBrep(object_id, cutter, tolerance=None):
                 rc.append(scriptcontext.doc.Objects.AddBrep(breps[i], attr))
     else:
         rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -1938,7 +1959,7 @@ def TrimSurface( surface_id, direction, interval, delete_input=False):
     if new_surface:
         rc = scriptcontext.doc.Objects.AddSurface(new_surface)
         if delete_input: scriptcontext.doc.Objects.Delete(rhutil.coerceguid(surface_id), True)
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
         return rc
 
 
@@ -1975,6 +1996,6 @@ def UnrollSurface(surface_id, explode=False, following_geometry=None):
     for dot in dots:
         id = scriptcontext.doc.Objects.AddTextDot(dot)
         new_following.append(id)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     if following_geometry: return rc, new_following
     return rc
@@ -1,10 +1,12 @@
 import Rhino
 import System.Drawing.Color, System.Array, System.Guid
+import sys
 import time
 import System.Windows.Forms.Clipboard
 import scriptcontext
 import math
 import string
+import types
 
 
 def ContextIsRhino():
@@ -326,147 +328,627 @@ def frange(start, stop, step):
     return [x for x in fxrange(start, stop, step)]
 
 
-def coerce3dpoint(point, raise_on_error=False):
-    "Convert input into a Rhino.Geometry.Point3d if possible."
-    if type(point) is Rhino.Geometry.Point3d: return point
-    if hasattr(point, "__len__") and len(point)==3 and hasattr(point, "__getitem__"):
+__document_watchers = {}
+
+
+def watchdocument(callback, enable=True):
+    """Registers a function that is called whenever objects in a document
+    change. callback(object_id) is called after an object is added, deleted,
+    undeleted, replaced or has its attributes modified. callback(None) is
+    called when a document is closed or a new document is started
+    Parameters:
+      callback = function to call
+      enable[opt] = True to start watching the document, False to stop
+    Returns:
+      True if the callback was watching the document before this call
+    """
+    rc = callback in __document_watchers
+    if enable==rc: return rc
+    if not enable:
+        for event, handler in __document_watchers.pop(callback):
+            event -= handler
+        return rc
+    def on_object(sender, e): callback(e.ObjectId)
+    def on_attributes(sender, e): callback(e.RhinoObject.Id)
+    def on_document(sender, e): callback(None)
+    handlers = ((Rhino.RhinoDoc.AddRhinoObject, on_object),
+                (Rhino.RhinoDoc.DeleteRhinoObject, on_object),
+                (Rhino.RhinoDoc.UndeleteRhinoObject, on_object),
+                (Rhino.RhinoDoc.ReplaceRhinoObject, on_object),
+                (Rhino.RhinoDoc.ModifyObjectAttributes, on_attributes),
+                (Rhino.RhinoDoc.CloseDocument, on_document),
+                (Rhino.RhinoDoc.NewDocument, on_document))
+    for event, handler in handlers:
+        event += handler
+    __document_watchers[callback] = handlers
+    return rc
+
+
+# Opt-in cache of the document objects found by the coerce functions. Entries
+# are [RhinoObject, geometry] lists keyed by object id. They are dropped as
+# soon as the document reports a change to the object
+__object_cache = None
+__object_cache_doc = None
+
+
+def __invalidateobjectcache(object_id):
+    if __object_cache is None: return
+    if object_id is None: __object_cache.clear()
+    else: __object_cache.pop(object_id, None)
+
+
+def EnableObjectCache(enable=True):
+    """Enables or disables caching of the document objects that the coerce
+    functions look up by id. While enabled, repeated queries against the same
+    objects do not search the object table again. Cached objects are dropped
+    when they are modified, replaced or deleted
+    Parameters:
+      enable[opt] = True to enable the cache, False to disable and empty it
+    Returns:
+      previous object caching state
+    """
+    global __object_cache, __object_cache_doc
+    rc = __object_cache is not None
+    if enable==rc: return rc
+    if enable:
+        __object_cache = {}
+        __object_cache_doc = scriptcontext.doc
+    else:
+        __object_cache = None
+        __object_cache_doc = None
+    watchdocument(__invalidateobjectcache, enable)
+    return rc
+
+
+class objectcache(object):
+    """Enables the document object cache for a block of code
+        with rhinoscript.utility.objectcache():
+            for id in ids: ...
+    """
+    def __enter__(self):
+        self.previous = EnableObjectCache(True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        EnableObjectCache(self.previous)
+
+
+def __objectcacheentry(object_id):
+    global __object_cache_doc
+    if __object_cache_doc is not scriptcontext.doc:
+        __object_cache.clear()
+        __object_cache_doc = scriptcontext.doc
+    entry = __object_cache.get(object_id)
+    if entry is None:
+        rhobj = scriptcontext.doc.Objects.Find(object_id)
+        if rhobj is None: return None
+        entry = __object_cache[object_id] = [rhobj, None]
+    return entry
+
+
+def __findobject(object_id):
+    if __object_cache is None: return scriptcontext.doc.Objects.Find(object_id)
+    entry = __objectcacheentry(object_id)
+    if entry: return entry[0]
+
+
+def __findgeometry(object_id):
+    if __object_cache is None:
+        rhobj = scriptcontext.doc.Objects.Find(object_id)
+        if rhobj: return rhobj.Geometry
+        return None
+    entry = __objectcacheentry(object_id)
+    if entry is None: return None
+    if entry[1] is None: entry[1] = entry[0].Geometry
+    return entry[1]
+
+
+# Opt-in cache of measurements like lengths, areas and mass properties.
+# Entries are [runtime serial number, {key: value}] lists keyed by object id.
+# Replacing an object gives it a new runtime serial number, so an entry is
+# only used while the object it was computed for is still in the document
+__measurement_cache = None
+__measurement_sticky_key = "rhinoscript.measurements"
+__measurement_hits = 0
+__measurement_misses = 0
+
+
+def __invalidatemeasurements(object_id):
+    if __measurement_cache is None: return
+    if object_id is None: __measurement_cache.clear()
+    else: __measurement_cache.pop(object_id, None)
+
+
+def EnableMeasurementCache(enable=True, persistent=False):
+    """Enables or disables caching of curve and surface measurements, like
+    lengths, areas, centroids and mass properties. While enabled, measuring
+    an object that has not changed since it was last measured returns the
+    previous result. Results are dropped when the object is modified,
+    replaced or deleted
+    Parameters:
+      enable[opt] = True to enable the cache, False to disable it
+      persistent[opt] = keep the cached results in scriptcontext.sticky so
+        later scripts in the same Rhino session can reuse them
+    Returns:
+      previous measurement caching state
+    """
+    global __measurement_cache
+    rc = __measurement_cache is not None
+    if enable==rc: return rc
+    if enable:
+        if persistent:
+            __measurement_cache = scriptcontext.sticky.setdefault(__measurement_sticky_key, {})
+        else:
+            __measurement_cache = {}
+    else:
+        __measurement_cache = None
+    watchdocument(__invalidatemeasurements, enable)
+    return rc
+
+
+def MeasurementCacheStatistics(reset=False):
+    """Returns how well the measurement cache is working
+    Parameters:
+      reset[opt] = set the hit and miss counts back to zero
+    Returns:
+      tuple of (hits, misses, number of cached objects)
+    """
+    global __measurement_hits, __measurement_misses
+    rc = __measurement_hits, __measurement_misses, len(__measurement_cache or ())
+    if reset: __measurement_hits = __measurement_misses = 0
+    return rc
+
+
+def measurement(object_id, key, compute):
+    """Returns compute(), which measures the object identified by object_id.
+    When the measurement cache is enabled, the result is cached under key.
+    key must be hashable and describe everything besides the geometry that
+    the result depends on, like tolerances and sub-domains. Every caller
+    shares the cached result, so compute should return numbers, points or
+    tuples of them and never a mutable or disposable RhinoCommon object
+    """
+    global __measurement_hits, __measurement_misses
+    if __measurement_cache is None: return compute()
+    id = coerceguid(object_id)
+    rhobj = __findobject(id) if id else None
+    if rhobj is None: return compute()
+    try:
+        hash(key)
+    except TypeError:
+        return compute()
+    entry = __measurement_cache.get(id)
+    if entry is None or entry[0]!=rhobj.RuntimeSerialNumber:
+        entry = __measurement_cache[id] = [rhobj.RuntimeSerialNumber, {}]
+    elif key in entry[1]:
+        __measurement_hits += 1
+        return entry[1][key]
+    __measurement_misses += 1
+    rc = entry[1][key] = compute()
+    return rc
+
+
+# Redraws requested by rhinoscript functions while a batch is active are
+# deferred until the outermost batch ends
+__batch_depth = 0
+__batch_redraw = False
+
+
+def redraw(view=None):
+    """Redraws all views, or a single view. Inside a batch, the redraw is
+    postponed until the batch ends, when all views are redrawn once
+    Parameters:
+      view[opt] = RhinoView to redraw. If omitted, all views are redrawn
+    """
+    global __batch_redraw
+    if __batch_depth:
+        __batch_redraw = True
+        return
+    if view: view.Redraw()
+    else: scriptcontext.doc.Views.Redraw()
+
+
+def beginbatch():
+    """Starts suppressing the view redraws made by rhinoscript functions.
+    Batches can be nested. Every call must be matched by a call to endbatch
+    """
+    global __batch_depth
+    __batch_depth += 1
+
+
+def endbatch():
+    """Ends a batch started with beginbatch. When the outermost batch ends,
+    the views are redrawn once if any function requested a redraw
+    Returns:
+      True if the views were redrawn
+    """
+    global __batch_depth, __batch_redraw
+    if __batch_depth<1: raise Exception("endbatch called without a matching beginbatch")
+    __batch_depth -= 1
+    if __batch_depth or not __batch_redraw: return False
+    __batch_redraw = False
+    scriptcontext.doc.Views.Redraw()
+    return True
+
+
+class batch(object):
+    """Suppresses the view redraws made by rhinoscript functions and redraws
+    the views once at the end. Use as a context manager
+        with rhinoscript.utility.batch():
+            for point in points: rs.AddPoint(point)
+    or as a function decorator
+        @rhinoscript.utility.batch()
+        def build(points): ...
+    """
+    def __enter__(self):
+        beginbatch()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        endbatch()
+
+    def __call__(self, function):
+        def batched(*args, **kwargs):
+            beginbatch()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                endbatch()
+        batched.__name__ = function.__name__
+        batched.__doc__ = function.__doc__
+        return batched
+
+
+def parallelmap(function, items, parallel=True):
+    """Calls function for every item and returns the results in the order of
+    the items. The calls are spread over several threads, so function must
+    only read geometry. It must not look up or change document objects, or
+    call rhinoscript functions that do. If calls raise exceptions, the one
+    raised for the first item is raised again once all calls have finished
+    Parameters:
+      function = function taking a single item
+      items = list of items
+      parallel[opt] = False to make all calls on the calling thread
+    Returns:
+      list of the values returned by function
+    """
+    items = list(items)
+    count = len(items)
+    if not parallel or count<2: return [function(item) for item in items]
+    # imported here so importing the package does not load the Tasks assembly
+    import System.Threading.Tasks
+    results = [None]*count
+    errors = [None]*count
+    def body(i):
+        try:
+            results[i] = function(items[i])
+        except:
+            errors[i] = sys.exc_info()
+    System.Threading.Tasks.Parallel.For(0, count, body)
+    for error in errors:
+        if error: raise error[0], error[1], error[2]
+    return results
+
+
+# The coerce functions below are called by nearly every function in the
+# rhinoscript package. Instead of running a chain of type checks on every
+# call, each coerce function looks up a converter for the concrete type of
+# its input. The converter is resolved once per type and cached, so after
+# the first call for a given type a conversion costs one dictionary lookup.
+__converters = {}
+__resolvers = {}
+
+
+def __converter(kind, value):
+    t = type(value)
+    if t is types.InstanceType: t = value.__class__
+    table = __converters[kind]
+    converter = table.get(t)
+    if converter is None:
+        converter = __resolvers[kind](t)
+        table[t] = converter
+    return converter
+
+
+def __chain(steps, fail):
+    "combine converters that return None when they can not handle the value"
+    if not steps: return fail
+    def chained(value, *args):
+        for step in steps:
+            rc = step(value, *args)
+            if rc is not None: return rc
+        return fail(value, *args)
+    return chained
+
+
+def __identity(value, *args):
+    return value
+
+
+def registercoercer(kind, input_type, converter):
+    """Registers a converter used by one of the coerce functions for a given
+    input type. The converter is called with the same arguments as the coerce
+    function and returns the converted value, or None on failure
+    Parameters:
+      kind = name of the coerce function without the "coerce" prefix, for
+        example "3dpoint", "guid" or "curve"
+      input_type = the exact type of input handled by the converter
+      converter = function performing the conversion. If None, a previously
+        registered converter is removed
+    Returns:
+      the previously used converter for input_type if one was resolved
+      None if there was no converter for input_type
+    """
+    if kind not in __converters: raise ValueError("%s is not a coerce function" % kind)
+    table = __converters[kind]
+    rc = table.get(input_type)
+    if converter is None:
+        if input_type in table: del table[input_type]
+    else:
+        table[input_type] = converter
+    return rc
+
+
+def __sequenceto3dpoint(point, raise_on_error=False):
+    if len(point)==3:
         try:
             return Rhino.Geometry.Point3d(float(point[0]), float(point[1]), float(point[2]))
         except:
             if raise_on_error: raise
-    if type(point) is Rhino.Geometry.Vector3d or type(point) is Rhino.Geometry.Point3f or type(point) is Rhino.Geometry.Vector3f:
-        return Rhino.Geometry.Point3d(point.X, point.Y, point.Z)
-    if type(point) is str:
-        point = point.split(',')
-        return Rhino.Geometry.Point3d( float(point[0]), float(point[1]), float(point[2]) )
-    if type(point) is System.Guid:
-        rhobj = coercerhinoobject(point, raise_on_error)
-        if rhobj:
-            geom = rhobj.Geometry
-            if isinstance(geom, Rhino.Geometry.Point): return geom.Location
+
+
+def __xyzto3dpoint(point, raise_on_error=False):
+    return Rhino.Geometry.Point3d(point.X, point.Y, point.Z)
+
+
+def __stringto3dpoint(point, raise_on_error=False):
+    point = point.split(',')
+    return Rhino.Geometry.Point3d( float(point[0]), float(point[1]), float(point[2]) )
+
+
+def __guidto3dpoint(point, raise_on_error=False):
+    rhobj = coercerhinoobject(point, raise_on_error)
+    if rhobj:
+        geom = rhobj.Geometry
+        if isinstance(geom, Rhino.Geometry.Point): return geom.Location
+
+
+def __fail3dpoint(point, raise_on_error=False):
     if raise_on_error: raise ValueError("Could not convert %s to a Point3d" % point)
 
 
+def __resolve3dpoint(t):
+    if t is Rhino.Geometry.Point3d: return __identity
+    steps = []
+    if hasattr(t, "__len__") and hasattr(t, "__getitem__"):
+        steps.append(__sequenceto3dpoint)
+    if t is Rhino.Geometry.Vector3d or t is Rhino.Geometry.Point3f or t is Rhino.Geometry.Vector3f:
+        return __chain(steps + [__xyzto3dpoint], __fail3dpoint)
+    if t is str:
+        return __chain(steps + [__stringto3dpoint], __fail3dpoint)
+    if t is System.Guid: steps.append(__guidto3dpoint)
+    return __chain(steps, __fail3dpoint)
+
+
+def coerce3dpoint(point, raise_on_error=False):
+    "Convert input into a Rhino.Geometry.Point3d if possible."
+    return __converter("3dpoint", point)(point, raise_on_error)
+
+
+def __sequenceto2dpoint(point, raise_on_error=False):
+    if len(point)==2 and type(point[0]) is not list and type(point[0]) is not Rhino.Geometry.Point2d:
+        return Rhino.Geometry.Point2d(point[0], point[1])
+
+
+def __xyto2dpoint(point, raise_on_error=False):
+    return Rhino.Geometry.Point2d(point.X, point.Y)
+
+
+def __stringto2dpoint(point, raise_on_error=False):
+    point = point.split(',')
+    return Rhino.Geometry.Point2d( float(point[0]), float(point[1]) )
+
+
+def __fail2dpoint(point, raise_on_error=False):
+    if raise_on_error: raise ValueError("Could not convert %s to a Point2d" % point)
+
+
+def __resolve2dpoint(t):
+    if t is Rhino.Geometry.Point2d: return __identity
+    if t is list or t is tuple: return __chain([__sequenceto2dpoint], __fail2dpoint)
+    if t is Rhino.Geometry.Vector3d or t is Rhino.Geometry.Point3d: return __xyto2dpoint
+    if t is str: return __stringto2dpoint
+    return __fail2dpoint
+
+
 def coerce2dpoint(point, raise_on_error=False):
     "Convert input into a Rhino.Geometry.Point2d if possible."
-    if type(point) is Rhino.Geometry.Point2d: return point
-    if type(point) is list or type(point) is tuple:
-        length = len(point)
-        if length==2 and type(point[0]) is not list and type(point[0]) is not Rhino.Geometry.Point2d:
-            return Rhino.Geometry.Point2d(point[0], point[1])
-    if type(point) is Rhino.Geometry.Vector3d or type(point) is Rhino.Geometry.Point3d:
-        return Rhino.Geometry.Point2d(point.X, point.Y)
-    if type(point) is str:
-        point = point.split(',')
-        return Rhino.Geometry.Point2d( float(point[0]), float(point[1]) )
-    if raise_on_error: raise ValueError("Could not convert %s to a Point2d" % point)
+    return __converter("2dpoint", point)(point, raise_on_error)
 
 
-def coerce3dvector(vector, raise_on_error=False):
-    "Convert input into a Rhino.Geometry.Vector3d if possible."
-    if type(vector) is Rhino.Geometry.Vector3d: return vector
+def __pointto3dvector(vector, raise_on_error=False):
     point = coerce3dpoint(vector, False)
     if point: return Rhino.Geometry.Vector3d(point.X, point.Y, point.Z)
     if raise_on_error: raise ValueError("Could not convert %s to a Vector3d" % vector)
 
 
-def coerce3dpointlist(points, raise_on_error=False):
-    if isinstance(points, System.Array[Rhino.Geometry.Point3d]):
-        return list(points)
-    if isinstance(points, Rhino.Collections.Point3dList): return list(points)
-    if type(points) is list or type(points) is tuple:
-        count = len(points)
-        if count>10 and type(points[0]) is Rhino.Geometry.Point3d: return points
-        if count>0 and (coerce3dpoint(points[0]) is not None):
-            return [coerce3dpoint(points[i], raise_on_error) for i in xrange(count)]
-        elif count>2 and type(points[0]) is not list:
-            point_count = count/3
-            rc = []
-            for i in xrange(point_count):
-                pt = Rhino.Geometry.Point3d(points[i*3], points[i*3+1], points[i*3+2])
-                rc.append(pt)
-            return rc
+def __resolve3dvector(t):
+    if t is Rhino.Geometry.Vector3d: return __identity
+    return __pointto3dvector
+
+
+def coerce3dvector(vector, raise_on_error=False):
+    "Convert input into a Rhino.Geometry.Vector3d if possible."
+    return __converter("3dvector", vector)(vector, raise_on_error)
+
+
+def __pointarraytolist(points, raise_on_error=False):
+    return list(points)
+
+
+def __sequenceto3dpointlist(points, raise_on_error=False):
+    count = len(points)
+    if count>10 and type(points[0]) is Rhino.Geometry.Point3d: return points
+    if count>0 and (coerce3dpoint(points[0]) is not None):
+        return [coerce3dpoint(points[i], raise_on_error) for i in xrange(count)]
+    elif count>2 and type(points[0]) is not list:
+        point_count = count/3
+        rc = []
+        for i in xrange(point_count):
+            pt = Rhino.Geometry.Point3d(points[i*3], points[i*3+1], points[i*3+2])
+            rc.append(pt)
+        return rc
+
+
+def __fail3dpointlist(points, raise_on_error=False):
     if raise_on_error: raise ValueError("Could not convert %s to a list of points" % points)
 
 
-def coerce2dpointlist(points):
-    if points is None or isinstance(points, System.Array[Rhino.Geometry.Point2d]):
-        return points
-    if type(points) is list or type(points) is tuple:
-        count = len(points)
-        if count>0 and type(points[0]) is Rhino.Geometry.Point2d:
-            rc = System.Array.CreateInstance(Rhino.Geometry.Point2d, count)
-            for i in xrange(count): rc[i] = points[i]
-            return rc
-        elif count>1 and type(points[0]) is not list:
-            point_count = count/2
-            rc = System.Array.CreateInstance(Rhino.Geometry.Point2d,point_count)
-            for i in xrange(point_count):
-                rc[i] = Rhino.Geometry.Point2d(points[i*2], points[i*2+1])
-            return rc
-        elif count>0 and type(points[0]) is list:
-            point_count = count
-            rc = System.Array.CreateInstance(Rhino.Geometry.Point2d,point_count)
-            for i in xrange(point_count):
-                pt = points[i]
-                rc[i] = Rhino.Geometry.Point2d(pt[0],pt[1])
-            return rc
-        return None
+def __resolve3dpointlist(t):
+    if issubclass(t, System.Array[Rhino.Geometry.Point3d]) or issubclass(t, Rhino.Collections.Point3dList):
+        return __pointarraytolist
+    if t is list or t is tuple: return __chain([__sequenceto3dpointlist], __fail3dpointlist)
+    return __fail3dpointlist
+
+
+def coerce3dpointlist(points, raise_on_error=False):
+    return __converter("3dpointlist", points)(points, raise_on_error)
+
+
+def __sequenceto2dpointlist(points):
+    count = len(points)
+    if count>0 and type(points[0]) is Rhino.Geometry.Point2d:
+        rc = System.Array.CreateInstance(Rhino.Geometry.Point2d, count)
+        for i in xrange(count): rc[i] = points[i]
+        return rc
+    elif count>1 and type(points[0]) is not list:
+        point_count = count/2
+        rc = System.Array.CreateInstance(Rhino.Geometry.Point2d,point_count)
+        for i in xrange(point_count):
+            rc[i] = Rhino.Geometry.Point2d(points[i*2], points[i*2+1])
+        return rc
+    elif count>0 and type(points[0]) is list:
+        point_count = count
+        rc = System.Array.CreateInstance(Rhino.Geometry.Point2d,point_count)
+        for i in xrange(point_count):
+            pt = points[i]
+            rc[i] = Rhino.Geometry.Point2d(pt[0],pt[1])
+        return rc
     return None
 
 
+def __fail2dpointlist(points):
+    return None
+
+
+def __resolve2dpointlist(t):
+    if t is type(None) or issubclass(t, System.Array[Rhino.Geometry.Point2d]):
+        return __identity
+    if t is list or t is tuple: return __sequenceto2dpointlist
+    return __fail2dpointlist
+
+
+def coerce2dpointlist(points):
+    return __converter("2dpointlist", points)(points)
+
+
+def __sequencetoplane(plane, raise_on_bad_input=False):
+    length = len(plane)
+    if length==3 and type(plane[0]) is not list:
+        rc = Rhino.Geometry.Plane.WorldXY
+        rc.Origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
+        return rc
+    if length==9 and type(plane[0]) is not list:
+        origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
+        xpoint = Rhino.Geometry.Point3d(plane[3],plane[4],plane[5])
+        ypoint = Rhino.Geometry.Point3d(plane[6],plane[7],plane[8])
+        rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
+        return rc
+    if length==3 and (type(plane[0]) is list or type(plane[0]) is tuple):
+        origin = Rhino.Geometry.Point3d(plane[0][0],plane[0][1],plane[0][2])
+        xpoint = Rhino.Geometry.Point3d(plane[1][0],plane[1][1],plane[1][2])
+        ypoint = Rhino.Geometry.Point3d(plane[2][0],plane[2][1],plane[2][2])
+        rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
+        return rc
+
+
+def __failplane(plane, raise_on_bad_input=False):
+    if raise_on_bad_input: raise TypeError("%s can not be converted to a Plane"%plane)
+
+
+def __resolveplane(t):
+    if t is Rhino.Geometry.Plane: return __identity
+    if t is list or t is tuple: return __chain([__sequencetoplane], __failplane)
+    return __failplane
+
+
 def coerceplane(plane, raise_on_bad_input=False):
     "Convert input into a Rhino.Geometry.Plane if possible."
-    if type(plane) is Rhino.Geometry.Plane: return plane
-    if type(plane) is list or type(plane) is tuple:
-        length = len(plane)
-        if length==3 and type(plane[0]) is not list:
-            rc = Rhino.Geometry.Plane.WorldXY
-            rc.Origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
-            return rc
-        if length==9 and type(plane[0]) is not list:
-            origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
-            xpoint = Rhino.Geometry.Point3d(plane[3],plane[4],plane[5])
-            ypoint = Rhino.Geometry.Point3d(plane[6],plane[7],plane[8])
-            rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
-            return rc
-        if length==3 and (type(plane[0]) is list or type(plane[0]) is tuple):
-            origin = Rhino.Geometry.Point3d(plane[0][0],plane[0][1],plane[0][2])
-            xpoint = Rhino.Geometry.Point3d(plane[1][0],plane[1][1],plane[1][2])
-            ypoint = Rhino.Geometry.Point3d(plane[2][0],plane[2][1],plane[2][2])
-            rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
-            return rc
-    if raise_on_bad_input: raise TypeError("%s can not be converted to a Plane"%plane)
+    return __converter("plane", plane)(plane, raise_on_bad_input)
 
 
-def coercexform(xform, raise_on_bad_input=False):
-    "Convert input into a Rhino.Transform if possible."
-    t = type(xform)
-    if t is Rhino.Geometry.Transform: return xform
-    if( (t is list or t is tuple) and len(xform)==4 and len(xform[0])==4):
+def __sequencetoxform(xform, raise_on_bad_input=False):
+    if len(xform)==4 and len(xform[0])==4:
         xf = Rhino.Geometry.Transform()
         for i in range(4):
             for j in range(4):
                 xf[i,j] = xform[i][j]
         return xf
+
+
+def __failxform(xform, raise_on_bad_input=False):
     if raise_on_bad_input: raise TypeError("%s can not be converted to a Transform"%xform)
 
 
-def coerceguid(id, raise_exception=False):
-    if type(id) is System.Guid: return id
-    if type(id) is str and len(id)>30:
+def __resolvexform(t):
+    if t is Rhino.Geometry.Transform: return __identity
+    if t is list or t is tuple: return __chain([__sequencetoxform], __failxform)
+    return __failxform
+
+
+def coercexform(xform, raise_on_bad_input=False):
+    "Convert input into a Rhino.Transform if possible."
+    return __converter("xform", xform)(xform, raise_on_bad_input)
+
+
+def __stringtoguid(id, raise_exception=False):
+    if len(id)>30:
         try:
             id = System.Guid(id)
             return id
         except:
             pass
-    if (type(id) is list or type(id) is tuple) and len(id)==1:
-        return coerceguid(id[0], raise_exception)
-    if type(id) is Rhino.DocObjects.ObjRef: return id.ObjectId
-    if isinstance(id,Rhino.DocObjects.RhinoObject): return id.Id
+
+
+def __sequencetoguid(id, raise_exception=False):
+    if len(id)==1: return coerceguid(id[0], raise_exception)
     if raise_exception: raise TypeError("Parameter must be a Guid or string representing a Guid")
 
 
+def __objreftoguid(id, raise_exception=False):
+    return id.ObjectId
+
+
+def __rhinoobjecttoguid(id, raise_exception=False):
+    return id.Id
+
+
+def __failguid(id, raise_exception=False):
+    if raise_exception: raise TypeError("Parameter must be a Guid or string representing a Guid")
+
+
+def __resolveguid(t):
+    if t is System.Guid: return __identity
+    if t is str: return __chain([__stringtoguid], __failguid)
+    if t is list or t is tuple: return __sequencetoguid
+    if t is Rhino.DocObjects.ObjRef: return __objreftoguid
+    if issubclass(t, Rhino.DocObjects.RhinoObject): return __rhinoobjecttoguid
+    return __failguid
+
+
+def coerceguid(id, raise_exception=False):
+    return __converter("guid", id)(id, raise_exception)
+
+
 def coerceguidlist(ids):
     if ids is None: return None
     rc = []
@@ -478,26 +960,48 @@ def coerceguidlist(ids):
     if rc: return rc
 
 
-def coerceboundingbox(bbox, raise_on_bad_input=False):
-    if type(bbox) is Rhino.Geometry.BoundingBox: return bbox
+def __pointstoboundingbox(bbox, raise_on_bad_input=False):
     points = coerce3dpointlist(bbox)
     if points: return Rhino.Geometry.BoundingBox(points)
     if raise_on_bad_input: raise TypeError("%s can not be converted to a BoundingBox"%bbox)
 
 
-def coercecolor(c, raise_if_bad_input=False):
-    if type(c) is System.Drawing.Color: return c
-    if type(c) is list or type(c) is tuple:
-        if len(c)==3: return System.Drawing.Color.FromArgb(c[0], c[1], c[2])
-        elif len(c)==4: return System.Drawing.Color.FromArgb(c[0], c[1], c[2], c[3])
-    if type(c)==type(1): return System.Drawing.Color.FromArgb(c)
+def __resolveboundingbox(t):
+    if t is Rhino.Geometry.BoundingBox: return __identity
+    return __pointstoboundingbox
+
+
+def coerceboundingbox(bbox, raise_on_bad_input=False):
+    return __converter("boundingbox", bbox)(bbox, raise_on_bad_input)
+
+
+def __sequencetocolor(c, raise_if_bad_input=False):
+    if len(c)==3: return System.Drawing.Color.FromArgb(c[0], c[1], c[2])
+    elif len(c)==4: return System.Drawing.Color.FromArgb(c[0], c[1], c[2], c[3])
+
+
+def __inttocolor(c, raise_if_bad_input=False):
+    return System.Drawing.Color.FromArgb(c)
+
+
+def __failcolor(c, raise_if_bad_input=False):
     if raise_if_bad_input: raise TypeError("%s can not be converted to a Color"%c)
 
 
-def coerceline(line, raise_if_bad_input=False):
-    if type(line) is Rhino.Geometry.Line: return line
+def __resolvecolor(t):
+    if t is System.Drawing.Color: return __identity
+    if t is list or t is tuple: return __chain([__sequencetocolor], __failcolor)
+    if t is int: return __inttocolor
+    return __failcolor
+
+
+def coercecolor(c, raise_if_bad_input=False):
+    return __converter("color", c)(c, raise_if_bad_input)
+
+
+def __anytoline(line, raise_if_bad_input=False):
     guid = coerceguid(line, False)
-    if guid: line = scriptcontext.doc.Objects.Find(guid).Geometry
+    if guid: line = __findobject(guid).Geometry
     if isinstance(line, Rhino.Geometry.Curve) and line.IsLinear:
         return Rhino.Geometry.Line(line.PointAtStart, line.PointAtEnd)
     points = coerce3dpointlist(line, raise_if_bad_input)
@@ -505,73 +1009,164 @@ def coerceline(line, raise_if_bad_input=False):
     if raise_if_bad_input: raise TypeError("%s can not be converted to a Line"%line)
 
 
-def coercegeometry(id, raise_if_missing=False):
-    "attempt to get GeometryBase class from given input"
-    if isinstance(id, Rhino.Geometry.GeometryBase): return id
-    if type(id) is Rhino.DocObjects.ObjRef: return id.Geometry()
-    if isinstance(id, Rhino.DocObjects.RhinoObject): return id.Geometry
+def __resolveline(t):
+    if t is Rhino.Geometry.Line: return __identity
+    return __anytoline
+
+
+def coerceline(line, raise_if_bad_input=False):
+    return __converter("line", line)(line, raise_if_bad_input)
+
+
+def __objreftogeometry(id, raise_if_missing=False):
+    return id.Geometry()
+
+
+def __rhinoobjecttogeometry(id, raise_if_missing=False):
+    return id.Geometry
+
+
+def __guidtogeometry(id, raise_if_missing=False):
     id = coerceguid(id, raise_if_missing)
     if id:
-        rhobj = scriptcontext.doc.Objects.Find(id)
-        if rhobj: return rhobj.Geometry
+        geom = __findgeometry(id)
+        if geom: return geom
     if raise_if_missing: raise ValueError("unable to convert %s into geometry"%id)
 
 
-def coercebrep(id, raise_if_missing=False):
-    "attempt to get polysurface geometry from the document with a given id"
+def __resolvegeometry(t):
+    if issubclass(t, Rhino.Geometry.GeometryBase): return __identity
+    if t is Rhino.DocObjects.ObjRef: return __objreftogeometry
+    if issubclass(t, Rhino.DocObjects.RhinoObject): return __rhinoobjecttogeometry
+    return __guidtogeometry
+
+
+def coercegeometry(id, raise_if_missing=False):
+    "attempt to get GeometryBase class from given input"
+    return __converter("geometry", id)(id, raise_if_missing)
+
+
+def __extrusiontobrep(id, raise_if_missing=False):
+    return id.ToBrep(True)
+
+
+def __anytobrep(id, raise_if_missing=False):
     geom = coercegeometry(id, False)
     if isinstance(geom, Rhino.Geometry.Brep): return geom
     if isinstance(geom, Rhino.Geometry.Extrusion): return geom.ToBrep(True)
     if raise_if_missing: raise ValueError("unable to convert %s into Brep geometry"%id)
 
 
-def coercecurve(id, segment_index=-1, raise_if_missing=False):
-    "attempt to get curve geometry from the document with a given id"
-    if isinstance(id, Rhino.Geometry.Curve): return id
-    if type(id) is Rhino.DocObjects.ObjRef: return id.Curve()
+def __resolvebrep(t):
+    if issubclass(t, Rhino.Geometry.Brep): return __identity
+    if issubclass(t, Rhino.Geometry.Extrusion): return __extrusiontobrep
+    return __anytobrep
+
+
+def coercebrep(id, raise_if_missing=False):
+    "attempt to get polysurface geometry from the document with a given id"
+    return __converter("brep", id)(id, raise_if_missing)
+
+
+def __objreftocurve(id, segment_index=-1, raise_if_missing=False):
+    return id.Curve()
+
+
+def __guidtocurve(id, segment_index=-1, raise_if_missing=False):
     id = coerceguid(id, True)
-    crvObj = scriptcontext.doc.Objects.Find(id)
-    if crvObj:
-        curve = crvObj.Geometry
-        if curve and segment_index>=0 and type(curve) is Rhino.Geometry.PolyCurve:
-            curve = curve.SegmentCurve(segment_index)
-        if isinstance(curve, Rhino.Geometry.Curve): return curve
+    curve = __findgeometry(id)
+    if curve and segment_index>=0 and type(curve) is Rhino.Geometry.PolyCurve:
+        curve = curve.SegmentCurve(segment_index)
+    if isinstance(curve, Rhino.Geometry.Curve): return curve
     if raise_if_missing: raise ValueError("unable to convert %s into Curve geometry"%id)
 
 
-def coercesurface(object_id, raise_if_missing=False):
-    "attempt to get surface geometry from the document with a given id"
-    if isinstance(object_id, Rhino.Geometry.Surface): return object_id
-    if type(object_id) is Rhino.DocObjects.ObjRef: return object_id.Face()
+def __resolvecurve(t):
+    if issubclass(t, Rhino.Geometry.Curve): return __identity
+    if t is Rhino.DocObjects.ObjRef: return __objreftocurve
+    return __guidtocurve
+
+
+def coercecurve(id, segment_index=-1, raise_if_missing=False):
+    "attempt to get curve geometry from the document with a given id"
+    return __converter("curve", id)(id, segment_index, raise_if_missing)
+
+
+def __objreftosurface(object_id, raise_if_missing=False):
+    return object_id.Face()
+
+
+def __guidtosurface(object_id, raise_if_missing=False):
     object_id = coerceguid(object_id, True)
-    srfObj = scriptcontext.doc.Objects.Find(object_id)
-    if srfObj:
-        srf = srfObj.Geometry
-        if isinstance(srf, Rhino.Geometry.Surface): return srf
-        #single face breps are considered surfaces in the context of scripts
-        if isinstance(srf, Rhino.Geometry.Brep) and srf.Faces.Count==1:
-            return srf.Faces[0]
+    srf = __findgeometry(object_id)
+    if isinstance(srf, Rhino.Geometry.Surface): return srf
+    #single face breps are considered surfaces in the context of scripts
+    if isinstance(srf, Rhino.Geometry.Brep) and srf.Faces.Count==1:
+        return srf.Faces[0]
     if raise_if_missing: raise ValueError("unable to convert %s into Surface geometry"%object_id)
 
 
-def coercemesh(object_id, raise_if_missing=False):
-    "attempt to get mesh geometry from the document with a given id"
-    if type(object_id) is Rhino.DocObjects.ObjRef: return object_id.Mesh()
-    if isinstance(object_id, Rhino.Geometry.Mesh): return object_id
+def __resolvesurface(t):
+    if issubclass(t, Rhino.Geometry.Surface): return __identity
+    if t is Rhino.DocObjects.ObjRef: return __objreftosurface
+    return __guidtosurface
+
+
+def coercesurface(object_id, raise_if_missing=False):
+    "attempt to get surface geometry from the document with a given id"
+    return __converter("surface", object_id)(object_id, raise_if_missing)
+
+
+def __objreftomesh(object_id, raise_if_missing=False):
+    return object_id.Mesh()
+
+
+def __guidtomesh(object_id, raise_if_missing=False):
     object_id = coerceguid(object_id, raise_if_missing)
-    if object_id: 
-        meshObj = scriptcontext.doc.Objects.Find(object_id)
-        if meshObj:
-            mesh = meshObj.Geometry
-            if isinstance(mesh, Rhino.Geometry.Mesh): return mesh
+    if object_id:
+        mesh = __findgeometry(object_id)
+        if isinstance(mesh, Rhino.Geometry.Mesh): return mesh
     if raise_if_missing: raise ValueError("unable to convert %s into Mesh geometry"%object_id)
 
 
-def coercerhinoobject(object_id, raise_if_bad_input=False, raise_if_missing=False):
-    "attempt to get RhinoObject from the document with a given id"
-    if isinstance(object_id, Rhino.DocObjects.RhinoObject): return object_id
+def __resolvemesh(t):
+    if t is Rhino.DocObjects.ObjRef: return __objreftomesh
+    if issubclass(t, Rhino.Geometry.Mesh): return __identity
+    return __guidtomesh
+
+
+def coercemesh(object_id, raise_if_missing=False):
+    "attempt to get mesh geometry from the document with a given id"
+    return __converter("mesh", object_id)(object_id, raise_if_missing)
+
+
+def __guidtorhinoobject(object_id, raise_if_bad_input=False, raise_if_missing=False):
     object_id = coerceguid(object_id, raise_if_bad_input)
     if object_id is None: return None
-    rc = scriptcontext.doc.Objects.Find(object_id)
+    rc = __findobject(object_id)
     if not rc and raise_if_missing: raise ValueError("%s does not exist in ObjectTable" % object_id)
     return rc
+
+
+def __resolverhinoobject(t):
+    if issubclass(t, Rhino.DocObjects.RhinoObject): return __identity
+    return __guidtorhinoobject
+
+
+def coercerhinoobject(object_id, raise_if_bad_input=False, raise_if_missing=False):
+    "attempt to get RhinoObject from the document with a given id"
+    return __converter("rhinoobject", object_id)(object_id, raise_if_bad_input, raise_if_missing)
+
+
+for __kind, __resolver in (("3dpoint", __resolve3dpoint), ("2dpoint", __resolve2dpoint),
+                           ("3dvector", __resolve3dvector), ("3dpointlist", __resolve3dpointlist),
+                           ("2dpointlist", __resolve2dpointlist), ("plane", __resolveplane),
+                           ("xform", __resolvexform), ("guid", __resolveguid),
+                           ("boundingbox", __resolveboundingbox), ("color", __resolvecolor),
+                           ("line", __resolveline), ("geometry", __resolvegeometry),
+                           ("brep", __resolvebrep), ("curve", __resolvecurve),
+                           ("surface", __resolvesurface), ("mesh", __resolvemesh),
+                           ("rhinoobject", __resolverhinoobject)):
+    __converters[__kind] = {}
+    __resolvers[__kind] = __resolver
+del __kind, __resolver
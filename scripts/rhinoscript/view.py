@@ -43,7 +43,7 @@ def AddDetail(layout_id, corner1, corner2, title=None, projection=1):
     projection = System.Enum.ToObject(Rhino.Display.DefinedViewportProjection, projection)
     detail = layout.AddDetailView(title, corner1, corner2, projection)
     if not detail: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return detail.Id
 
 
@@ -124,7 +124,7 @@ def CurrentDetail(layout, detail=None, return_name=True):
         else:
             if id: page.SetActiveDetail(id)
             else: page.SetActiveDetail(detail, False)
-    scriptcontext.doc.Views.Redraw()
+    rhutil.redraw()
     return rc
 
 
@@ -215,7 +215,7 @@ def DetailScale(detail_id, model_length=None, page_length=None):
         page_units = scriptcontext.doc.PageUnitSystem
         if detail.DetailGeometry.SetScale(model_length, model_units, page_length, page_units):
             detail.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            rhutil.redraw()
     return rc
 
 
@@ -426,7 +426,7 @@ def RestoreNamedCPlane(cplane_name, view=None):
     if index<0: return scriptcontext.errorhandler()
     cplane = scriptcontext.doc.NamedConstructionPlanes[index]
     view.MainViewport.PushConstructionPlane(cplane)
-    view.Redraw()
+    rhutil.redraw(view)
     return cplane_name
 
 
@@ -446,7 +446,7 @@ def RestoreNamedView(named_view, view=None, restore_bitmap=False):
     if index<0: return scriptcontext.errorhandler()
     viewinfo = scriptcontext.doc.NamedViews[index]
     if view.MainViewport.PushViewInfo(viewinfo, restore_bitmap):
-        view.Redraw()
+        rhutil.redraw(view)
         return view.MainViewport.Name
     return scriptcontext.errorhandler()
 
@@ -489,7 +489,7 @@ def RotateCamera(view=None, direction=0, angle=None):
     target = viewport.CameraLocation + target_distance*camDir
     viewport.SetCameraLocations(target, viewport.CameraLocation)
     viewport.CameraUp = camUp
-    view.Redraw()
+    rhutil.redraw(view)
     return True
 
 
@@ -517,7 +517,7 @@ def RotateView(view=None, direction=0, angle=None):
     elif direction==2: viewport.KeyboardRotate(False, -angle)
     elif direction==3: viewport.KeyboardRotate(False, angle)
     else: return False
-    view.Redraw()
+    rhutil.redraw(view)
     return True
 
 
@@ -535,7 +535,7 @@ def ShowGrid(view=None, show=None):
     rc = viewport.ConstructionGridVisible
     if show is not None and rc!=show:
         viewport.ConstructionGridVisible = show
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -555,7 +555,7 @@ def ShowGridAxes(view=None, show=None):
     rc = viewport.ConstructionAxesVisible
     if show is not None and rc!=show:
         viewport.ConstructionAxesVisible = show
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -584,7 +584,7 @@ def ShowWorldAxes(view=None, show=None):
     rc = viewport.WorldAxesVisible
     if show is not None and rc!=show:
         viewport.WorldAxesVisible = show
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -611,7 +611,7 @@ def TiltView(view=None, direction=0, angle=None):
     if direction==0: viewport.Rotate(angle, axis, viewport.CameraLocation)
     elif direction==1: viewport.Rotate(-angle, axis, viewport.CameraLocation)
     else: return False
-    view.Redraw()
+    rhutil.redraw(view)
     return True
 
 
@@ -632,7 +632,7 @@ def ViewCamera(view=None, camera_location=None):
     camera_location = rhutil.coerce3dpoint(camera_location)
     if camera_location is None: return scriptcontext.errorhandler()
     view.ActiveViewport.SetCameraLocation(camera_location, True)
-    view.Redraw()
+    rhutil.redraw(view)
     return rc
 
 
@@ -651,7 +651,7 @@ def ViewCameraLens(view=None, length=None):
     rc = view.ActiveViewport.Camera35mmLensLength
     if not length: return rc
     view.ActiveViewport.Camera35mmLensLength = length
-    view.Redraw()
+    rhutil.redraw(view)
     return rc
 
 
@@ -691,7 +691,7 @@ def ViewCameraTarget(view=None, camera=None, target=None):
     if camera and target: view.ActiveViewport.SetCameraLocations(target, camera)
     elif camera is None: view.ActiveViewport.SetCameraTarget(target, True)
     else: view.ActiveViewport.SetCameraLocation(camera, True)
-    view.Redraw()
+    rhutil.redraw(view)
     return rc
 
 
@@ -708,7 +708,7 @@ def ViewCameraUp(view=None, up_vector=None):
     rc = view.ActiveViewport.CameraUp
     if up_vector:
         view.ActiveViewport.CameraUp = rhutil.coerce3dvector(up_vector, True)
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -726,7 +726,7 @@ def ViewCPlane(view=None, plane=None):
     if plane:
         plane = rhutil.coerceplane(plane, True)
         view.ActiveViewport.SetConstructionPlane(plane)
-        view.Redraw()
+        rhutil.redraw(view)
     return cplane
 
 
@@ -782,7 +782,7 @@ def ViewProjection(view=None, mode=None):
     if mode==1: viewport.ChangeToParallelProjection(True)
     elif mode==2: viewport.ChangeToPerspectiveProjection(True, 50)
     else: return None
-    view.Redraw()
+    rhutil.redraw(view)
     return rc
 
 def ViewRadius(view=None, radius=None):
@@ -806,7 +806,7 @@ def ViewRadius(view=None, radius=None):
     magnification_factor = radius / old_radius
     d = 1.0 / magnification_factor
     viewport.Magnify(d)
-    view.Redraw()
+    rhutil.redraw(view)
     return old_radius
 
 
@@ -840,7 +840,7 @@ def ViewTarget(view=None, target=None):
     target = rhutil.coerce3dpoint(target)
     if target is None: return scriptcontext.errorhandler()
     viewport.SetCameraTarget(target, True)
-    view.Redraw()
+    rhutil.redraw(view)
     return old_target
 
 
@@ -874,7 +874,7 @@ def Wallpaper(view=None, filename=None):
     rc = view.ActiveViewport.WallpaperFilename
     if filename is not None and filename!=rc:
         view.ActiveViewport.SetWallpaper(filename, False)
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -894,7 +894,7 @@ def WallpaperGrayScale(view=None, grayscale=None):
     if grayscale is not None and grayscale!=rc:
         filename = view.ActiveViewport.WallpaperFilename
         view.ActiveViewport.SetWallpaper(filename, grayscale)
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -914,7 +914,7 @@ def WallpaperHidden(view=None, hidden=None):
         filename = view.ActiveViewport.WallpaperFilename
         gray = view.ActiveViewport.WallpaperGrayscale
         view.ActiveViewport.SetWallpaper(filename, gray, not hidden)
-        view.Redraw()
+        rhutil.redraw(view)
     return rc
 
 
@@ -931,11 +931,11 @@ def ZoomBoundingBox(bounding_box, view=None, all=False):
       if all:
           views = scriptcontext.doc.Views.GetViewList(True, True)
           for view in views: view.ActiveViewport.ZoomBoundingBox(bbox)
-          scriptcontext.doc.Views.Redraw()
+          rhutil.redraw()
       else:
           view = __viewhelper(view)
           view.ActiveViewport.ZoomBoundingBox(bbox)
-          view.Redraw()
+          rhutil.redraw(view)
 
 
 def ZoomExtents(view=None, all=False):
@@ -947,11 +947,11 @@ def ZoomExtents(view=None, all=False):
     if all:
         views = scriptcontext.doc.Views.GetViewList(True, True)
         for view in views: view.ActiveViewport.ZoomExtents()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     else:
         view = __viewhelper(view)
         view.ActiveViewport.ZoomExtents()
-        view.Redraw()
+        rhutil.redraw(view)
 
 
 def ZoomSelected(view=None, all=False):
@@ -963,8 +963,8 @@ def ZoomSelected(view=None, all=False):
     if all:
         views = scriptcontext.doc.Views.GetViewList(True, True)
         for view in views: view.ActiveViewport.ZoomExtentsSelected()
-        scriptcontext.doc.Views.Redraw()
+        rhutil.redraw()
     else:
         view = __viewhelper(view)
         view.ActiveViewport.ZoomExtentsSelected()
-        view.Redraw()
+        rhutil.redraw(view)